@@ -0,0 +1,84 @@
+"""
+Benchmark: historial de feedbacks con y sin caché de skills
+
+Siembra un usuario con sesiones terminadas y su feedback en un mongod local y
+mide GetFeedbacksByUser (GET /assement/feedbacks/{user_id}) leyendo los skills
+directamente de Mongo y a través de CachedSkillRepository.
+
+Uso:
+    MONGODB_URL=mongodb://localhost:27017 PYTHONPATH=src python scripts/bench_feedback_history.py --sessions 50 --iterations 20
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from beanie import init_beanie
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from application.use_cases.get_feedbacks_by_user import GetFeedbacksByUser
+from domain.entities.assement_feedback import AssementFeedback
+from domain.entities.skill import Skill
+from domain.entities.user_session import UserSession
+from domain.repositories.assement_feedback_repository import AssementFeedBackRepository
+from domain.repositories.skill_repository import SkillRepository
+from domain.repositories.user_session_repository import UserSessionRepository
+from infrastructure.repositories.cached_skill_repository import CachedSkillRepository
+from infrastructure.repositories.skill_cache import SkillCache
+
+USER_ID = "bench_history_user"
+DATABASE = "skill_assement_history_bench"
+
+
+async def seed(sessions: int, skills: int):
+    skill_ids = []
+    for i in range(skills):
+        skill = await Skill(name=f"Bench skill {i}").insert()
+        skill_ids.append(str(skill.id))
+    for i in range(sessions):
+        session = await UserSession(
+            user_id=USER_ID, skill_id=skill_ids[i % skills], total_questions=15, is_finished=True, status="completed"
+        ).insert()
+        await AssementFeedback(
+            user_id=USER_ID, session_id=str(session.id), assement_result=50, industry_avarage=50, points_earned=5,
+            results=[], relevant_skills=[], recommended_tools=[], questions_analysis=[]
+        ).insert()
+
+
+async def measure(skill_repository: SkillRepository, sessions: int, iterations: int) -> float:
+    use_case = GetFeedbacksByUser(UserSessionRepository(), AssementFeedBackRepository(), skill_repository)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        result = await use_case.execute(USER_ID, 0, sessions)
+        assert len(result["feedbacks"]) == sessions
+    return (time.perf_counter() - start) / iterations
+
+
+async def run(sessions: int, skills: int, iterations: int):
+    client = AsyncIOMotorClient(os.getenv("MONGODB_URL", "mongodb://localhost:27017"))
+    await init_beanie(database=client[DATABASE], document_models=[Skill, UserSession, AssementFeedback])
+    try:
+        await seed(sessions, skills)
+        cache = SkillCache(enabled=True, max_entries=1024, ttl_seconds=300)
+
+        without_cache = await measure(SkillRepository(), sessions, iterations)
+        with_cache = await measure(CachedSkillRepository(cache), sessions, iterations)
+
+        stats = cache.stats()
+        print(f"📊 Historial de {sessions} feedbacks ({skills} skills, {iterations} iteraciones)")
+        print(f"   Sin caché : {without_cache * 1000:.1f} ms por petición, {sessions} lecturas de skill")
+        print(f"   Con caché : {with_cache * 1000:.1f} ms por petición, hit rate {stats['hit_rate']:.1%} "
+              f"({stats['misses']} lecturas de skill en total)")
+    finally:
+        await client.drop_database(DATABASE)
+        client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--skills", type=int, default=5)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.sessions, args.skills, args.iterations))
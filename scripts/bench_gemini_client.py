@@ -0,0 +1,67 @@
+"""
+Benchmark: cliente Gemini por petición vs. servicio compartido
+
+Compara el camino antiguo de POST /assement/{skill_id} (un genai.Client nuevo por
+petición, health check con generate_content("Test connection") y la generación
+envuelta en asyncio.to_thread) con el GeminiService compartido (cliente asíncrono,
+conexiones HTTP reutilizadas y health check sin generación).
+
+Uso:
+    PYTHONPATH=src python scripts/bench_gemini_client.py --iterations 3 --skill Python
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from google import genai
+
+PROMPT = "Generate 15 multiple choice questions about {skill} as a JSON object with a 'questions' array."
+
+
+async def legacy_assessment(skill: str, api_key: str, model: str) -> int:
+    """Reproduce el flujo antiguo y devuelve el número de llamadas de generación"""
+    client = genai.Client(api_key=api_key)
+    await asyncio.to_thread(client.models.generate_content, model=model, contents="Test connection")
+    await asyncio.to_thread(client.models.generate_content, model=model, contents=PROMPT.format(skill=skill))
+    return 2
+
+
+async def shared_assessment(service, skill: str) -> int:
+    before = service.generation_calls
+    await service._generate(PROMPT.format(skill=skill))
+    return service.generation_calls - before
+
+
+async def run(iterations: int, skill: str):
+    from infrastructure.external_services.gemini_service import gemini_service
+
+    api_key = os.getenv("GEMINI_API_KEY")
+    model = os.getenv("GEMINI_MODEL")
+
+    legacy_times, legacy_calls = [], 0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        legacy_calls += await legacy_assessment(skill, api_key, model)
+        legacy_times.append(time.perf_counter() - start)
+
+    await gemini_service.connect()
+    shared_times, shared_calls = [], 0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        shared_calls += await shared_assessment(gemini_service, skill)
+        shared_times.append(time.perf_counter() - start)
+    await gemini_service.disconnect()
+
+    print(f"📊 Resultados ({iterations} evaluaciones, skill '{skill}')")
+    print(f"   Por petición : {sum(legacy_times) / iterations:.2f}s media, {legacy_calls / iterations:.1f} llamadas de generación")
+    print(f"   Compartido   : {sum(shared_times) / iterations:.2f}s media, {shared_calls / iterations:.1f} llamadas de generación")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument("--skill", default="Python")
+    args = parser.parse_args()
+    asyncio.run(run(args.iterations, args.skill))
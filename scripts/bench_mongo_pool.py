@@ -0,0 +1,102 @@
+"""
+Benchmark: cliente Motor por defecto vs. pool, compresión y lecturas en secundarios
+
+Siembra un historial de feedbacks en un replica set local y lanza peticiones
+concurrentes del historial (GetFeedbacksByUser) con dos configuraciones:
+el AsyncIOMotorClient con los valores por defecto del driver leyendo del
+primario, y el cliente configurado por AppConfig (pool precalentado,
+compresión y history_read_preference).
+
+Uso:
+    MONGODB_URL="mongodb://localhost:27017,localhost:27018,localhost:27019/?replicaSet=rs0" \\
+        PYTHONPATH=src python scripts/bench_mongo_pool.py --concurrency 50 --seconds 10
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from datetime import datetime, timezone
+
+from beanie import init_beanie
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from application.use_cases.get_feedbacks_by_user import GetFeedbacksByUser
+from domain.entities.assement_feedback import AssementFeedback
+from domain.entities.skill import Skill
+from domain.entities.user_session import UserSession
+from domain.repositories.assement_feedback_repository import AssementFeedBackRepository
+from domain.repositories.skill_repository import SkillRepository
+from domain.repositories.user_session_repository import UserSessionRepository
+from infrastructure.config.app_config import config
+from infrastructure.database.mongo_connection import client_options, history_read_preference
+
+DATABASE = "skill_assement_pool_bench"
+MODELS = [Skill, UserSession, AssementFeedback]
+USERS = 20
+
+
+async def seed(sessions_per_user: int):
+    skill = await Skill(name="Pool bench skill").insert()
+    for user in range(USERS):
+        for _ in range(sessions_per_user):
+            session = await UserSession(
+                user_id=f"user_{user}", skill_id=str(skill.id), total_questions=15, is_finished=True,
+                status="completed", finished_at=datetime.now(timezone.utc)
+            ).insert()
+            await AssementFeedback(
+                user_id=f"user_{user}", session_id=str(session.id), assement_result=50, industry_avarage=50,
+                points_earned=5, results=[], relevant_skills=[], recommended_tools=[], questions_analysis=[]
+            ).insert()
+
+
+async def load(read_preference, concurrency: int, seconds: float):
+    use_case = GetFeedbacksByUser(
+        UserSessionRepository(read_preference), AssementFeedBackRepository(read_preference), SkillRepository()
+    )
+    latencies = []
+    deadline = time.perf_counter() + seconds
+
+    async def worker(index: int):
+        request = 0
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            await use_case.execute(f"user_{(index + request) % USERS}", 0, 10)
+            latencies.append(time.perf_counter() - start)
+            request += 1
+
+    await asyncio.gather(*[worker(i) for i in range(concurrency)])
+    latencies.sort()
+    return len(latencies) / seconds, latencies[int(len(latencies) * 0.95)] if latencies else 0
+
+
+async def run(concurrency: int, seconds: float, sessions_per_user: int):
+    url = os.getenv("MONGODB_URL", "mongodb://localhost:27017/?replicaSet=rs0")
+
+    default_client = AsyncIOMotorClient(url)
+    await init_beanie(database=default_client[DATABASE], document_models=MODELS, skip_indexes=True)
+    await seed(sessions_per_user)
+    # Dar tiempo a que los secundarios repliquen la siembra
+    await asyncio.sleep(2)
+    default_throughput, default_p95 = await load(None, concurrency, seconds)
+    default_client.close()
+
+    tuned_client = AsyncIOMotorClient(url, **client_options())
+    await init_beanie(database=tuned_client[DATABASE], document_models=MODELS, skip_indexes=True)
+    await asyncio.gather(*[tuned_client.admin.command("ping") for _ in range(config.mongodb_min_pool_size)])
+    tuned_throughput, tuned_p95 = await load(history_read_preference(), concurrency, seconds)
+    await tuned_client.drop_database(DATABASE)
+    tuned_client.close()
+
+    print(f"📊 Historial de feedbacks, {concurrency} peticiones concurrentes durante {seconds:.0f}s")
+    print(f"   Por defecto (primario)   : {default_throughput:7.1f} req/s, p95 {default_p95 * 1000:.1f} ms")
+    print(f"   Configurado ({config.mongodb_history_read_preference}): {tuned_throughput:7.1f} req/s, p95 {tuned_p95 * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--sessions-per-user", type=int, default=30)
+    args = parser.parse_args()
+    asyncio.run(run(args.concurrency, args.seconds, args.sessions_per_user))
@@ -0,0 +1,127 @@
+"""
+Micro-benchmark: puntuación de una sesión con bancos grandes
+
+Compara las dos funciones de puntuación que tenía EvaluateSkillAssessment
+(copiadas abajo tal cual, O(Q×A)) con domain.services.assessment_scoring,
+que indexa las respuestas por número de pregunta y puntúa en una sola pasada.
+No necesita MongoDB.
+
+La versión anterior de calculate_percentage_by_category comparaba
+answer.id_question con question.id, así que nunca acertaba y recorría todas
+las respuestas por cada pregunta; el script lo comprueba.
+
+Uso:
+    PYTHONPATH=src python scripts/bench_scoring.py --questions 200 --iterations 200
+"""
+
+import argparse
+import random
+import timeit
+
+from beanie import PydanticObjectId
+from pydantic import BaseModel
+
+from domain.entities.assement_feedback import AssementResult, QuestionAnalysis
+from domain.entities.user_session import AnswerSessionModel
+from domain.services.assessment_scoring import score_assessment
+
+
+class BenchQuestion(BaseModel):
+    """Los campos de Question que usa la puntuación (Question necesita init_beanie)."""
+    id: PydanticObjectId
+    question_number: int
+    question: str
+    subcategory: str
+    correct_answer: str
+
+
+def legacy_percentage_by_category(questions: list, answers: list) -> list:
+    category_data = {}
+    for question in questions:
+        category = question.subcategory
+        if category not in category_data:
+            category_data[category] = {"correct": 0, "total": 0}
+    for question in questions:
+        category = question.subcategory
+        category_data[category]["total"] += 1
+        for answer in answers:
+            if answer.id_question == question.id:
+                if answer.answer == question.correct_answer:
+                    category_data[category]["correct"] += 1
+                break
+    return [
+        AssementResult(subcategory=category, percentage=(data["correct"] / data["total"]) * 100 if data["total"] > 0 else 0)
+        for category, data in category_data.items()
+    ]
+
+
+def legacy_question_with_good_or_bad_answers(questions: list, answers: list) -> tuple:
+    question_analysis = []
+    good_answers = 0
+    bad_answers = 0
+    for question in questions:
+        question_analysis.append(QuestionAnalysis(
+            question_number=question.question_number, question=question.question, subcategory=question.subcategory,
+            correct_answer=question.correct_answer, user_answers=[]
+        ))
+    questions_map = {question.question_number: question for question in questions}
+    for answer in answers:
+        if answer.id_question in questions_map:
+            for item in question_analysis:
+                if item.question_number == answer.id_question:
+                    is_correct = answer.answer == item.correct_answer
+                    item.user_answers.append({"answer": answer.answer, "is_correct": is_correct})
+                    if is_correct:
+                        good_answers += 1
+                    else:
+                        bad_answers += 1
+                    break
+    return question_analysis, good_answers, bad_answers
+
+
+def build_session(size: int, rng: random.Random) -> tuple:
+    questions = [
+        BenchQuestion(
+            id=PydanticObjectId(), question_number=number, subcategory=f"sub {number % 8}",
+            question=f"Question {number}", correct_answer="a"
+        )
+        for number in range(1, size + 1)
+    ]
+    answers = [AnswerSessionModel(id_question=number, answer=rng.choice("abcd")) for number in range(1, size + 1)]
+    rng.shuffle(answers)
+    return questions, answers
+
+
+def run(size: int, iterations: int):
+    questions, answers = build_session(size, random.Random(42))
+
+    legacy_scores = legacy_percentage_by_category(questions, answers)
+    legacy_analysis, legacy_good, legacy_bad = legacy_question_with_good_or_bad_answers(questions, answers)
+    score = score_assessment(questions, answers)
+    assert all(result.percentage == 0 for result in legacy_scores), "La versión anterior debía puntuar 0"
+    assert (score.good_answers, score.bad_answers) == (legacy_good, legacy_bad)
+    assert [len(item.user_answers) for item in score.questions_analysis] == [len(item.user_answers) for item in legacy_analysis]
+    given = {answer.id_question: answer.answer for answer in answers}
+    for result in score.category_scores:
+        in_category = [q for q in questions if q.subcategory == result.subcategory]
+        correct = sum(1 for q in in_category if given[q.question_number] == q.correct_answer)
+        assert result.percentage == correct / len(in_category) * 100, result.subcategory
+
+    legacy = timeit.timeit(
+        lambda: (legacy_percentage_by_category(questions, answers), legacy_question_with_good_or_bad_answers(questions, answers)),
+        number=iterations
+    ) / iterations
+    current = timeit.timeit(lambda: score_assessment(questions, answers), number=iterations) / iterations
+
+    print(f"📊 Puntuación de una sesión de {size} preguntas ({iterations} iteraciones)")
+    print(f"   Anterior (O(Q×A)) : {legacy * 1000:8.3f} ms")
+    print(f"   Una pasada        : {current * 1000:8.3f} ms")
+    print(f"   Mejora            : {legacy / current:8.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--questions", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    run(args.questions, args.iterations)
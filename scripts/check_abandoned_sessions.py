@@ -0,0 +1,119 @@
+"""
+Prueba de las sesiones abandonadas al descartar un banco parcial, contra un mongod local
+
+Abre una sesión mientras el banco de una skill se genera en streaming, corta el
+stream antes de quiz_question_count preguntas (el banco se descarta y la sesión
+queda 'abandoned') y regenera el banco completo. Verifica que la sesión no se
+puede evaluar, que no se guarda feedback ni se publica el evento de puntos y
+que no aparece en el historial ni en su recuento.
+
+Uso:
+    MONGODB_URL=mongodb://localhost:27017 PYTHONPATH=src python scripts/check_abandoned_sessions.py
+"""
+
+import asyncio
+import os
+import sys
+
+from beanie import init_beanie
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from application.use_cases.evaluate_skill_assement_use_case import EvaluateSkillAssessment
+from application.use_cases.generate_question_bank_use_case import GenerateQuestionBankUseCase
+from domain.entities.assement_feedback import AssementFeedback, FeedbackQuestionsAnalysis
+from domain.entities.generation_lease import GenerationLease
+from domain.entities.question import Question
+from domain.entities.skill import Skill
+from domain.entities.user_session import AnswerSessionModel, UserSession
+from domain.repositories.assement_feedback_repository import AssementFeedBackRepository
+from domain.repositories.generation_lease_repository import GenerationLeaseRepository
+from domain.repositories.question_repository import QuestionRepository
+from domain.repositories.skill_repository import SkillRepository
+from domain.repositories.user_session_repository import UserSessionRepository
+from infrastructure.config.app_config import config
+
+DATABASE = "skill_assement_abandoned_check"
+USER_ID = "abandoned_check_user"
+
+
+class StreamingGeminiService:
+    """Sustituye a GeminiService: emite ``stream_size`` preguntas y corta el stream si no llega al banco."""
+
+    def __init__(self, stream_size: int):
+        self.stream_size = stream_size
+
+    async def generate_quiz_stream(self, skill: str, question_count: int):
+        for number in range(1, self.stream_size + 1):
+            yield {"subcategory": "sub", "type": "multiple choice", "question": f"{skill} v{self.stream_size} q{number}",
+                   "options": ["a", "b"], "correct_answer": "a"}
+        if self.stream_size < question_count:
+            raise ConnectionError("stream cut")
+
+
+class RecordingProducer:
+    def __init__(self):
+        self.messages = []
+
+    async def publish_message(self, message, queue_name, routing_key=None, priority=0):
+        self.messages.append(message)
+
+
+def generate_use_case(gemini: StreamingGeminiService) -> GenerateQuestionBankUseCase:
+    return GenerateQuestionBankUseCase(
+        QuestionRepository(), gemini, SkillRepository(), GenerationLeaseRepository(), UserSessionRepository()
+    )
+
+
+async def check_abandoned_sessions() -> int:
+    config.quiz_streaming_enabled = True
+    client = AsyncIOMotorClient(os.getenv("MONGODB_URL", "mongodb://localhost:27017"))
+    await init_beanie(database=client[DATABASE], document_models=[
+        Skill, Question, UserSession, GenerationLease, AssementFeedback, FeedbackQuestionsAnalysis
+    ], skip_indexes=True)
+    try:
+        skill = await Skill(name="Abandoned check skill").insert()
+        skill_id = str(skill.id)
+        # Sesión abierta sobre las primeras preguntas mientras el banco llegaba en streaming
+        session = await UserSession(
+            user_id=USER_ID, skill_id=skill_id, total_questions=config.quiz_question_count,
+            question_numbers=list(range(1, config.quiz_question_count + 1)),
+            answers=[AnswerSessionModel(id_question=1, answer="a"), AnswerSessionModel(id_question=2, answer="b")],
+            actual_number_of_questions=2
+        ).insert()
+
+        assert await generate_use_case(StreamingGeminiService(3)).execute(skill) is None
+        abandoned = await UserSession.get(session.id)
+        assert abandoned.is_finished and abandoned.status == "abandoned", f"Estado: {abandoned.status}"
+        assert await generate_use_case(StreamingGeminiService(config.question_bank_size)).execute(skill)
+
+        producer = RecordingProducer()
+        evaluate = EvaluateSkillAssessment(
+            UserSessionRepository(), QuestionRepository(), AssementFeedBackRepository(), producer
+        )
+        try:
+            await evaluate.execute(str(session.id))
+            raise AssertionError("La sesión abandonada se evaluó contra el banco regenerado")
+        except AssertionError:
+            raise
+        except Exception as e:
+            print(f"   Evaluación rechazada: {e}")
+        assert await AssementFeedback.find(AssementFeedback.session_id == str(session.id)).count() == 0
+        assert not producer.messages, "Se publicó un evento de puntos"
+
+        repository = UserSessionRepository()
+        assert await repository.get_session_finished_by_user_id_count(USER_ID) == 0
+        assert not await repository.get_session_finished_by_user_id(USER_ID, 0, 10)
+        page, total = await repository.get_finished_sessions_with_feedback(USER_ID, 0, 10)
+        assert total == 0 and not page, "La sesión abandonada aparece en el historial"
+        print("✅ Sesión abandonada: sin evaluación, sin feedback, sin puntos y fuera del historial")
+        return 0
+    except AssertionError as e:
+        print(f"❌ {e}")
+        return 1
+    finally:
+        await client.drop_database(DATABASE)
+        client.close()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(check_abandoned_sessions()))
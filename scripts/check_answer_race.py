@@ -0,0 +1,78 @@
+"""
+Prueba de concurrencia de record_answer contra un mongod local
+
+Envía respuestas concurrentes a la misma sesión y verifica que ninguna se
+pierde, que una pregunta solo se registra una vez y que la sesión se cierra
+exactamente al llegar a total_questions.
+
+Uso:
+    MONGODB_URL=mongodb://localhost:27017 PYTHONPATH=src python scripts/check_answer_race.py
+"""
+
+import asyncio
+import os
+
+from beanie import init_beanie
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from domain.entities.user_session import UserSession
+from domain.repositories.user_session_repository import UserSessionRepository
+
+USER_ID = "race_check_user"
+TOTAL_QUESTIONS = 15
+
+
+async def new_session(repository: UserSessionRepository) -> str:
+    session = await repository.create_user_session(UserSession(
+        user_id=USER_ID,
+        skill_id="race_check_skill",
+        total_questions=TOTAL_QUESTIONS,
+        question_numbers=list(range(1, TOTAL_QUESTIONS + 1))
+    ))
+    return str(session.id)
+
+
+async def check_answer_race():
+    client = AsyncIOMotorClient(os.getenv("MONGODB_URL", "mongodb://localhost:27017"))
+    await init_beanie(database=client["skill_assement_race_check"], document_models=[UserSession])
+    repository = UserSessionRepository()
+
+    try:
+        # 20 envíos concurrentes de la misma pregunta: solo uno se registra
+        session_id = await new_session(repository)
+        results = await asyncio.gather(*[
+            repository.record_answer(session_id, USER_ID, 1, f"answer {i}") for i in range(20)
+        ])
+        recorded = [result for result in results if result is not None]
+        assert len(recorded) == 1, f"Se esperaba un registro, hubo {len(recorded)}"
+        session = await repository.get_user_session_by_id(session_id)
+        assert len(session.answers) == 1 and session.actual_number_of_questions == 1
+        print("✅ Respuesta duplicada concurrente registrada una sola vez")
+
+        # Todas las preguntas a la vez (más intentos sobrantes): ninguna se pierde
+        session_id = await new_session(repository)
+        attempts = [
+            repository.record_answer(session_id, USER_ID, number, "A")
+            for number in range(1, TOTAL_QUESTIONS + 1) for _ in range(3)
+        ]
+        attempts.append(repository.record_answer(session_id, "another_user", 2, "A"))
+        attempts.append(repository.record_answer(session_id, USER_ID, TOTAL_QUESTIONS + 1, "A"))
+        results = await asyncio.gather(*attempts)
+        assert sum(result is not None for result in results) == TOTAL_QUESTIONS
+        session = await repository.get_user_session_by_id(session_id)
+        assert sorted(answer.id_question for answer in session.answers) == list(range(1, TOTAL_QUESTIONS + 1))
+        assert session.actual_number_of_questions == TOTAL_QUESTIONS
+        assert session.is_finished and session.status == "completed" and session.finished_at
+        assert sum(bool(result and result.is_finished) for result in results) == 1
+        print("✅ Respuestas concurrentes sin pérdidas y sesión cerrada una vez")
+
+        # Una sesión terminada no acepta más respuestas
+        assert await repository.record_answer(session_id, USER_ID, 1, "B") is None
+        print("✅ Sesión terminada rechaza respuestas")
+    finally:
+        await client.drop_database("skill_assement_race_check")
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(check_answer_race())
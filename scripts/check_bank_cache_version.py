@@ -0,0 +1,89 @@
+"""
+Prueba de la versión del banco de preguntas en la caché por worker, contra un mongod local
+
+Simula dos workers con su propia QuestionBankCache. El worker B cachea un banco
+parcial; el worker A lo descarta y lo regenera con el mismo skill_id. Verifica
+que B deja de servir las preguntas del banco descartado en cuanto cambia
+Skill.question_bank_version, y que sin cambios de versión sigue sirviendo desde caché.
+
+Uso:
+    MONGODB_URL=mongodb://localhost:27017 PYTHONPATH=src python scripts/check_bank_cache_version.py
+"""
+
+import asyncio
+import os
+import sys
+
+from beanie import init_beanie
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from application.use_cases.generate_question_bank_use_case import GenerateQuestionBankUseCase
+from domain.entities.generation_lease import GenerationLease
+from domain.entities.question import Question
+from domain.entities.skill import Skill
+from domain.entities.user_session import UserSession
+from domain.repositories.generation_lease_repository import GenerationLeaseRepository
+from domain.repositories.question_repository import QuestionRepository
+from domain.repositories.user_session_repository import UserSessionRepository
+from infrastructure.config.app_config import config
+from infrastructure.repositories.cached_question_repository import CachedQuestionRepository
+from infrastructure.repositories.cached_skill_repository import CachedSkillRepository
+from infrastructure.repositories.question_bank_cache import QuestionBankCache
+
+DATABASE = "skill_assement_bank_version_check"
+
+
+class BankGeminiService:
+    """Sustituye a GeminiService: devuelve un banco completo con preguntas marcadas como regeneradas."""
+
+    async def generate_question_bank(self, skill: str, question_count: int):
+        return {"questions": [
+            {"subcategory": "sub", "type": "multiple choice", "question": f"regenerated q{number}",
+             "options": ["a", "b"], "correct_answer": "a"}
+            for number in range(1, question_count + 1)
+        ]}
+
+
+async def check_bank_cache_version() -> int:
+    config.quiz_streaming_enabled = False
+    client = AsyncIOMotorClient(os.getenv("MONGODB_URL", "mongodb://localhost:27017"))
+    await init_beanie(database=client[DATABASE], document_models=[Skill, Question, UserSession, GenerationLease],
+                      skip_indexes=True)
+    try:
+        skill = await Skill(name="Bank version check skill").insert()
+        skill_id = str(skill.id)
+        # Banco parcial, como el que deja un streaming cortado
+        await QuestionRepository().create_questions_bulk([
+            {"question_number": number, "skillid": skill_id, "subcategory": "sub", "type": "multiple choice",
+             "question": f"partial q{number}", "options": ["a", "b"], "correct_answer": "b"}
+            for number in range(1, 4)
+        ])
+
+        worker_b = CachedQuestionRepository(QuestionBankCache(max_banks=8))
+        assert (await worker_b.find_question_by_skillid_and_number(skill_id, 1)).question == "partial q1"
+        await worker_b.find_question_by_skillid_and_number(skill_id, 2)
+        assert worker_b.bank_cache.hits == 1, "La segunda lectura no salió de la caché"
+
+        worker_a = GenerateQuestionBankUseCase(
+            CachedQuestionRepository(QuestionBankCache(max_banks=8)), BankGeminiService(), CachedSkillRepository(),
+            GenerationLeaseRepository(), UserSessionRepository()
+        )
+        assert await worker_a.execute(skill), "No se regeneró el banco"
+        assert (await Skill.get(skill.id)).question_bank_version == 1
+
+        for number in range(1, 4):
+            question = await worker_b.find_question_by_skillid_and_number(skill_id, number)
+            assert question.question == f"regenerated q{number}", f"B sirvió la pregunta descartada: {question.question}"
+        assert worker_b.bank_cache.stale == 1
+        print(f"✅ El worker B recargó el banco regenerado: {worker_b.bank_cache.stats()}")
+        return 0
+    except AssertionError as e:
+        print(f"❌ {e}")
+        return 1
+    finally:
+        await client.drop_database(DATABASE)
+        client.close()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(check_bank_cache_version()))
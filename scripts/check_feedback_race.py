@@ -0,0 +1,100 @@
+"""
+Prueba de concurrencia de la creación de feedback contra un mongod local
+
+Lanza 50 evaluaciones en paralelo de la misma sesión terminada (lo que hacen 50
+GET /assement/feedback/{session_id} simultáneos) y verifica que se guarda un
+único feedback con un único análisis, que el evento de puntos se publica una
+sola vez y que todas las respuestas devuelven el mismo feedback.
+
+El productor registra los mensajes en memoria en lugar de enviarlos a RabbitMQ:
+lo que se comprueba es cuántas veces se publica.
+
+Uso:
+    MONGODB_URL=mongodb://localhost:27017 PYTHONPATH=src python scripts/check_feedback_race.py --requests 50
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+from beanie import init_beanie
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from application.use_cases.evaluate_skill_assement_use_case import EvaluateSkillAssessment
+from domain.entities.assement_feedback import AssementFeedback, FeedbackQuestionsAnalysis
+from domain.entities.question import Question
+from domain.entities.skill import Skill
+from domain.entities.user_session import AnswerSessionModel, UserSession
+from domain.repositories.assement_feedback_repository import AssementFeedBackRepository
+from domain.repositories.question_repository import QuestionRepository
+from domain.repositories.user_session_repository import UserSessionRepository
+from infrastructure.database.indexes import ensure_indexes
+
+DATABASE = "skill_assement_feedback_race_check"
+TOTAL_QUESTIONS = 15
+
+
+class RecordingProducer:
+    def __init__(self):
+        self.messages = []
+
+    async def publish_message(self, message, queue_name, routing_key=None, priority=0):
+        self.messages.append(message)
+
+
+async def seed() -> str:
+    skill = await Skill(name="Feedback race skill").insert()
+    skill_id = str(skill.id)
+    for number in range(1, TOTAL_QUESTIONS + 1):
+        await Question(
+            question_number=number, skillid=skill_id, subcategory=f"sub {number % 3}", type="multiple choice",
+            question=f"Question {number}", options=["a", "b", "c", "d"], correct_answer="a"
+        ).insert()
+    session = await UserSession(
+        user_id="race_check_user", skill_id=skill_id, total_questions=TOTAL_QUESTIONS,
+        question_numbers=list(range(1, TOTAL_QUESTIONS + 1)),
+        answers=[AnswerSessionModel(id_question=n, answer="a") for n in range(1, TOTAL_QUESTIONS + 1)],
+        actual_number_of_questions=TOTAL_QUESTIONS, is_finished=True, status="completed"
+    ).insert()
+    return str(session.id)
+
+
+async def check_feedback_race(requests: int) -> int:
+    client = AsyncIOMotorClient(os.getenv("MONGODB_URL", "mongodb://localhost:27017"))
+    await init_beanie(database=client[DATABASE], document_models=[
+        Skill, Question, UserSession, AssementFeedback, FeedbackQuestionsAnalysis
+    ], skip_indexes=True)
+    try:
+        result = await ensure_indexes()
+        assert not result["failed"], f"Índices no creados: {result['failed']}"
+        session_id = await seed()
+
+        producer = RecordingProducer()
+        use_case = EvaluateSkillAssessment(
+            UserSessionRepository(), QuestionRepository(), AssementFeedBackRepository(), producer
+        )
+        responses = await asyncio.gather(*[use_case.execute(session_id) for _ in range(requests)])
+
+        feedbacks = await AssementFeedback.find(AssementFeedback.session_id == session_id).count()
+        analyses = await FeedbackQuestionsAnalysis.find(FeedbackQuestionsAnalysis.session_id == session_id).count()
+        assert feedbacks == 1, f"Se guardaron {feedbacks} feedbacks"
+        assert analyses == 1, f"Se guardaron {analyses} análisis"
+        assert len(producer.messages) == 1, f"Se publicaron {len(producer.messages)} eventos de puntos"
+        assert len({response["points"] for response in responses}) == 1, "Las respuestas no coinciden"
+        assert all(len(response["questions_analysis"]) == TOTAL_QUESTIONS for response in responses)
+        print(f"✅ {requests} evaluaciones concurrentes: 1 feedback, 1 análisis, 1 evento publicado")
+        return 0
+    except AssertionError as e:
+        print(f"❌ {e}")
+        return 1
+    finally:
+        await client.drop_database(DATABASE)
+        client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(check_feedback_race(args.requests)))
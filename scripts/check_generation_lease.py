@@ -0,0 +1,57 @@
+"""
+Prueba del lease de generación contra un mongod local
+
+Verifica que el lease es exclusivo entre workers, que solo su dueño puede
+renovarlo o liberarlo y que un lease caducado (worker caído) puede retomarse.
+
+Uso:
+    MONGODB_URL=mongodb://localhost:27017 PYTHONPATH=src python scripts/check_generation_lease.py
+"""
+
+import asyncio
+import os
+
+from beanie import init_beanie
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from domain.entities.generation_lease import GenerationLease
+from domain.repositories.generation_lease_repository import GenerationLeaseRepository
+
+SKILL_ID = "lease_check_skill"
+
+
+async def check_generation_lease():
+    client = AsyncIOMotorClient(os.getenv("MONGODB_URL", "mongodb://localhost:27017"))
+    await init_beanie(database=client["skill_assement_lease_check"], document_models=[GenerationLease])
+    repository = GenerationLeaseRepository()
+    await GenerationLease.get_motor_collection().delete_many({})
+
+    try:
+        worker_a, worker_b = repository.new_owner(), repository.new_owner()
+
+        # Solo uno de 20 intentos concurrentes obtiene el lease
+        owners = [repository.new_owner() for _ in range(20)]
+        results = await asyncio.gather(*[repository.acquire(SKILL_ID, owner, 30) for owner in owners])
+        assert sum(results) == 1, f"Se esperaba un ganador, hubo {sum(results)}"
+        winner = owners[results.index(True)]
+        assert await repository.is_held(SKILL_ID)
+        assert not await repository.release(SKILL_ID, worker_b)
+        assert await repository.release(SKILL_ID, winner)
+        print("✅ Adquisición exclusiva y liberación por el dueño")
+
+        # Un lease caducado puede retomarse aunque el dueño no lo haya liberado
+        assert await repository.acquire(SKILL_ID, worker_a, 0.5)
+        assert not await repository.acquire(SKILL_ID, worker_b, 30)
+        await asyncio.sleep(1)
+        assert not await repository.is_held(SKILL_ID)
+        assert await repository.acquire(SKILL_ID, worker_b, 30)
+        assert not await repository.renew(SKILL_ID, worker_a, 30)
+        assert await repository.renew(SKILL_ID, worker_b, 30)
+        print("✅ Lease caducado retomado por otro worker")
+    finally:
+        await client.drop_database("skill_assement_lease_check")
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(check_generation_lease())
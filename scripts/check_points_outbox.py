@@ -0,0 +1,122 @@
+"""
+Prueba de la publicación de puntos tipo outbox contra un mongod local
+
+El productor falla las primeras publicaciones (RabbitMQ caído). Verifica que el
+feedback se guarda con points_published=False sin fallar la evaluación, que el
+worker reintenta hasta publicar, que las lecturas concurrentes posteriores no
+vuelven a publicar y que un feedback guardado con el flag en False se publica
+desde la lectura.
+
+Uso:
+    MONGODB_URL=mongodb://localhost:27017 PYTHONPATH=src python scripts/check_points_outbox.py --failures 2
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+from beanie import init_beanie
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from application.use_cases.evaluate_skill_assement_use_case import EvaluateSkillAssessment
+from application.use_cases.schedule_feedback_evaluation_use_case import ScheduleFeedbackEvaluationUseCase
+from domain.entities.assement_feedback import AssementFeedback, FeedbackQuestionsAnalysis
+from domain.entities.question import Question
+from domain.entities.skill import Skill
+from domain.entities.user_session import AnswerSessionModel, UserSession
+from domain.repositories.assement_feedback_repository import AssementFeedBackRepository
+from domain.repositories.question_repository import QuestionRepository
+from domain.repositories.user_session_repository import UserSessionRepository
+from infrastructure.concurrency.background_worker_pool import BackgroundWorkerPool
+from infrastructure.config.app_config import config
+
+DATABASE = "skill_assement_points_outbox_check"
+TOTAL_QUESTIONS = 5
+
+
+class FlakyProducer:
+    """Falla las primeras ``failures`` publicaciones y registra el resto."""
+
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.attempts = 0
+        self.messages = []
+
+    async def publish_message(self, message, queue_name, routing_key=None, priority=0):
+        self.attempts += 1
+        await asyncio.sleep(0.01)
+        if self.attempts <= self.failures:
+            raise ConnectionError("RabbitMQ unavailable")
+        self.messages.append(message)
+
+
+async def seed(user_id: str) -> str:
+    skill = await Skill(name=f"Points outbox skill {user_id}").insert()
+    skill_id = str(skill.id)
+    for number in range(1, TOTAL_QUESTIONS + 1):
+        await Question(
+            question_number=number, skillid=skill_id, subcategory="sub", type="multiple choice",
+            question=f"Question {number}", options=["a", "b"], correct_answer="a"
+        ).insert()
+    session = await UserSession(
+        user_id=user_id, skill_id=skill_id, total_questions=TOTAL_QUESTIONS,
+        question_numbers=list(range(1, TOTAL_QUESTIONS + 1)),
+        answers=[AnswerSessionModel(id_question=n, answer="a") for n in range(1, TOTAL_QUESTIONS + 1)],
+        actual_number_of_questions=TOTAL_QUESTIONS, is_finished=True, status="completed"
+    ).insert()
+    return str(session.id)
+
+
+def evaluate_use_case(producer: FlakyProducer) -> EvaluateSkillAssessment:
+    return EvaluateSkillAssessment(UserSessionRepository(), QuestionRepository(), AssementFeedBackRepository(), producer)
+
+
+async def check_points_outbox(failures: int) -> int:
+    config.feedback_points_publish_retries = failures + 1
+    config.feedback_points_publish_retry_delay_seconds = 0
+    client = AsyncIOMotorClient(os.getenv("MONGODB_URL", "mongodb://localhost:27017"))
+    await init_beanie(database=client[DATABASE], document_models=[
+        Skill, Question, UserSession, AssementFeedback, FeedbackQuestionsAnalysis
+    ], skip_indexes=True)
+    try:
+        # Worker: la evaluación no falla por RabbitMQ y los reintentos acaban publicando
+        session_id = await seed("outbox_worker_user")
+        producer = FlakyProducer(failures)
+        await ScheduleFeedbackEvaluationUseCase(
+            evaluate_use_case(producer), BackgroundWorkerPool("check", 1, 1)
+        ).evaluate(session_id)
+        feedback = await AssementFeedback.find_one(AssementFeedback.session_id == session_id)
+        assert feedback.points_published, "El worker no marcó los puntos como publicados"
+        assert feedback.points_publish_claimed_until is None, "El reclamo no se liberó"
+        assert len(producer.messages) == 1, f"Se publicaron {len(producer.messages)} eventos"
+        assert producer.messages[0]["points_earned"] == feedback.points_earned
+
+        await asyncio.gather(*[evaluate_use_case(producer).execute(session_id) for _ in range(10)])
+        assert len(producer.messages) == 1, "Las lecturas volvieron a publicar"
+        print(f"✅ Worker: {producer.attempts} intentos, 1 evento publicado")
+
+        # Lectura: un feedback que quedó sin publicar se publica una vez aunque haya lecturas concurrentes
+        session_id = await seed("outbox_read_user")
+        producer = FlakyProducer(1)
+        response = await evaluate_use_case(producer).execute(session_id)
+        assert response["points"] and not producer.messages
+        assert not (await AssementFeedback.find_one(AssementFeedback.session_id == session_id)).points_published
+        await asyncio.gather(*[evaluate_use_case(producer).execute(session_id) for _ in range(10)])
+        feedback = await AssementFeedback.find_one(AssementFeedback.session_id == session_id)
+        assert feedback.points_published and len(producer.messages) == 1, f"Se publicaron {len(producer.messages)} eventos"
+        print("✅ Lectura: el feedback pendiente se publicó una sola vez con 10 lecturas concurrentes")
+        return 0
+    except AssertionError as e:
+        print(f"❌ {e}")
+        return 1
+    finally:
+        await client.drop_database(DATABASE)
+        client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--failures", type=int, default=2)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(check_points_outbox(args.failures)))
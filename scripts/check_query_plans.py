@@ -0,0 +1,117 @@
+"""
+Prueba de planes de consulta contra un mongod local
+
+Crea los índices declarados en infrastructure/database/indexes.py, siembra un
+documento por colección y ejecuta explain() sobre el filtro y el orden de cada
+consulta de los repositorios. Falla si algún plan ganador contiene un COLLSCAN.
+
+find_skills_without_questions recorre todos los skills a propósito (backfill)
+y no se comprueba.
+
+Uso:
+    MONGODB_URL=mongodb://localhost:27017 PYTHONPATH=src python scripts/check_query_plans.py
+"""
+
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+from beanie import PydanticObjectId, init_beanie
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from infrastructure.database.indexes import INDEXES, ensure_indexes
+from domain.entities.assement_feedback import AssementFeedback
+from domain.entities.generation_lease import GenerationLease
+from domain.entities.question import Question
+from domain.entities.quiz_cache_entry import QuizCacheEntry
+from domain.entities.skill import Skill
+from domain.entities.user_session import UserSession
+
+DATABASE = "skill_assement_plan_check"
+OBJECT_ID = PydanticObjectId()
+NOW = datetime.now(timezone.utc)
+
+# (descripción, modelo, filtro, orden)
+QUERIES = [
+    ("SkillRepository.find_by_name", Skill, {"name": "Python"}, None),
+    ("SkillRepository.find_by_id", Skill, {"_id": OBJECT_ID}, None),
+    ("SkillRepository.find_skills_after", Skill, {"_id": {"$gt": OBJECT_ID}}, [("_id", 1)]),
+    ("UserSessionRepository.get_user_session_by_id", UserSession, {"_id": OBJECT_ID}, None),
+    ("UserSessionRepository.get_session_finished_by_user_id", UserSession, {"user_id": "u", "is_finished": True, "status": "completed"}, None),
+    ("UserSessionRepository.get_finished_sessions_with_feedback_after", UserSession, {
+        "user_id": "u", "is_finished": True, "status": "completed",
+        "$or": [{"finished_at": {"$lt": NOW}}, {"finished_at": None}, {"finished_at": NOW, "_id": {"$lt": OBJECT_ID}}]
+    }, [("finished_at", -1), ("_id", -1)]),
+    ("UserSessionRepository.abandon_open_sessions", UserSession, {"skill_id": "s", "is_finished": False}, None),
+    ("QuestionRepository.find_questions_by_skillid", Question, {"skillid": "s"}, [("question_number", 1)]),
+    ("QuestionRepository.find_question_by_skillid_and_number", Question, {"skillid": "s", "question_number": 1}, None),
+    ("QuestionRepository.find_questions_by_skillid_and_numbers", Question,
+     {"skillid": "s", "question_number": {"$in": [1, 5, 9]}}, None),
+    ("AssementFeedBackRepository.get_feedback_by_session_id", AssementFeedback, {"session_id": "x"}, None),
+    ("GenerationLeaseRepository.acquire", GenerationLease, {"_id": "s", "expires_at": {"$lte": NOW}}, None),
+    ("QuizCacheRepository.get_and_touch", QuizCacheEntry, {"_id": "k", "expires_at": {"$gt": NOW}}, None),
+    ("QuizCacheRepository.evict_to_size", QuizCacheEntry, {}, [("last_hit_at", 1)]),
+    ("QuizCacheRepository.invalidate", QuizCacheEntry, {"skill_name": "python"}, None),
+]
+
+
+def winning_plan_stages(explain: dict) -> list:
+    stages = []
+
+    def walk(node, in_winning_plan: bool):
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key == "rejectedPlans":
+                    continue
+                inside = in_winning_plan or key == "winningPlan"
+                if key == "stage" and inside:
+                    stages.append(value)
+                walk(value, inside)
+        elif isinstance(node, list):
+            for item in node:
+                walk(item, in_winning_plan)
+
+    walk(explain, False)
+    return stages
+
+
+async def seed():
+    await Skill(name="Python").insert()
+    await UserSession(user_id="u", skill_id="s", is_finished=True, status="completed", finished_at=NOW).insert()
+    await Question(question_number=1, skillid="s", subcategory="a", type="multiple choice",
+                   question="q", options=["a", "b"], correct_answer="a").insert()
+    await AssementFeedback(user_id="u", session_id="x", assement_result=0, industry_avarage=0, points_earned=0,
+                           results=[], relevant_skills=[], recommended_tools=[], questions_analysis=[]).insert()
+    await GenerationLease(id="s", owner="w", expires_at=NOW + timedelta(minutes=1)).insert()
+    await QuizCacheEntry(id="k", skill_name="python", model="m", prompt_hash="h", quiz={},
+                         expires_at=NOW + timedelta(days=1)).insert()
+
+
+async def check_query_plans() -> int:
+    client = AsyncIOMotorClient(os.getenv("MONGODB_URL", "mongodb://localhost:27017"))
+    await init_beanie(database=client[DATABASE], document_models=list(INDEXES), skip_indexes=True)
+    failures = 0
+    try:
+        await seed()
+        result = await ensure_indexes()
+        assert not result["failed"], f"Índices no creados: {result['failed']}"
+
+        for name, model, query, sort in QUERIES:
+            cursor = model.get_motor_collection().find(query)
+            if sort:
+                cursor = cursor.sort(sort)
+            stages = winning_plan_stages(await cursor.explain())
+            if "COLLSCAN" in stages:
+                failures += 1
+                print(f"❌ {name}: COLLSCAN ({' > '.join(stages)})")
+            else:
+                print(f"✅ {name}: {' > '.join(stages)}")
+    finally:
+        await client.drop_database(DATABASE)
+        client.close()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(check_query_plans()))
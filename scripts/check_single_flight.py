@@ -0,0 +1,133 @@
+"""
+Prueba de concurrencia del single-flight de generación de quizzes
+
+Primero comprueba la primitiva SingleFlight por separado. Después, contra un
+mongod local, lanza 100 CreateAssessmentUseCase.execute simultáneos para la
+misma skill sin banco, con un servicio Gemini falso que cuenta las llamadas.
+Verifica que se genera un solo banco, que todas las sesiones se muestrean de
+él y que GenerateQuestionBankUseCase devuelve el mismo banco a todos los que
+llaman a la vez.
+
+Uso:
+    MONGODB_URL=mongodb://localhost:27017 PYTHONPATH=src python scripts/check_single_flight.py
+"""
+
+import asyncio
+import os
+
+from beanie import init_beanie
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from application.use_cases.create_assement_use_case import CreateAssessmentUseCase
+from application.use_cases.generate_question_bank_use_case import GenerateQuestionBankUseCase
+from domain.entities.generation_lease import GenerationLease
+from domain.entities.question import Question
+from domain.entities.skill import Skill
+from domain.entities.user_session import UserSession
+from domain.repositories.generation_lease_repository import GenerationLeaseRepository
+from domain.repositories.question_repository import QuestionRepository
+from domain.repositories.skill_repository import SkillRepository
+from domain.repositories.user_session_repository import UserSessionRepository
+from infrastructure.concurrency.single_flight import SingleFlight
+from infrastructure.config.app_config import config
+
+CONCURRENT_STARTS = 100
+DATABASE = "skill_assement_single_flight_check"
+
+
+class CountingGeminiService:
+    """Sustituye a GeminiService: cuenta las generaciones de banco y tarda como Gemini."""
+
+    def __init__(self):
+        self.bank_generations = 0
+
+    async def generate_question_bank(self, skill: str, bank_size=None):
+        self.bank_generations += 1
+        await asyncio.sleep(0.2)  # Simula la latencia de Gemini
+        return {"questions": [
+            {"subcategory": f"sub {number % 4}", "type": "multiple choice", "question": f"{skill} question {number}",
+             "options": ["a", "b", "c", "d"], "correct_answer": "a", "recommended_tools": ["pytest"]}
+            for number in range(1, (bank_size or config.question_bank_size) + 1)
+        ]}
+
+
+async def check_single_generation():
+    flight = SingleFlight()
+    generations = 0
+
+    async def generate_bank():
+        nonlocal generations
+        generations += 1
+        await asyncio.sleep(0.2)  # Simula la latencia de Gemini
+        return {"questions": list(range(15))}
+
+    results = await asyncio.gather(*[
+        flight.do("skill_123", generate_bank) for _ in range(CONCURRENT_STARTS)
+    ])
+
+    assert generations == 1, f"Se esperaban 1 generación, hubo {generations}"
+    assert all(result is results[0] for result in results)
+    assert not flight.in_flight("skill_123")
+
+    # Una vez terminada, una nueva llamada vuelve a ejecutar la función
+    await flight.do("skill_123", generate_bank)
+    assert generations == 2
+
+    print(f"✅ SingleFlight: {CONCURRENT_STARTS} llamadas concurrentes -> 1 ejecución")
+
+
+def create_assessment_use_case(gemini: CountingGeminiService) -> CreateAssessmentUseCase:
+    return CreateAssessmentUseCase(
+        QuestionRepository(), gemini, SkillRepository(), UserSessionRepository(), GenerationLeaseRepository()
+    )
+
+
+def generate_question_bank_use_case(gemini: CountingGeminiService) -> GenerateQuestionBankUseCase:
+    return GenerateQuestionBankUseCase(
+        QuestionRepository(), gemini, SkillRepository(), GenerationLeaseRepository(), UserSessionRepository()
+    )
+
+
+async def check_use_case_single_generation():
+    # La muestra estratificada solo se usa sin streaming
+    config.quiz_streaming_enabled = False
+    client = AsyncIOMotorClient(os.getenv("MONGODB_URL", "mongodb://localhost:27017"))
+    await init_beanie(database=client[DATABASE], document_models=[Skill, Question, UserSession, GenerationLease],
+                      skip_indexes=True)
+    try:
+        gemini = CountingGeminiService()
+        create = create_assessment_use_case(gemini)
+        skill = await Skill(name="Single flight skill").insert()
+        skill_id = str(skill.id)
+
+        results = await asyncio.gather(*[
+            create.execute(skill_id, f"user_{i}") for i in range(CONCURRENT_STARTS)
+        ])
+        bank = {question.question_number for question in await Question.find(Question.skillid == skill_id).to_list()}
+        assert gemini.bank_generations == 1, f"Se esperaba 1 generación, hubo {gemini.bank_generations}"
+        assert len(bank) == config.question_bank_size, f"El banco tiene {len(bank)} preguntas"
+        for result in results:
+            numbers = result["session"].question_numbers
+            assert len(numbers) == config.quiz_question_count and set(numbers) <= bank
+        print(f"✅ CreateAssessmentUseCase: {CONCURRENT_STARTS} inicios concurrentes -> 1 generación del banco")
+
+        gemini = CountingGeminiService()
+        generate = generate_question_bank_use_case(gemini)
+        other = await Skill(name="Single flight skill 2").insert()
+        banks = await asyncio.gather(*[generate.execute(other) for _ in range(CONCURRENT_STARTS)])
+        assert gemini.bank_generations == 1, f"Se esperaba 1 generación, hubo {gemini.bank_generations}"
+        first_ids = [question.id for question in banks[0]]
+        assert all([question.id for question in bank] == first_ids for bank in banks), "Bancos distintos"
+        print(f"✅ GenerateQuestionBankUseCase: {CONCURRENT_STARTS} llamadas concurrentes -> el mismo banco")
+    finally:
+        await client.drop_database(DATABASE)
+        client.close()
+
+
+async def run():
+    await check_single_generation()
+    await check_use_case_single_generation()
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
@@ -0,0 +1,49 @@
+"""
+Prueba de SkillRepository.find_skills_without_questions contra un mongod local
+
+Siembra un skill con preguntas y otro sin ellas y verifica que el backfill de
+bancos de preguntas solo devuelve el segundo: el $lookup debe apuntar a la
+colección donde Beanie guarda realmente las preguntas.
+
+Uso:
+    MONGODB_URL=mongodb://localhost:27017 PYTHONPATH=src python scripts/check_skills_without_questions.py
+"""
+
+import asyncio
+import os
+import sys
+
+from beanie import init_beanie
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from domain.entities.question import Question
+from domain.entities.skill import Skill
+from domain.repositories.skill_repository import SkillRepository
+
+DATABASE = "skill_assement_backfill_check"
+
+
+async def check_skills_without_questions() -> int:
+    client = AsyncIOMotorClient(os.getenv("MONGODB_URL", "mongodb://localhost:27017"))
+    await init_beanie(database=client[DATABASE], document_models=[Skill, Question], skip_indexes=True)
+    try:
+        with_bank = await Skill(name="Skill with bank").insert()
+        without_bank = await Skill(name="Skill without bank").insert()
+        await Question(question_number=1, skillid=str(with_bank.id), subcategory="a", type="multiple choice",
+                       question="q", options=["a", "b"], correct_answer="a").insert()
+
+        found = {str(skill.id) for skill in await SkillRepository().find_skills_without_questions()}
+        assert str(with_bank.id) not in found, "Un skill con preguntas aparece como pendiente de generar"
+        assert str(without_bank.id) in found, "El skill sin preguntas no aparece como pendiente"
+        print(f"✅ Solo el skill sin preguntas está pendiente (colección {Question.get_collection_name()})")
+        return 0
+    except AssertionError as e:
+        print(f"❌ {e}")
+        return 1
+    finally:
+        await client.drop_database(DATABASE)
+        client.close()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(check_skills_without_questions()))
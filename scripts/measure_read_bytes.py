@@ -0,0 +1,163 @@
+"""
+Medición de bytes movidos desde/hacia MongoDB por petición
+
+Siembra una sesión a medio responder, su banco de preguntas y un historial de
+feedbacks en un mongod local y cuenta, con el monitor de comandos de pymongo,
+los bytes enviados y recibidos por cada flujo: con las lecturas de documento
+completo de antes y con las proyecciones actuales. Los feedbacks se siembran
+con el análisis embebido (formato antiguo); el resumen lo excluye igualmente.
+
+Uso:
+    MONGODB_URL=mongodb://localhost:27017 PYTHONPATH=src python scripts/measure_read_bytes.py
+"""
+
+import asyncio
+import os
+from datetime import datetime, timezone
+
+import bson
+from beanie import init_beanie
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
+
+from domain.entities.assement_feedback import AssementFeedback, QuestionAnalysis
+from domain.entities.question import Question
+from domain.entities.skill import Skill
+from domain.entities.user_session import AnswerSessionModel, UserSession
+from domain.repositories.assement_feedback_repository import AssementFeedBackRepository
+from domain.repositories.question_repository import QuestionRepository
+from domain.repositories.user_session_repository import UserSessionRepository
+
+DATABASE = "skill_assement_bytes_check"
+USER_ID = "bytes_check_user"
+
+
+class ByteCounter(monitoring.CommandListener):
+    def __init__(self):
+        self.sent = 0
+        self.received = 0
+
+    def reset(self):
+        self.sent = 0
+        self.received = 0
+
+    def started(self, event):
+        self.sent += len(bson.encode(event.command))
+
+    def succeeded(self, event):
+        self.received += len(bson.encode(event.reply))
+
+    def failed(self, event):
+        pass
+
+
+async def seed():
+    skill = await Skill(name="Bytes skill").insert()
+    skill_id = str(skill.id)
+    for number in range(1, 61):
+        await Question(
+            question_number=number, skillid=skill_id, subcategory=f"sub {number % 5}", type="multiple choice",
+            question=f"Question {number} " + "lorem ipsum " * 15, options=[f"Option {i} " + "dolor " * 5 for i in range(4)],
+            correct_answer="Option 0 " + "dolor " * 5, recommended_tools=["pytest", "mypy"] if number == 1 else None
+        ).insert()
+    question_numbers = list(range(1, 60, 4))
+    session = await UserSession(
+        user_id=USER_ID, skill_id=skill_id, total_questions=15, question_numbers=question_numbers,
+        answers=[AnswerSessionModel(id_question=i, answer="Option 1 " + "dolor " * 5) for i in range(1, 14)],
+        actual_number_of_questions=13
+    ).insert()
+    for _ in range(10):
+        finished = await UserSession(
+            user_id=USER_ID, skill_id=skill_id, total_questions=15, question_numbers=question_numbers,
+            answers=[AnswerSessionModel(id_question=i, answer="Option 1") for i in range(1, 16)],
+            actual_number_of_questions=15, is_finished=True, finished_at=datetime.now(timezone.utc)
+        ).insert()
+        feedback = await AssementFeedback(
+            user_id=USER_ID, session_id=str(finished.id), assement_result=60, industry_avarage=60, points_earned=5,
+            results=[], relevant_skills=[], recommended_tools=[],
+            questions_analysis=[QuestionAnalysis(question_number=i, question="Question " + "lorem " * 15, subcategory="sub",
+                                                 correct_answer="Option 0", user_answers=[]) for i in range(1, 16)]
+        ).insert()
+    return skill_id, str(session.id), str(feedback.id)
+
+
+async def get_question_before(skill_id: str, session_id: str):
+    session = await UserSession.get(session_id)
+    await Question.find_one(Question.skillid == skill_id, Question.question_number == session.bank_question_number(5))
+
+
+async def get_question_after(skill_id: str, session_id: str):
+    session = await UserSessionRepository().get_session_progress(session_id)
+    await QuestionRepository().find_question_view_by_skillid_and_number(skill_id, session.bank_question_number(5))
+
+
+async def answer_before(session_id: str):
+    session = await UserSession.get(session_id)
+    session.answers.append(AnswerSessionModel(id_question=14, answer="Option 2"))
+    session.actual_number_of_questions += 1
+    await session.save()
+
+
+async def answer_after(session_id: str):
+    await UserSessionRepository().record_answer(session_id, USER_ID, 14, "Option 2")
+
+
+async def history_before():
+    sessions = await UserSession.find(UserSession.user_id == USER_ID, UserSession.is_finished == True).limit(10).to_list()
+    await UserSession.find(UserSession.user_id == USER_ID, UserSession.is_finished == True).count()
+    for session in sessions:
+        await AssementFeedback.find_one(AssementFeedback.session_id == str(session.id))
+        await Skill.get(session.skill_id)
+
+
+async def history_after():
+    await UserSessionRepository().get_finished_sessions_with_feedback(USER_ID, 0, 10)
+
+
+async def feedback_before(feedback_id: str):
+    await AssementFeedback.get(feedback_id)
+
+
+async def feedback_after(feedback_id: str):
+    await AssementFeedBackRepository().get_feedback_summary_by_id(feedback_id)
+
+
+async def measure(counter: ByteCounter, flow) -> tuple:
+    counter.reset()
+    await flow()
+    return counter.sent, counter.received
+
+
+async def run():
+    counter = ByteCounter()
+    client = AsyncIOMotorClient(os.getenv("MONGODB_URL", "mongodb://localhost:27017"), event_listeners=[counter])
+    await init_beanie(database=client[DATABASE], document_models=[Skill, Question, UserSession, AssementFeedback])
+    try:
+        skill_id, session_id, feedback_id = await seed()
+        flows = [
+            ("GET pregunta", lambda: get_question_before(skill_id, session_id), lambda: get_question_after(skill_id, session_id)),
+            ("POST respuesta", lambda: answer_before(session_id), None),
+            ("Historial (10)", history_before, history_after),
+            ("GET feedback", lambda: feedback_before(feedback_id), lambda: feedback_after(feedback_id)),
+        ]
+        print("📊 Bytes por petición (enviados / recibidos)")
+        for name, before, after in flows:
+            sent, received = await measure(counter, before)
+            print(f"   {name:<16} antes   : {sent:>7} / {received:>7}")
+            if after:
+                sent, received = await measure(counter, after)
+                print(f"   {name:<16} después : {sent:>7} / {received:>7}")
+
+        # La respuesta se mide sobre una sesión sin la pregunta 14 respondida
+        await UserSession.find_one(UserSession.id == bson.ObjectId(session_id)).update({
+            "$pull": {"answers": {"id_question": 14}}, "$set": {"actual_number_of_questions": 13}
+        })
+        sent, received = await measure(counter, lambda: answer_after(session_id))
+        print(f"   {'POST respuesta':<16} después : {sent:>7} / {received:>7}")
+    finally:
+        await client.drop_database(DATABASE)
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
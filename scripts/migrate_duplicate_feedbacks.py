@@ -0,0 +1,54 @@
+"""
+Migración: un único feedback por sesión
+
+El índice único de assement_feedback.session_id (infrastructure/database/indexes.py)
+no se puede construir mientras haya sesiones con varios feedbacks, creados antes de
+que la creación fuera idempotente. Este script conserva el feedback más antiguo de
+cada sesión y borra el resto junto con su análisis por pregunta.
+
+Uso:
+    PYTHONPATH=src python scripts/migrate_duplicate_feedbacks.py            # borrar duplicados
+    PYTHONPATH=src python scripts/migrate_duplicate_feedbacks.py --dry-run  # solo listar
+"""
+
+import argparse
+import asyncio
+
+from domain.entities.assement_feedback import AssementFeedback, FeedbackQuestionsAnalysis
+from infrastructure.database.mongo_connection import mongo_connection
+from infrastructure.config.app_config import config
+
+
+async def migrate_duplicate_feedbacks(dry_run: bool):
+    config.mongodb_build_indexes_on_startup = False
+    await mongo_connection.connect()
+    try:
+        pipeline = [
+            {"$sort": {"created_at": 1, "_id": 1}},
+            {"$group": {"_id": "$session_id", "ids": {"$push": "$_id"}, "count": {"$sum": 1}}},
+            {"$match": {"count": {"$gt": 1}}},
+        ]
+        duplicates = await AssementFeedback.get_motor_collection().aggregate(pipeline, allowDiskUse=True).to_list(length=None)
+        print(f"📊 Sesiones con más de un feedback: {len(duplicates)}")
+
+        removed = 0
+        for group in duplicates:
+            keep, extra = group["ids"][0], group["ids"][1:]
+            print(f"   {group['_id']}: se conserva {keep}, sobran {len(extra)}")
+            if dry_run:
+                continue
+            await AssementFeedback.get_motor_collection().delete_many({"_id": {"$in": extra}})
+            await FeedbackQuestionsAnalysis.get_motor_collection().delete_many({"_id": {"$in": extra}})
+            removed += len(extra)
+
+        if not dry_run:
+            print(f"✅ Borrados {removed} feedbacks duplicados; ya se puede ejecutar scripts/migrate_indexes.py")
+    finally:
+        await mongo_connection.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(migrate_duplicate_feedbacks(args.dry_run))
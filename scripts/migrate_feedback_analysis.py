@@ -0,0 +1,58 @@
+"""
+Migración del análisis por pregunta de los feedbacks
+
+Mueve el campo questions_analysis embebido en cada documento de
+assement_feedback a la colección assement_feedback_analysis (mismo _id que el
+feedback) y lo elimina del feedback. Se puede repetir sin riesgo: el análisis
+se escribe con upsert antes de quitarlo del feedback.
+
+Uso:
+    PYTHONPATH=src python scripts/migrate_feedback_analysis.py            # migrar
+    PYTHONPATH=src python scripts/migrate_feedback_analysis.py --dry-run  # solo contar
+"""
+
+import argparse
+import asyncio
+
+from domain.entities.assement_feedback import AssementFeedback, FeedbackQuestionsAnalysis
+from infrastructure.database.mongo_connection import mongo_connection
+from infrastructure.config.app_config import config
+
+
+async def migrate_feedback_analysis(dry_run: bool, batch_size: int):
+    config.mongodb_build_indexes_on_startup = False
+    await mongo_connection.connect()
+    try:
+        feedbacks = AssementFeedback.get_motor_collection()
+        analyses = FeedbackQuestionsAnalysis.get_motor_collection()
+        embedded = {"questions_analysis": {"$exists": True}}
+
+        pending = await feedbacks.count_documents(embedded)
+        print(f"📊 Feedbacks con el análisis embebido: {pending}")
+        if dry_run or not pending:
+            return
+
+        migrated = 0
+        cursor = feedbacks.find(embedded, {"session_id": 1, "questions_analysis": 1}, batch_size=batch_size)
+        async for document in cursor:
+            await analyses.replace_one(
+                {"_id": document["_id"]},
+                {"session_id": document["session_id"], "questions_analysis": document["questions_analysis"] or []},
+                upsert=True
+            )
+            await feedbacks.update_one({"_id": document["_id"]}, {"$unset": {"questions_analysis": ""}})
+            migrated += 1
+            if migrated % batch_size == 0:
+                print(f"   ... {migrated}/{pending}")
+
+        print(f"✅ Migrados {migrated} feedbacks")
+    finally:
+        await mongo_connection.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(migrate_feedback_analysis(args.dry_run, args.batch_size))
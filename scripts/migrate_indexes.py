@@ -0,0 +1,50 @@
+"""
+Migración de índices
+
+Crea en MongoDB todos los índices declarados en infrastructure/database/indexes.py
+que todavía no existan. No borra índices antiguos. Los índices se construyen sin
+bloquear lecturas ni escrituras, así que puede ejecutarse con el servicio arrancado.
+
+Uso:
+    PYTHONPATH=src python scripts/migrate_indexes.py          # crear los que faltan
+    PYTHONPATH=src python scripts/migrate_indexes.py --check  # solo listar los que faltan
+"""
+
+import argparse
+import asyncio
+import sys
+
+from infrastructure.database.indexes import ensure_indexes, find_missing_indexes
+from infrastructure.database.mongo_connection import mongo_connection
+from infrastructure.config.app_config import config
+
+
+async def migrate_indexes(check_only: bool) -> int:
+    # Solo esta migración crea índices; evitar que connect() lance otra construcción en paralelo
+    config.mongodb_build_indexes_on_startup = False
+    await mongo_connection.connect()
+    try:
+        missing = await find_missing_indexes()
+        if not missing:
+            print("✅ Todos los índices declarados existen")
+            return 0
+        for model, index in missing:
+            print(f"⚠️  Falta {model.get_collection_name()}.{index.document['name']}")
+        if check_only:
+            return 1
+
+        result = await ensure_indexes()
+        for name in result["created"]:
+            print(f"✅ Creado {name}")
+        for name, error in result["failed"].items():
+            print(f"❌ {name}: {error}")
+        return 1 if result["failed"] else 0
+    finally:
+        await mongo_connection.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--check", action="store_true")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(migrate_indexes(args.check)))
@@ -1,60 +1,28 @@
-
+from typing import Optional
 from application.dto.answer_question_dto import AnswerQuestionDTO
-from datetime import datetime, timezone 
-from domain.entities.user_session import AnswerSessionModel
 
 from application.use_cases.base_assement_use_case import BaseAssessmentUseCase
+from application.use_cases.schedule_feedback_evaluation_use_case import ScheduleFeedbackEvaluationUseCase
+from domain.repositories.question_repository import QuestionRepository
+from domain.repositories.user_session_repository import UserSessionRepository
 class AnswerQuestionUseCase(BaseAssessmentUseCase):
+    def __init__(self, question_repository: QuestionRepository, user_session_repository: UserSessionRepository,
+                 schedule_feedback_evaluation: Optional[ScheduleFeedbackEvaluationUseCase] = None):
+        super().__init__(question_repository, user_session_repository)
+        self.schedule_feedback_evaluation = schedule_feedback_evaluation
+
     async def execute(self, question: AnswerQuestionDTO) -> dict:
         try:
-
-            session=await self.user_session_repository.get_user_session_by_id(question.id_session)
-            find_question=await self.question_repository.get_question_by_id(question.id_question)
-        
-            if(session.is_finished):
-                raise Exception("Session is already finished")
-            if (session.user_id != question.id_user):
-                raise Exception("User ID does not match the session user ID")
-          
-            for existing_answer in session.answers:
-                if existing_answer.id_question == question.id_question:
-                    raise Exception("Question already answered")
-            
-            if(question.id_question < 1 or question.id_question > session.total_questions):
-                raise Exception("Invalid question ID")
+            # Una sola escritura condicional: dos respuestas concurrentes nunca se pisan
+            session = await self.user_session_repository.record_answer(
+                question.id_session, question.id_user, question.id_question, question.answer
+            )
             if not session:
-                raise Exception("Session not found")
-            if not find_question:
-                raise Exception("Question not found")
-                
-            # Incrementar el contador de preguntas respondidas
-            session.actual_number_of_questions += 1
-            
-            # Verificar si la evaluación ha terminado
-            if session.actual_number_of_questions >= session.total_questions:
-                session.is_finished = True
-                session.finished_at = datetime.now(timezone.utc)
-                session.status = "completed"
-            
-            session.updated_at = datetime.now(timezone.utc)
-            
-            
-
-            
-
-
+                raise Exception(await self.rejection_reason(question))
+            if session.is_finished and self.schedule_feedback_evaluation:
+                # La última respuesta completa la sesión: el feedback se calcula en segundo plano
+                self.schedule_feedback_evaluation.schedule(str(session.id))
 
-            
-            
-
-            # Crear objeto AnswerSessionModel
-            new_answer = AnswerSessionModel(
-                id_question=question.id_question,
-                answer=question.answer
-            )
-            
-            session.answers.append(new_answer)
-            session=await self.user_session_repository.update_user_session(session)
             return {
                 "message": "Answer recorded successfully",
                 "session_id": str(session.id),
@@ -64,17 +32,20 @@ class AnswerQuestionUseCase(BaseAssessmentUseCase):
                 "is_completed": session.is_finished,
                 "next_question": session.actual_number_of_questions + 1 if not session.is_finished else None
             }
-
-
-
-            
-                
-                
-            
-
-        
-            
-            
         except Exception as e:
             raise Exception(f"Error processing answer: {str(e)}")
 
+    async def rejection_reason(self, question: AnswerQuestionDTO) -> str:
+        """Explain why record_answer did not match; only runs on the error path."""
+        session = await self.user_session_repository.get_user_session_by_id(question.id_session)
+        if not session:
+            return "Session not found"
+        if session.is_finished:
+            return "Session is already finished"
+        if session.user_id != question.id_user:
+            return "User ID does not match the session user ID"
+        if any(answer.id_question == question.id_question for answer in session.answers):
+            return "Question already answered"
+        if question.id_question < 1 or question.id_question > session.total_questions:
+            return "Invalid question ID"
+        return "Answer could not be recorded"
@@ -1,19 +1,25 @@
-from domain.entities.question import Question
 from domain.repositories.question_repository import QuestionRepository
 from domain.repositories.skill_repository import SkillRepository
 from domain.repositories.user_session_repository import UserSessionRepository
+from domain.repositories.generation_lease_repository import GenerationLeaseRepository
 from domain.entities.user_session import UserSession
+from domain.services.question_sampler import stratified_sample
 from infrastructure.external_services.gemini_service import GeminiService
+from application.use_cases.generate_question_bank_use_case import GenerateQuestionBankUseCase
+from infrastructure.config.app_config import config
 
-import asyncio
 class CreateAssessmentUseCase:
     def __init__(self, question_repository: QuestionRepository,gemini_service:GeminiService,skill_repository:SkillRepository,
-                 user_session_repository: UserSessionRepository):
+                 user_session_repository: UserSessionRepository,generation_lease_repository: GenerationLeaseRepository):
         
         self.question_repository = question_repository
         self.skill_repository = skill_repository
         self.user_session_repository = user_session_repository
         self.gemini_service = gemini_service
+        self.generation_lease_repository = generation_lease_repository
+        self.generate_question_bank_use_case = GenerateQuestionBankUseCase(
+            question_repository, gemini_service, skill_repository, generation_lease_repository, user_session_repository
+        )
 
 
     async def execute(self, skill_id: str,user_id: str) :
@@ -22,40 +28,35 @@ class CreateAssessmentUseCase:
         if not skill:
             raise Exception(f"Skill with id '{skill_id}' not found.")
         
-        findAquiz = await self.question_repository.find_question_by_skillid_and_number(skill_id, 1)
+        question_bank = await self.question_repository.find_bank_index(skill_id)
         
-        if findAquiz is None or findAquiz == []:
-            
-            generated_question = await self.gemini_service.generate_quiz_with_retry(skill.name, max_retries=5)
-            print(generated_question)
-            
+        # Mientras el banco no esté listo puede estar a medio insertar por otro worker
+        if not question_bank or (
+            skill.question_bank_status != "ready" and await self.generation_lease_repository.is_held(skill_id)
+        ):
+            if config.quiz_streaming_enabled:
+                # La sesión empieza en cuanto la pregunta 1 está guardada y usa las primeras preguntas del banco
+                available_questions = await self.generate_question_bank_use_case.execute_until_first_question(skill)
+                question_bank = None
+            else:
+                question_bank = await self.generate_question_bank_use_case.execute(skill)
+                available_questions = len(question_bank) if question_bank else None
             
-            if not generated_question or "questions" not in generated_question:
+            if not available_questions:
                 
                 return await self.handle_quiz_generation_failure(skill_id, user_id, skill.name)
-            
-            
-            for i, question in enumerate(generated_question["questions"]):
-                question_data = {
-                    "question_number": i + 1,  # Número secuencial: 1, 2, 3, etc.
-                    "skillid": str(skill.id),
-                    "subcategory": question.get("subcategory"),
-                    "type": question.get("type"),
-                    "question": question.get("question"),
-                    "options": question.get("options", []),
-                    "correct_answer": question.get("correct_answer"),
-                    "recommended_tools": question.get("recommended_tools", []) if i == 0 else None
-                }
-                await self.question_repository.create_question(question_data)
-                await asyncio.sleep(0.1)  
 
-        findAquiz = await self.question_repository.find_question_by_skillid_and_number(skill_id, 1)
-        total_questions = await self.question_repository.count_questions_by_skillid(skill_id)
-        print(findAquiz)
+        if question_bank:
+            # Muestra estratificada del banco compartido: cada subcategoría aporta por turnos
+            question_numbers = stratified_sample(question_bank, config.quiz_question_count)
+        else:
+            question_numbers = list(range(1, min(config.quiz_question_count, available_questions) + 1))
+
         session = UserSession(
             user_id=user_id,
             skill_id=skill_id,
-            total_questions=total_questions,
+            total_questions=len(question_numbers),
+            question_numbers=question_numbers,
             actual_number_of_questions=0  # Iniciar en 0, se incrementa al responder cada pregunta
         )
 
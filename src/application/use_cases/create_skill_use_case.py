@@ -1,9 +1,14 @@
 
 from domain.entities.skill import Skill
 from domain.repositories.skill_repository import SkillRepository
+from application.use_cases.schedule_question_bank_generation_use_case import ScheduleQuestionBankGenerationUseCase
 class CreateSkillUseCase:
-    def __init__(self, skill_repository: SkillRepository):
+    def __init__(self, skill_repository: SkillRepository, schedule_question_bank_use_case: ScheduleQuestionBankGenerationUseCase):
         self.skill_repository = skill_repository
+        self.schedule_question_bank_use_case = schedule_question_bank_use_case
 
     async def execute(self, skill: Skill) -> Skill:
-        return await self.skill_repository.create_skill(skill)
+        created_skill = await self.skill_repository.create_skill(skill)
+        # Si la cola está llena el banco se generará en el primer POST /assement/{skill_id}
+        self.schedule_question_bank_use_case.schedule(created_skill)
+        return created_skill
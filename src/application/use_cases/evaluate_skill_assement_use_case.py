@@ -1,11 +1,17 @@
 from domain.repositories.question_repository import QuestionRepository
+from domain.entities.question import Question
 from domain.repositories.user_session_repository import UserSessionRepository
 from domain.repositories.assement_feedback_repository import AssementFeedBackRepository
 from domain.entities.assement_feedback import AssementFeedback,AssementResult,RelevantSkillToFocusOn,RecommendeToolsAndFrameWorks,QuestionAnalysis
+from domain.services.assessment_scoring import score_assessment
 from infrastructure.messaging.rabbitmq_producer import RabbitMQProducer
+from infrastructure.config.app_config import config
 from datetime import datetime
 from typing import List
 from typing import Dict, Any
+import logging
+
+logger = logging.getLogger(__name__)
 
 class EvaluateSkillAssessment:
     def __init__(self, user_session_repository: UserSessionRepository, question_repository: QuestionRepository, feedback_repository: AssementFeedBackRepository, rabbitmq_producer: RabbitMQProducer):
@@ -16,24 +22,28 @@ class EvaluateSkillAssessment:
 
     async def execute(self, session_id: str) -> Dict[str, Any]:
      try:
-        session = await self.user_session_repository.get_user_session_by_id(session_id)
+        progress = await self.user_session_repository.get_session_progress(session_id)
         
         # Verificar que la sesión existe antes de acceder a sus propiedades
-        if not session:
+        if not progress:
             raise Exception("Session not found")
         
         feedBackbySessionId= await self.feedback_repository.get_feedback_by_session_id(session_id)
         
         if feedBackbySessionId:
-            return {
-                "message": "Ya se ha evaluado esta sesión",
-                "session_id": session_id,
-                "feedback": feedBackbySessionId
-            }
+            # Normalmente ya evaluada en segundo plano al completarse la sesión: solo lecturas
+            return await self.stored_feedback_response(
+                progress, feedBackbySessionId, progress.total_questions, progress.actual_number_of_questions
+            )
         
-        questions = await self.question_repository.find_questions_by_skillid(session.skill_id)
+        # Respaldo síncrono: el feedback aún no está listo
+        session = await self.user_session_repository.get_user_session_by_id(session_id)
+        questions = await self.find_session_questions(session)
         if not session.is_finished:
             raise Exception("Session is not finished")
+        if session.status != "completed":
+            # Abandonada: sus respuestas eran de un banco que ya no existe
+            raise Exception(f"Session is {session.status} and cannot be evaluated")
         
       
         if not questions:
@@ -42,16 +52,19 @@ class EvaluateSkillAssessment:
         
         
         
-        category_scores = self.calculate_percentage_by_category(questions, session.answers)
+        # Una sola pasada sobre preguntas y respuestas
+        score = score_assessment(questions, session.answers)
+        category_scores = score.category_scores
         overall_score = self.calculate_overall_score(category_scores)
         recommend_tools:List[RecommendeToolsAndFrameWorks] = []
-        question_analysis, good_answers, bad_answers = self.calculate_question_with_good_or_bad_answers(questions, session.answers)
+        question_analysis, good_answers, bad_answers = score.questions_analysis, score.good_answers, score.bad_answers
         industry_average = self.calculate_industry_average(category_scores)
         points = self.calculte_points(category_scores)
         relevant_skills: List[RelevantSkillToFocusOn] = self.get_relevant_skills_focus_on(category_scores)
 
-        if questions[0].recommended_tools:
-            for tool in questions[0].recommended_tools:
+        tools = await self.find_recommended_tools(session, questions)
+        if tools:
+            for tool in tools:
                 recommend_tools.append(
                     RecommendeToolsAndFrameWorks(name=tool)
                 )
@@ -70,82 +83,119 @@ class EvaluateSkillAssessment:
             good_answers=good_answers
 
         )
-        await self.rabbitmq_producer.publish_message(
-            message={
-            "event": "Skill Assement Finished",
-            "type": "Skill Assement",
-            "created_at": str(datetime.utcnow()),
-            "points_earned": points,
-            "user_id": session.user_id,
-            },
-            queue_name="any",
-            priority=5
+        feedback, created = await self.feedback_repository.create_feedback(assement_feedback)
+        if not created:
+            # Otra evaluación concurrente de la sesión guardó primero: devolver la suya sin publicar
+            return await self.stored_feedback_response(session, feedback, len(questions), len(session.answers))
 
-        )
-        feedback = await self.feedback_repository.create_feedback(assement_feedback)
+        # Solo la inserción ganadora publica; si falla, la lectura o el worker reintentan
+        await self.publish_points(feedback)
 
+        return self.feedback_response(session, feedback, feedback.questions_analysis, len(questions), len(session.answers))
+     except Exception as e:
+        print(f"Error evaluating skill assessment: {str(e)}")
+        raise Exception(f"Error evaluating skill assessment: {str(e)}")
 
+    async def publish_points(self, feedback: AssementFeedback) -> bool:
+        """
+        Publish the points earned event of a stored feedback unless it already was,
+        then mark it published. The claim on the feedback keeps concurrent callers from
+        publishing twice; a failed publish releases it and leaves the flag unset so the
+        next read or worker retry publishes. Returns whether the points are published.
+        """
+        if feedback.points_published:
+            return True
+        feedback_id = str(feedback.id)
+        if not await self.feedback_repository.claim_points_publication(
+            feedback_id, config.feedback_points_publish_lease_seconds
+        ):
+            return False
+        try:
+            await self.rabbitmq_producer.publish_message(
+                message={
+                "event": "Skill Assement Finished",
+                "type": "Skill Assement",
+                "created_at": str(datetime.utcnow()),
+                # Se guarda como float; el evento siempre llevó los puntos enteros
+                "points_earned": int(feedback.points_earned),
+                "user_id": feedback.user_id,
+                },
+                queue_name="any",
+                priority=5
+
+            )
+        except Exception as e:
+            logger.error(f"Publishing points of feedback {feedback_id} failed, will retry: {e}")
+            await self.feedback_repository.release_points_publication(feedback_id)
+            return False
+        await self.feedback_repository.mark_points_published(feedback_id)
+        feedback.points_published = True
+        return True
+
+    async def publish_pending_points(self, session_id: str) -> bool:
+        """Retry the points event of a session's feedback; True once it is published."""
+        feedback = await self.feedback_repository.get_feedback_by_session_id(session_id)
+        return feedback is None or await self.publish_points(feedback)
+
+    async def stored_feedback_response(self, session, feedback: AssementFeedback,
+                                       total_questions: int, total_answered: int) -> Dict[str, Any]:
+        if not feedback.points_published:
+            # Outbox: la publicación tras guardar el feedback falló o sigue en curso
+            await self.publish_points(feedback)
+        questions_analysis = feedback.questions_analysis
+        if questions_analysis is None:
+            questions_analysis = await self.feedback_repository.get_questions_analysis(str(feedback.id))
+        return self.feedback_response(session, feedback, questions_analysis, total_questions, total_answered)
+
+    def feedback_response(self, session, feedback: AssementFeedback, questions_analysis: List[QuestionAnalysis],
+                          total_questions: int, total_answered: int) -> Dict[str, Any]:
+        """Same response whether the feedback was just computed or was already stored."""
         return {
             "session_id": str(session.id),
             "user_id": session.user_id,
             "skill_id": session.skill_id,
             "assement_result": feedback.assement_result,
-            "result": category_scores,
+            "result": feedback.results,
             "industry_average": feedback.industry_avarage,
             "points": feedback.points_earned,
         
 
             "relevant_skills": feedback.relevant_skills,
             "recommended_tools": feedback.recommended_tools,
-            "questions_analysis": feedback.questions_analysis,
+            "questions_analysis": questions_analysis,
             "good_answers": feedback.good_answers,
             "bad_answers": feedback.bad_answers,
 
-            "total_questions": len(questions),
-            "total_answered": len(session.answers)
+            "total_questions": total_questions,
+            "total_answered": total_answered
         }
-     except Exception as e:
-        print(f"Error evaluating skill assessment: {str(e)}")
-        raise Exception(f"Error evaluating skill assessment: {str(e)}")
 
-    def calculate_percentage_by_category(self, questions: list, answers: list) -> List[AssementResult]:
-        """Calcular porcentaje de aciertos por categoría"""
-        category_scores = []
-        
-       
-    
-        category_data = {}
-       
-        for question in questions:
-            category = question.subcategory
-            if category not in category_data:
-                category_data[category] = {"correct": 0, "total": 0}
-        
-    
+    async def find_session_questions(self, session) -> List[Question]:
+        """Questions the session was asked, numbered by their position in the session."""
+        if not session.question_numbers:
+            return await self.question_repository.find_questions_by_skillid(session.skill_id)
+        bank_questions = await self.question_repository.find_questions_by_skillid_and_numbers(
+            session.skill_id, session.question_numbers[:session.total_questions]
+        )
+        by_number = {question.question_number: question for question in bank_questions}
+        # Copias renumeradas: las respuestas usan la posición de la pregunta en la sesión
+        return [
+            by_number[number].model_copy(update={"question_number": position})
+            for position, number in enumerate(session.question_numbers[:session.total_questions], start=1)
+            if number in by_number
+        ]
+
+    async def find_recommended_tools(self, session, questions: List[Question]) -> List[str]:
+        """Recommended tools live on question 1 of the skill bank, which a sampled session may not include."""
         for question in questions:
-            category = question.subcategory
-            category_data[category]["total"] += 1
-            
-            for answer in answers:
-             if answer.id_question == question.id:
-                if answer.answer == question.correct_answer:
-                    category_data[category]["correct"] += 1
-                break
-        
-       
-        category_scores = []
-        for category, data in category_data.items():
-            percentage = (data["correct"] / data["total"]) * 100 if data["total"] > 0 else 0
-            category_scores.append(
-            AssementResult(
-                subcategory=category,
-                percentage=percentage
-                
-            )
-            )
-        
-        return category_scores
-    
+            if question.recommended_tools:
+                return question.recommended_tools
+        if session.question_numbers:
+            first_question = await self.question_repository.find_question_by_skillid_and_number(session.skill_id, 1)
+            if first_question and first_question.recommended_tools:
+                return first_question.recommended_tools
+        return []
+
     def calculate_overall_score(self, category_scores: List[AssementResult]) -> float:
         """Calcular puntaje general promediando las categorías"""
         if not category_scores:
@@ -153,42 +203,6 @@ class EvaluateSkillAssessment:
         
         total_score = sum(score.percentage for score in category_scores)
         return total_score / len(category_scores)
-    def calculate_question_with_good_or_bad_answers(self, questions: list, answers: list) -> tuple[List[QuestionAnalysis], int, int]:
-        """Calcular preguntas con respuestas buenas o malas"""
-        question_analysis: List[QuestionAnalysis] = []
-        good_answers = 0
-        bad_answers = 0
-
-        for question in questions:
-            analysis_item = QuestionAnalysis(
-                question_number=question.question_number,  # Usar question_number en lugar de question.id
-                question=question.question,
-                subcategory=question.subcategory,
-                correct_answer=question.correct_answer,
-                user_answers=[]
-            )
-            question_analysis.append(analysis_item)
-
-        questions_map = {question.question_number: question for question in questions}  # Usar question_number como clave
-        
-        # Procesar respuestas del usuario
-        for answer in answers:
-            if answer.id_question in questions_map:
-                # Buscar el análisis correspondiente por question_number
-                for item in question_analysis:
-                    if item.question_number == answer.id_question:
-                        is_correct = answer.answer == item.correct_answer
-                        item.user_answers.append({
-                            "answer": answer.answer,
-                            "is_correct": is_correct
-                        })
-                        if is_correct:
-                            good_answers += 1
-                        else:
-                            bad_answers += 1
-                        break
-        
-        return question_analysis, good_answers, bad_answers
     def calculate_industry_average(self, category_scores: List[AssementResult]) -> float:
         """Calcular promedio de la industria"""
         if not category_scores:
@@ -0,0 +1,180 @@
+from domain.entities.question import Question
+from domain.entities.skill import Skill
+from domain.repositories.question_repository import QuestionRepository
+from domain.repositories.skill_repository import SkillRepository
+from domain.repositories.user_session_repository import UserSessionRepository
+from domain.repositories.generation_lease_repository import GenerationLeaseRepository
+from infrastructure.external_services.gemini_service import GeminiService
+from infrastructure.concurrency.single_flight import quiz_generation_flight
+from infrastructure.config.app_config import config
+from typing import Any, Dict, List, Optional
+
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Se activa en cuanto la pregunta 1 de un banco en streaming está guardada
+first_question_events: Dict[str, asyncio.Event] = {}
+
+class GenerateQuestionBankUseCase:
+    """
+    Generate the question bank of a skill at most once: concurrent callers in the
+    same worker share one in-flight generation and other workers wait on the
+    generation lease. Used both on demand and by the background worker pool.
+    """
+    def __init__(self, question_repository: QuestionRepository, gemini_service: GeminiService, skill_repository: SkillRepository,
+                 generation_lease_repository: GenerationLeaseRepository, user_session_repository: UserSessionRepository):
+        self.question_repository = question_repository
+        self.gemini_service = gemini_service
+        self.skill_repository = skill_repository
+        self.generation_lease_repository = generation_lease_repository
+        self.user_session_repository = user_session_repository
+
+    async def execute(self, skill: Skill) -> Optional[List[Question]]:
+        skill_id = str(skill.id)
+        # Una sola generación por skill: las peticiones concurrentes esperan y comparten el resultado
+        return await quiz_generation_flight.do(skill_id, lambda: self.generate_question_bank(skill))
+
+    async def execute_until_first_question(self, skill: Skill) -> Optional[int]:
+        """
+        Start (or join) the generation of a skill's bank and return as soon as
+        question 1 is stored. Returns how many questions the bank will offer the
+        session (the first ones streamed), or None if the generation failed.
+        """
+        skill_id = str(skill.id)
+        first_question = first_question_events.setdefault(skill_id, asyncio.Event())
+        generation = asyncio.ensure_future(self.execute(skill))
+        # La generación sigue en segundo plano; evitar avisos de excepción no recuperada
+        generation.add_done_callback(lambda task: task.cancelled() or task.exception())
+        first_question_wait = asyncio.ensure_future(first_question.wait())
+        try:
+            await asyncio.wait({generation, first_question_wait}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            first_question_wait.cancel()
+
+        if generation.done():
+            question_bank = generation.result()
+            return len(question_bank) if question_bank else None
+        return config.quiz_question_count
+
+    async def generate_question_bank(self, skill: Skill) -> Optional[List[Question]]:
+        """
+        Make sure the question bank of a skill exists, generating it at most once
+        across workers. Returns the bank, or None if it could not be generated.
+        """
+        skill_id = str(skill.id)
+        owner = self.generation_lease_repository.new_owner()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + config.generation_wait_timeout_seconds
+
+        try:
+            while True:
+                if await self.generation_lease_repository.acquire(skill_id, owner, config.generation_lease_ttl_seconds):
+                    heartbeat = asyncio.create_task(self.keep_lease_alive(skill_id, owner))
+                    try:
+                        # Otro worker pudo terminar la generación antes de que obtuviéramos el lease
+                        existing_bank = await self.question_repository.find_questions_by_skillid(skill_id)
+                        if len(existing_bank) >= config.quiz_question_count:
+                            await self.skill_repository.update_question_bank_status(skill_id, "ready")
+                            return existing_bank
+                        if existing_bank:
+                            # Banco parcial (p. ej. un streaming cortado antes de este cambio): regenerarlo
+                            await self.discard_partial_bank(skill_id, len(existing_bank))
+                        await self.skill_repository.update_question_bank_status(skill_id, "generating")
+                        if config.quiz_streaming_enabled:
+                            question_bank = await self.generate_and_stream_questions(skill)
+                        else:
+                            question_bank = await self.generate_and_store_questions(skill)
+                        await self.skill_repository.update_question_bank_status(skill_id, "ready" if question_bank else "failed")
+                        return question_bank
+                    finally:
+                        heartbeat.cancel()
+                        await self.generation_lease_repository.release(skill_id, owner)
+
+                # Otro worker está generando: esperar a que libere el lease (o a que caduque si se cayó)
+                if loop.time() >= deadline:
+                    return None
+                first_question = first_question_events.get(skill_id)
+                if first_question and not first_question.is_set():
+                    if await self.question_repository.find_question_by_skillid_and_number(skill_id, 1):
+                        first_question.set()
+                await asyncio.sleep(config.generation_poll_interval_seconds)
+        finally:
+            first_question_events.pop(skill_id, None)
+
+    async def keep_lease_alive(self, skill_id: str, owner: str):
+        interval = config.generation_lease_ttl_seconds / 3
+        while True:
+            await asyncio.sleep(interval)
+            if not await self.generation_lease_repository.renew(skill_id, owner, config.generation_lease_ttl_seconds):
+                return
+
+    async def generate_and_store_questions(self, skill: Skill) -> Optional[List[Question]]:
+        skill_id = str(skill.id)
+        # Banco compartido más grande que una sesión; cada sesión toma una muestra
+        generated_question = await self.gemini_service.generate_question_bank(skill.name, config.question_bank_size)
+
+        if not generated_question or "questions" not in generated_question:
+            return None
+        
+        questions_data = [
+            self.build_question_data(skill_id, i + 1, question)
+            for i, question in enumerate(generated_question["questions"])
+        ]
+        try:
+            return await self.question_repository.create_questions_bulk(questions_data)
+        except ValueError as e:
+            logger.error(f"Discarding generated quiz for skill {skill.name}: {e}")
+            return None
+
+    async def generate_and_stream_questions(self, skill: Skill) -> Optional[List[Question]]:
+        """Persist each question as soon as the streamed reply completes it."""
+        skill_id = str(skill.id)
+        question_bank: List[Question] = []
+        try:
+            async for generated in self.gemini_service.generate_quiz_stream(skill.name, config.question_bank_size):
+                number = len(question_bank) + 1
+                try:
+                    question = await self.question_repository.create_question(
+                        self.build_question_data(skill_id, number, generated)
+                    )
+                except ValueError as e:
+                    logger.error(f"Skipping invalid streamed question for skill {skill.name}: {e}")
+                    continue
+                question_bank.append(question)
+                if number == 1:
+                    first_question_events.setdefault(skill_id, asyncio.Event()).set()
+        except Exception as e:
+            logger.error(f"Quiz stream for skill {skill.name} failed after {len(question_bank)} questions: {e}")
+
+        if len(question_bank) < config.quiz_question_count:
+            # Un banco incompleto no se marca como listo: la siguiente petición lo regenera
+            if question_bank:
+                await self.discard_partial_bank(skill_id, len(question_bank))
+            return None
+        return question_bank
+
+    async def discard_partial_bank(self, skill_id: str, size: int):
+        """
+        Delete a bank with fewer than quiz_question_count questions and close the
+        sessions opened on it while it streamed: their questions no longer exist.
+        Bumping the bank version makes other workers drop their cached copy.
+        """
+        logger.warning(f"Discarding partial question bank of skill {skill_id} ({size} questions)")
+        await self.user_session_repository.abandon_open_sessions(skill_id)
+        await self.question_repository.delete_many_by_skillid(skill_id)
+        # Después del borrado: quien lea la versión nueva ya no puede cargar el banco descartado
+        await self.skill_repository.bump_question_bank_version(skill_id)
+
+    def build_question_data(self, skill_id: str, number: int, question: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "question_number": number,  # Número secuencial: 1, 2, 3, etc.
+            "skillid": skill_id,
+            "subcategory": question.get("subcategory"),
+            "type": question.get("type"),
+            "question": question.get("question"),
+            "options": question.get("options", []),
+            "correct_answer": question.get("correct_answer"),
+            "recommended_tools": question.get("recommended_tools", []) if number == 1 else None
+        }
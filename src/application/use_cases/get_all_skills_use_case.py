@@ -1,6 +1,8 @@
 from domain.entities.skill import Skill
 from domain.repositories.skill_repository import SkillRepository
-from presentation.schemas.get_all_skill_response_model import GetAllSkillResponseModel
+from domain.repositories.cursor_pagination import decode_cursor, encode_cursor
+from presentation.schemas.get_all_skill_response_model import GetAllSkillResponseModel, GetSkillsPageResponseModel
+from typing import Optional
 class GetAllSkillsUseCase:
     def __init__(self, skill_repository: SkillRepository):
         self.skill_repository = skill_repository
@@ -20,4 +22,18 @@ class GetAllSkillsUseCase:
             current_page=(skip // limit) + 1,
             limit=limit,
             skills=skills
-        )
\ No newline at end of file
+        )
+
+    async def execute_cursor(self, cursor: Optional[str] = None, limit: int = 10, include_total: bool = False) -> GetSkillsPageResponseModel:
+        """Keyset pagination on _id: no skip and, unless asked for, no count."""
+        after_id = decode_cursor(cursor)["id"] if cursor else None
+        skills, has_next_page = await self.skill_repository.find_skills_after(after_id, limit)
+
+        return GetSkillsPageResponseModel(
+            skills=skills,
+            limit=limit,
+            has_next_page=has_next_page,
+            next_cursor=encode_cursor(skills[-1].id) if has_next_page else None,
+            # Estimado a partir de los metadatos de la colección, sin recorrerla
+            estimated_total_skills=await self.skill_repository.estimated_count_skills() if include_total else None
+        )
@@ -2,6 +2,7 @@
 from domain.repositories.assement_feedback_repository import AssementFeedBackRepository
 from domain.repositories.skill_repository import SkillRepository
 from domain.repositories.user_session_repository import UserSessionRepository
+from domain.entities.assement_feedback import AssementFeedbackDetail
 import asyncio
 from typing import List
 from typing import Dict, Any
@@ -33,10 +34,14 @@ class GetFeedBackByIdUseCase:
         month_name = months_en.get(date_obj.month, "")
         
         return f"{day_name}, {month_name} {date_obj.day}, {date_obj.year}"
-    async def execute(self, feedback_id: str) -> Dict[str, Any]:
+    async def execute(self, feedback_id: str, include_analysis: bool = False) -> Dict[str, Any]:
         try:
-            feedback = await self.feedback_repository.get_feedback_by_id(feedback_id)
+            # Por defecto solo el resumen; el análisis por pregunta se pide explícitamente
+            feedback = await self.feedback_repository.get_feedback_summary_by_id(feedback_id)
             print(f"Feedback retrieved: {feedback}")
+            if feedback and include_analysis:
+                questions_analysis = await self.feedback_repository.get_questions_analysis(feedback_id)
+                feedback = AssementFeedbackDetail(**feedback.model_dump(), questions_analysis=questions_analysis)
             session= await self.user_session_repository.get_user_session_by_id(feedback.session_id)
             skill = await self.skill_repository.find_by_id(session.skill_id) if session else None
 
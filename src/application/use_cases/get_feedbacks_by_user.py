@@ -3,7 +3,8 @@ from domain.repositories.user_session_repository import UserSessionRepository
 from domain.repositories.assement_feedback_repository import AssementFeedBackRepository
 from domain.repositories.skill_repository import SkillRepository
 import asyncio
-from typing import List
+from typing import List, Optional
+from domain.repositories.cursor_pagination import InvalidCursorError, decode_cursor, encode_cursor
 from typing import Dict, Any
 
 from datetime import datetime
@@ -38,27 +39,19 @@ class GetFeedbacksByUser:
 
     async def execute(self, user_id: str,skip:int=0,limit:int=10) -> Dict[str, Any]:
           try:
-            user_sessions = await self.user_session_repository.get_session_finished_by_user_id(user_id, skip,limit)
-            total_count = await self.user_session_repository.get_session_finished_by_user_id_count(user_id)
+            # Sesiones, feedback, nombre del skill y total en una sola agregación
+            user_sessions, total_count = await self.user_session_repository.get_finished_sessions_with_feedback(user_id, skip, limit)
             total_pages = (total_count // limit) + (1 if total_count % limit > 0 else 0)
             feedbacks= []
             for session in user_sessions:
-                feedback = await self.feedback_repository.get_feedback_minimal_by_session_id(str(session.id))
-                if feedback:
-                    skill = await self.skill_repository.find_by_id(session.skill_id)
-
-
-                    feedbacks.append({
-                        "session_id": str(session.id),
-                        "user_id": session.user_id,
-                        "finished_at": self.beautiful_date(session.finished_at),
-                    
-                        "skill_name": skill.name if skill else "Unknown Skill",
-                        "feedback_id": feedback.get("id")
-
-
-                       
-                    })
+                feedbacks.append({
+                    "session_id": str(session["_id"]),
+                    "user_id": session["user_id"],
+                    "finished_at": self.beautiful_date(session.get("finished_at")),
+                
+                    "skill_name": session.get("skill_name", "Unknown Skill"),
+                    "feedback_id": str(session["feedback_id"])
+                })
 
             if not feedbacks:
                 return {
@@ -95,8 +88,40 @@ class GetFeedbacksByUser:
           except Exception as e:
              
              raise Exception(f"Error fetching user sessions: {str(e)}")
-        
-
 
-
-           
+    async def execute_cursor(self, user_id: str, cursor: Optional[str] = None, limit: int = 10,
+                             include_total: bool = False) -> Dict[str, Any]:
+        """Keyset pagination on (finished_at, _id), newest first; the total is only counted on request."""
+        try:
+            after = decode_cursor(cursor, with_finished_at=True) if cursor else None
+            user_sessions, has_next_page = await self.user_session_repository.get_finished_sessions_with_feedback_after(
+                user_id, after, limit
+            )
+            feedbacks = [
+                {
+                    "session_id": str(session["_id"]),
+                    "user_id": session["user_id"],
+                    "finished_at": self.beautiful_date(session.get("finished_at")),
+                    "skill_name": session.get("skill_name", "Unknown Skill"),
+                    "feedback_id": str(session["feedback_id"])
+                }
+                for session in user_sessions if "feedback_id" in session
+            ]
+            # El cursor apunta a la última sesión recorrida, tenga o no feedback
+            last_session = user_sessions[-1] if user_sessions else None
+            result = {
+                "message": "Feedbacks retrieved successfully" if feedbacks else "No feedbacks found for this user",
+                "feedbacks": feedbacks,
+                "limit": limit,
+                "has_next_page": has_next_page,
+                "next_cursor": encode_cursor(
+                    last_session["_id"], last_session.get("finished_at"), with_finished_at=True
+                ) if has_next_page else None
+            }
+            if include_total:
+                result["total_count"] = await self.user_session_repository.get_session_finished_by_user_id_count(user_id)
+            return result
+        except InvalidCursorError:
+            raise
+        except Exception as e:
+            raise Exception(f"Error fetching user sessions: {str(e)}")
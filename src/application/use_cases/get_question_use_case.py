@@ -8,8 +8,10 @@ class GetQuestionUseCase(BaseAssessmentUseCase):
       try:
          
       
-          session=await self.user_session_repository.get_user_session_by_id(question.id_session)
-          find_question=await self.question_repository.get_question_by_id(question.id_question)
+          # Proyecciones: ni el array de respuestas ni correct_answer salen de Mongo
+          session=await self.user_session_repository.get_session_progress(question.id_session)
+          if not session:
+                raise Exception("Session not found")
          
           if(session.is_finished):
                 raise Exception("Session is already finished")
@@ -19,15 +21,16 @@ class GetQuestionUseCase(BaseAssessmentUseCase):
             
           if(question.id_question < 1 or question.id_question > session.total_questions):
                 raise Exception("Invalid question ID")
-          if not session:
-                raise Exception("Session not found")
-         
+          # El id de la sesión es la posición; la pregunta real sale de la muestra del banco
+          find_question=await self.question_repository.find_question_view_by_skillid_and_number(
+                session.skill_id, session.bank_question_number(question.id_question)
+          )
           if not find_question:
                 raise Exception("Question not found")
           if not question:
             raise Exception("Question not found")
           return {
-            "id": find_question.question_number,
+            "id": question.id_question,
             "text": find_question.question,
             "options": find_question.options,
             "subcategory": find_question.subcategory,
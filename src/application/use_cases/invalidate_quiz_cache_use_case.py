@@ -0,0 +1,14 @@
+from typing import Optional, Dict, Any
+from infrastructure.external_services.gemini_service import GeminiService
+
+class InvalidateQuizCacheUseCase:
+    def __init__(self, gemini_service: GeminiService):
+        self.gemini_service = gemini_service
+
+    async def execute(self, skill_name: Optional[str] = None) -> Dict[str, Any]:
+        deleted = await self.gemini_service.quiz_cache.invalidate(skill_name)
+        return {
+            "deleted": deleted,
+            "skill_name": skill_name,
+            "cache": self.gemini_service.quiz_cache.stats()
+        }
@@ -0,0 +1,26 @@
+import asyncio
+
+from application.use_cases.evaluate_skill_assement_use_case import EvaluateSkillAssessment
+from infrastructure.concurrency.background_worker_pool import BackgroundWorkerPool
+from infrastructure.config.app_config import config
+
+class ScheduleFeedbackEvaluationUseCase:
+    """Queue the evaluation of a completed session so its feedback is ready before the client asks for it."""
+    def __init__(self, evaluate_skill_assessment: EvaluateSkillAssessment, worker_pool: BackgroundWorkerPool):
+        self.evaluate_skill_assessment = evaluate_skill_assessment
+        self.worker_pool = worker_pool
+
+    def schedule(self, session_id: str) -> bool:
+        # Si se rechaza, GET /feedback/{session_id} evalúa la sesión al momento
+        return self.worker_pool.submit(
+            f"feedback:{session_id}",
+            lambda: self.evaluate(session_id)
+        )
+
+    async def evaluate(self, session_id: str):
+        """Evaluate the session and retry publishing its points while they are unpublished."""
+        await self.evaluate_skill_assessment.execute(session_id)
+        for _ in range(config.feedback_points_publish_retries):
+            if await self.evaluate_skill_assessment.publish_pending_points(session_id):
+                return
+            await asyncio.sleep(config.feedback_points_publish_retry_delay_seconds)
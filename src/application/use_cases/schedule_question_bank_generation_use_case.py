@@ -0,0 +1,30 @@
+from domain.entities.skill import Skill
+from domain.repositories.skill_repository import SkillRepository
+from application.use_cases.generate_question_bank_use_case import GenerateQuestionBankUseCase
+from infrastructure.concurrency.background_worker_pool import BackgroundWorkerPool
+from typing import Dict, Any
+
+class ScheduleQuestionBankGenerationUseCase:
+    """Queue question bank generation on the background worker pool so users rarely wait on Gemini."""
+    def __init__(self, generate_question_bank_use_case: GenerateQuestionBankUseCase, skill_repository: SkillRepository,
+                 worker_pool: BackgroundWorkerPool):
+        self.generate_question_bank_use_case = generate_question_bank_use_case
+        self.skill_repository = skill_repository
+        self.worker_pool = worker_pool
+
+    def schedule(self, skill: Skill) -> bool:
+        return self.worker_pool.submit(
+            str(skill.id),
+            lambda: self.generate_question_bank_use_case.execute(skill)
+        )
+
+    async def execute(self, limit: int = 1000) -> Dict[str, Any]:
+        """Backfill: queue every skill whose question bank is still empty."""
+        skills = await self.skill_repository.find_skills_without_questions(limit=limit)
+        scheduled = [str(skill.id) for skill in skills if self.schedule(skill)]
+        return {
+            "skills_without_questions": len(skills),
+            "scheduled": len(scheduled),
+            "rejected": len(skills) - len(scheduled),
+            "skill_ids": scheduled
+        }
@@ -1,53 +1,39 @@
-
-
 from application.dto.answer_question_dto import AnswerQuestionDTO
 from application.use_cases.base_assement_use_case import BaseAssessmentUseCase
-from domain.entities.user_session import AnswerSessionModel
 
 class UpdateAnswerUseCase(BaseAssessmentUseCase):
 
     async def execute(self, question: AnswerQuestionDTO) -> dict:
         try:
-            session = await self.user_session_repository.get_user_session_by_id(question.id_session)
-            find_question = await self.question_repository.get_question_by_id(question.id_question)
-
-            if session.is_finished:
-                raise Exception("Session is already finished")
-            if session.user_id != question.id_user:
-                raise Exception("User ID does not match the session user ID")
-            if question.id_question < 1 or question.id_question > session.total_questions:
-                raise Exception("Invalid question ID")
-            if not session:
-                raise Exception("Session not found")
-            if question.id_question > session.actual_number_of_questions:
-                raise Exception("Question not answered yet")
-            if not find_question:
-                raise Exception("Question not found")
-
-            # Buscar y actualizar la respuesta existente
-            for i, answer in enumerate(session.answers):
-                if answer.id_question == question.id_question:
-                    # Crear nuevo objeto AnswerSessionModel con la respuesta actualizada
-                    updated_answer = AnswerSessionModel(
-                        id_question=question.id_question,
-                        answer=question.answer
-                    )
-                    session.answers[i] = updated_answer
-                    break
-            else:
-                # Si no se encontró la respuesta, significa que no ha sido respondida aún
-                raise Exception("Question not answered yet")
-            
-
-                
-            session = await self.user_session_repository.update_user_session(session)
-
+            # Una sola escritura posicional; la sesión solo se lee si no hubo coincidencia
+            answered = await self.user_session_repository.update_answer(
+                question.id_session, question.id_user, question.id_question, question.answer
+            )
+            if answered is None:
+                reason, status = await self.rejection_reason(question)
+                return {
+                    "matched": False,
+                    "message": reason,
+                    "status": status
+                }
 
             return {
+                "matched": True,
                 "message": "Answer updated successfully",
-                "session_id": str(session.id),
-                "current_question_number": session.actual_number_of_questions
+                "session_id": question.id_session,
+                "current_question_number": answered
             }
 
         except Exception as e:
             raise Exception(f"Error processing answer: {str(e)}")
+
+    async def rejection_reason(self, question: AnswerQuestionDTO) -> tuple[str, str]:
+        """Explain why update_answer did not match: 'not_found', 'forbidden' or 'conflict'."""
+        session = await self.user_session_repository.get_session_progress(question.id_session)
+        if not session:
+            return "Session not found", "not_found"
+        if session.user_id != question.id_user:
+            return "User ID does not match the session user ID", "forbidden"
+        if session.is_finished:
+            return "Session is already finished", "conflict"
+        return "Question not answered yet", "not_found"
@@ -1,6 +1,6 @@
-from beanie import Document
-from pydantic import BaseModel,Field
-from typing import List
+from beanie import Document, PydanticObjectId
+from pydantic import AliasChoices, BaseModel,Field
+from typing import List, Optional
 from datetime import datetime,timezone
 
 
@@ -27,8 +27,8 @@ class RecommendeToolsAndFrameWorks(BaseModel):
 
 
 class  AssementFeedback(Document):
-    user_id: str = Field( index=True, description="The ID of the user associated with the feedback")
-    session_id: str = Field( index=True, description="The ID of the session associated with the feedback")
+    user_id: str = Field( description="The ID of the user associated with the feedback")
+    session_id: str = Field( description="The ID of the session associated with the feedback")
     assement_result: float = Field( description="The overall score of the assessment")
     industry_avarage: float = Field( description="The average score of the industry")
     points_earned: float = Field( description="The points earned in the assessment")
@@ -36,11 +36,47 @@ class  AssementFeedback(Document):
     results: List[AssementResult] = Field( description="The results of the assessment")
     relevant_skills: List[RelevantSkillToFocusOn] = Field( description="Skills to focus on for improvement")
     recommended_tools: List[RecommendeToolsAndFrameWorks] = Field(  description="Tools and frameworks to assist learning")
-    questions_analysis: List[QuestionAnalysis] = Field(  description="Analysis of questions with user answers")
+    # Los feedbacks nuevos guardan el análisis en FeedbackQuestionsAnalysis; solo los antiguos lo llevan embebido
+    questions_analysis: Optional[List[QuestionAnalysis]] = Field( default=None, description="Analysis of questions with user answers")
     good_answers:float = Field( default=0, description="Number of good answers")
     bad_answers:float = Field( default=0, description="Number of bad answers")
+    # Los feedbacks anteriores al flag publicaron sus puntos al guardarse; los nuevos se guardan con False
+    points_published: bool = Field( default=True, description="Whether the points earned event was published")
+    points_publish_claimed_until: Optional[datetime] = Field( default=None, description="Lease of the worker publishing the points event")
     
     class Settings:
         name = "assement_feedback"
-      
-        
+        # No escribir questions_analysis=None en los feedbacks nuevos
+        keep_nulls = False
+
+
+class FeedbackQuestionsAnalysis(Document):
+    """Per-question analysis of a feedback, stored apart so the feedback documents stay small."""
+    id: PydanticObjectId = Field(..., description="The ID of the feedback this analysis belongs to")
+    session_id: str = Field( description="The ID of the session associated with the feedback")
+    questions_analysis: List[QuestionAnalysis] = Field( description="Analysis of questions with user answers")
+
+    class Settings:
+        name = "assement_feedback_analysis"
+
+
+class AssementFeedbackSummary(BaseModel):
+    """Projection of a feedback for the dashboard views: everything but the per-question analysis."""
+    # Se lee de "_id" (o "id") y se serializa como "_id", igual que el documento completo que devolvía la API
+    id: PydanticObjectId = Field(validation_alias=AliasChoices("_id", "id"), serialization_alias="_id")
+    user_id: str
+    session_id: str
+    assement_result: float
+    industry_avarage: float
+    points_earned: float
+    created_at: datetime
+    results: List[AssementResult]
+    relevant_skills: List[RelevantSkillToFocusOn]
+    recommended_tools: List[RecommendeToolsAndFrameWorks]
+    good_answers: float = 0
+    bad_answers: float = 0
+
+
+class AssementFeedbackDetail(AssementFeedbackSummary):
+    """Summary plus the per-question analysis, only built when a client asks for it."""
+    questions_analysis: List[QuestionAnalysis] = []
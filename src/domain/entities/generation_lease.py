@@ -0,0 +1,14 @@
+from beanie import Document
+from pydantic import Field
+from datetime import datetime,timezone
+
+
+class GenerationLease(Document):
+    """Expiring lock marking the worker that is generating the question bank of a skill."""
+    id: str = Field(..., description="The ID of the skill whose question bank is being generated")
+    owner: str = Field(..., description="Identifier of the worker holding the lease")
+    acquired_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    expires_at: datetime = Field(..., description="The lease is free once this timestamp has passed")
+
+    class Settings:
+        name = "generation_leases"
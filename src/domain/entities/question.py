@@ -1,14 +1,14 @@
 from beanie import Document
-from pydantic import Field
+from pydantic import BaseModel, Field
 from typing import List,Optional
 from datetime import datetime,timezone
 
 
 
 class Question(Document):
-    question_number: int = Field(..., index=True, description="Sequential number of the question (1, 2, 3, etc.)")
-    skillid:str= Field( index=True, description="The ID of the skill associated with the question")
-    subcategory: str = Field(..., index=True, description="The subcategory of the question")
+    question_number: int = Field(..., description="Sequential number of the question (1, 2, 3, etc.)")
+    skillid:str= Field( description="The ID of the skill associated with the question")
+    subcategory: str = Field(..., description="The subcategory of the question")
     type: str = Field(..., description="The type of the question (e.g., multiple choice)")
     question: str = Field(..., description="The text of the question")
     options: List[str] = Field(..., description="List of options for the question")
@@ -18,12 +18,22 @@ class Question(Document):
     recommended_tools: Optional[List[str]] = Field(default=None, description="List of recommended tools related to the question")
     class Settings:
         collection = "questions"
-        indexes = [
-            [("skillid", 1), ("question_number", 1)],  # Índice compuesto para skillid + question_number
-            [("subcategory", 1)],
-            [("type", 1)],
-            [("question", 1)]
-        ]
+
+
+class QuestionView(BaseModel):
+    """Projection of a question as shown to the user: never carries ``correct_answer``."""
+    question_number: int
+    subcategory: str
+    type: str
+    question: str
+    options: List[str]
+    recommended_tools: Optional[List[str]] = None
+
+
+class QuestionBankIndex(BaseModel):
+    """Projection of a bank question with just what session sampling needs."""
+    question_number: int
+    subcategory: str
 
 
 
@@ -0,0 +1,20 @@
+from beanie import Document
+from pydantic import Field
+from typing import Any, Dict
+from datetime import datetime,timezone
+
+
+class QuizCacheEntry(Document):
+    """Parsed quiz generation stored by content key so recreated or alias skills skip Gemini."""
+    id: str = Field(..., description="Hash of the normalized skill name, model and prompt template")
+    skill_name: str = Field(..., description="Normalized skill name the quiz was generated for")
+    model: str = Field(..., description="Gemini model that generated the quiz")
+    prompt_hash: str = Field(..., description="Hash of the prompt template used")
+    quiz: Dict[str, Any] = Field(..., description="Parsed quiz as returned by the generation")
+    hits: int = Field(0, description="Number of times the entry was served")
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    last_hit_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    expires_at: datetime = Field(..., description="Mongo removes the entry after this timestamp")
+
+    class Settings:
+        name = "quiz_generation_cache"
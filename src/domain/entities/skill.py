@@ -1,5 +1,5 @@
 from beanie import Document
-from pydantic import Field
+from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import datetime,timezone
 
@@ -9,13 +9,13 @@ class Skill(Document):
     description: Optional[str] = Field(None, description="A brief description of the skill")
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: Optional[datetime] = Field(None, description="The last time the skill was updated")
+    question_bank_status: str = Field("pending", description="Status of the question bank: 'pending', 'generating', 'ready' or 'failed'")
+    question_bank_version: int = Field(0, description="Incremented every time the question bank is discarded")
     
     class Settings:
         name="skills"
-       
 
-        
-       
-        
-    
-   
+
+class SkillBankVersionView(BaseModel):
+    """Projection of a skill with just its question bank version."""
+    question_bank_version: int = 0
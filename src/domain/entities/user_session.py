@@ -1,4 +1,4 @@
-from beanie import Document
+from beanie import Document, PydanticObjectId
 from pydantic import BaseModel
 from pydantic import Field
 from typing import Optional,Dict,List
@@ -9,12 +9,20 @@ class AnswerSessionModel(BaseModel):
    
     answer: str
 
+def map_bank_question_number(question_numbers: List[int], position: int) -> int:
+    """Map a session question id (1..total_questions) to the skill bank's question number."""
+    # Las sesiones anteriores al banco compartido usan las preguntas 1..N del banco
+    if question_numbers and 0 < position <= len(question_numbers):
+        return question_numbers[position - 1]
+    return position
+
 class UserSession(Document):
-    user_id:str= Field(index=True, description="The ID of the user associated with the session")
-    skill_id:str= Field(index=True, description="The ID of the skill being assessed in the session")
+    user_id:str= Field(description="The ID of the user associated with the session")
+    skill_id:str= Field(description="The ID of the skill being assessed in the session")
     answers:Optional[List[AnswerSessionModel]] = Field(default=[], description="List of answers provided by the user")
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     total_questions: int = Field(0, description="Total number of questions in the session")
+    question_numbers: List[int] = Field(default_factory=list, description="Bank question numbers sampled for the session, in the order they are asked")
     
     percentage: Optional[float] = Field(None, description="Percentage score of the session")
     is_finished: bool = Field(False, description="Indicates if the session is finished")
@@ -22,7 +30,25 @@ class UserSession(Document):
     finished_at: Optional[datetime] = Field(None, description="Timestamp when the session was finished")
     status: str = Field("in_progress", description="Status of the session, e.g., 'in_progress', 'completed', 'abandoned'")
     updated_at: Optional[datetime] = Field(default_factory=lambda: datetime.now(timezone.utc), description="Timestamp when the session was last updated")
+
+    def bank_question_number(self, position: int) -> int:
+        return map_bank_question_number(self.question_numbers, position)
+
     class Settings:
         name="user_sessions"
+
+
+class SessionProgressView(BaseModel):
+    """Projection of a session for the question and answer flows: no answers array."""
+    id: PydanticObjectId = Field(alias="_id")
+    user_id: str
+    skill_id: str
+    is_finished: bool
+    total_questions: int
+    actual_number_of_questions: int
+    question_numbers: List[int] = []
+
+    def bank_question_number(self, position: int) -> int:
+        return map_bank_question_number(self.question_numbers, position)
        
         
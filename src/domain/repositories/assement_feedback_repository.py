@@ -1,18 +1,81 @@
 
-from typing import Dict, Optional,List
-from domain.entities.assement_feedback import AssementFeedback
+from typing import Dict, Optional,List,Tuple
+from beanie import PydanticObjectId
+from beanie.odm.utils.dump import get_dict
+from beanie.odm.utils.projection import get_projection
+from pymongo.errors import DuplicateKeyError
+from pymongo.read_preferences import _ServerMode
+from domain.entities.assement_feedback import AssementFeedback, AssementFeedbackSummary, FeedbackQuestionsAnalysis, QuestionAnalysis
 
 from domain.repositories.base_repository import BaseRepository
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 class AssementFeedBackRepository(BaseRepository[AssementFeedback]):
-    def __init__(self):
-        super().__init__(AssementFeedback)
-    async def create_feedback(self, feedback: AssementFeedback) -> AssementFeedback:
-      
-        return await self.create(feedback)
+    def __init__(self, read_preference: Optional[_ServerMode] = None):
+        super().__init__(AssementFeedback, read_preference)
+    async def create_feedback(self, feedback: AssementFeedback) -> Tuple[AssementFeedback, bool]:
+        """
+        Store the feedback of a session unless the session already has one.
+        The upsert on the unique session_id index keeps the first write; returns the
+        stored feedback and whether this call created it. The per-question analysis
+        goes to its own collection, written first under the feedback's id so a stored
+        feedback always has its analysis. A created feedback still carries it in memory.
+        """
+        questions_analysis = feedback.questions_analysis or []
+        feedback.id = feedback.id or PydanticObjectId()
+        # Outbox: el ganador publica los puntos y luego marca el flag (ver claim_points_publication)
+        feedback.points_published = False
+        await FeedbackQuestionsAnalysis(
+            id=feedback.id, session_id=feedback.session_id, questions_analysis=questions_analysis
+        ).insert()
+        document = get_dict(feedback, to_db=True, exclude={"questions_analysis"}, keep_nulls=False)
+        try:
+            result = await AssementFeedback.get_motor_collection().update_one(
+                {"session_id": feedback.session_id}, {"$setOnInsert": document}, upsert=True
+            )
+            created = result.upserted_id is not None
+        except DuplicateKeyError:
+            # Otra petición insertó a la vez y ganó
+            created = False
+        if created:
+            return feedback, True
+
+        # Perdedor: quitar su análisis huérfano y devolver el feedback que ya existe
+        await FeedbackQuestionsAnalysis.get_motor_collection().delete_one({"_id": feedback.id})
+        return await self.get_feedback_by_session_id(feedback.session_id), False
+
+    async def claim_points_publication(self, feedback_id: str, lease_seconds: float) -> bool:
+        """
+        Take the right to publish the points event of a feedback whose points are not
+        published yet. The claim expires after ``lease_seconds`` so a worker that dies
+        mid-publish does not block the retries. Returns whether this call got it.
+        """
+        now = datetime.now(timezone.utc)
+        result = await AssementFeedback.get_motor_collection().update_one(
+            {
+                "_id": PydanticObjectId(feedback_id),
+                "points_published": False,
+                "$or": [
+                    {"points_publish_claimed_until": None},
+                    {"points_publish_claimed_until": {"$lt": now}}
+                ]
+            },
+            {"$set": {"points_publish_claimed_until": now + timedelta(seconds=lease_seconds)}}
+        )
+        return result.modified_count == 1
+
+    async def mark_points_published(self, feedback_id: str) -> None:
+        await AssementFeedback.get_motor_collection().update_one(
+            {"_id": PydanticObjectId(feedback_id)},
+            {"$set": {"points_published": True}, "$unset": {"points_publish_claimed_until": ""}}
+        )
+
+    async def release_points_publication(self, feedback_id: str) -> None:
+        """Drop a claim after a failed publish so the next read or retry can publish."""
+        await AssementFeedback.get_motor_collection().update_one(
+            {"_id": PydanticObjectId(feedback_id), "points_published": False},
+            {"$unset": {"points_publish_claimed_until": ""}}
+        )
 
-    
-    
     async def get_feedback_by_id(self, feedback_id: str) -> Optional[AssementFeedback]:
         """Obtener feedback por ID"""
         try:
@@ -21,6 +84,30 @@ class AssementFeedBackRepository(BaseRepository[AssementFeedback]):
            
             return None
 
+    async def get_feedback_summary_by_id(self, feedback_id: str) -> Optional[AssementFeedbackSummary]:
+        """Feedback without the per-question analysis, also for feedbacks that still embed it."""
+        try:
+            object_id = PydanticObjectId(feedback_id)
+        except Exception:
+            return None
+        projection = get_projection(AssementFeedbackSummary)
+        document = await self.read_collection().find_one({"_id": object_id}, projection)
+        if document is None and self.read_preference is not None:
+            # Puede que aún no se haya replicado al secundario: confirmar en el primario
+            document = await AssementFeedback.get_motor_collection().find_one({"_id": object_id}, projection)
+        return AssementFeedbackSummary.model_validate(document) if document else None
+
+    async def get_questions_analysis(self, feedback_id: str) -> List[QuestionAnalysis]:
+        """Per-question analysis of a feedback, from its own collection or, for older feedbacks, embedded."""
+        object_id = PydanticObjectId(feedback_id)
+        analysis = await FeedbackQuestionsAnalysis.get(object_id)
+        if analysis:
+            return analysis.questions_analysis
+        legacy = await AssementFeedback.get_motor_collection().find_one(
+            {"_id": object_id}, {"_id": 0, "questions_analysis": 1}
+        )
+        return [QuestionAnalysis.model_validate(item) for item in (legacy or {}).get("questions_analysis") or []]
+
     async def get_feedback_by_session_id(self, session_id: str) -> Optional[AssementFeedback]:
         
         return await AssementFeedback.find_one(AssementFeedback.session_id == session_id)
@@ -1,14 +1,21 @@
 from abc import ABC
-from typing import TypeVar,Generic,Optional,List
-from beanie import Document
+from typing import TypeVar,Generic,Optional,List,Tuple
+from beanie import Document, PydanticObjectId
+from pymongo.read_preferences import _ServerMode
 from datetime import datetime
 T = TypeVar('T', bound=Document)
 
 class BaseRepository(Generic[T], ABC):
     
     
-    def __init__(self, model_class: type[T]):
+    def __init__(self, model_class: type[T], read_preference: Optional[_ServerMode] = None):
         self.model_class = model_class
+        self.read_preference = read_preference
+    
+    def read_collection(self):
+        """Collection for reads, routed with the repository's read preference when it has one."""
+        collection = self.model_class.get_motor_collection()
+        return collection.with_options(read_preference=self.read_preference) if self.read_preference else collection
     
     async def create(self, entity: T) -> T:
         
@@ -17,12 +24,28 @@ class BaseRepository(Generic[T], ABC):
     
     async def find_by_id(self, entity_id: str) -> Optional[T]:
         
-        return await self.model_class.get(entity_id)
+        if self.read_preference is None:
+            return await self.model_class.get(entity_id)
+        document = await self.read_collection().find_one({"_id": PydanticObjectId(entity_id)})
+        if document is None:
+            # Puede que aún no se haya replicado al secundario: confirmar en el primario
+            return await self.model_class.get(entity_id)
+        return self.model_class.model_validate(document)
     
     async def find_all(self, limit: int = 100, skip: int = 0) -> List[T]:
        
         return await self.model_class.find().skip(skip).limit(limit).to_list()
     
+    async def find_after(self, after_id: Optional[PydanticObjectId], limit: int = 100) -> Tuple[List[T], bool]:
+        """Keyset page ordered by _id: the items after ``after_id`` and whether more follow."""
+        query = self.model_class.find({"_id": {"$gt": after_id}}) if after_id else self.model_class.find()
+        items = await query.sort("+_id").limit(limit + 1).to_list()
+        return items[:limit], len(items) > limit
+    
+    async def estimated_count(self) -> int:
+        
+        return await self.model_class.get_motor_collection().estimated_document_count()
+    
     async def update(self, entity: T) -> T:
        
         entity.updated_at = datetime.utcnow()
@@ -0,0 +1,31 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from beanie import PydanticObjectId
+
+
+class InvalidCursorError(ValueError):
+    """The cursor was not produced by this service or has been tampered with."""
+
+
+def encode_cursor(last_id: PydanticObjectId, finished_at: Optional[datetime] = None, with_finished_at: bool = False) -> str:
+    """Opaque keyset cursor for ``_id`` or ``(finished_at, _id)`` ordering."""
+    payload: Dict[str, Any] = {"id": str(last_id)}
+    if with_finished_at:
+        payload["finished_at"] = finished_at.isoformat() if finished_at else None
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, with_finished_at: bool = False) -> Dict[str, Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        decoded: Dict[str, Any] = {"id": PydanticObjectId(payload["id"])}
+        if with_finished_at:
+            finished_at = payload["finished_at"]
+            decoded["finished_at"] = datetime.fromisoformat(finished_at) if finished_at else None
+        return decoded
+    except Exception as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
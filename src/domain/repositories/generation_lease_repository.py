@@ -0,0 +1,59 @@
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from pymongo.errors import DuplicateKeyError
+
+from domain.entities.generation_lease import GenerationLease
+from domain.repositories.base_repository import BaseRepository
+
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+
+class GenerationLeaseRepository(BaseRepository[GenerationLease]):
+    def __init__(self):
+        super().__init__(GenerationLease)
+
+    def new_owner(self) -> str:
+        return f"{WORKER_ID}:{uuid.uuid4().hex}"
+
+    async def acquire(self, skill_id: str, owner: str, ttl_seconds: float) -> bool:
+        """
+        Take the lease for a skill if it is free or expired.
+
+        The upsert only matches an expired lease; when a live one exists the insert
+        collides on ``_id`` and Mongo rejects it, so exactly one worker wins.
+        """
+        now = datetime.now(timezone.utc)
+        try:
+            await GenerationLease.get_motor_collection().update_one(
+                {"_id": skill_id, "expires_at": {"$lt": now}},
+                {"$set": {
+                    "owner": owner,
+                    "acquired_at": now,
+                    "expires_at": now + timedelta(seconds=ttl_seconds),
+                }},
+                upsert=True,
+            )
+            return True
+        except DuplicateKeyError:
+            return False
+
+    async def renew(self, skill_id: str, owner: str, ttl_seconds: float) -> bool:
+        result = await GenerationLease.get_motor_collection().update_one(
+            {"_id": skill_id, "owner": owner},
+            {"$set": {"expires_at": datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)}},
+        )
+        return result.matched_count == 1
+
+    async def release(self, skill_id: str, owner: str) -> bool:
+        result = await GenerationLease.get_motor_collection().delete_one({"_id": skill_id, "owner": owner})
+        return result.deleted_count == 1
+
+    async def is_held(self, skill_id: str) -> bool:
+        lease = await GenerationLease.get_motor_collection().find_one(
+            {"_id": skill_id, "expires_at": {"$gte": datetime.now(timezone.utc)}},
+            projection={"_id": 1},
+        )
+        return lease is not None
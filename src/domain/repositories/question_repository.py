@@ -1,5 +1,7 @@
 from typing import Dict, Optional,List
-from domain.entities.question import Question
+from beanie import PydanticObjectId
+from pydantic import ValidationError
+from domain.entities.question import Question, QuestionBankIndex, QuestionView
 from domain.repositories.base_repository import BaseRepository
 from datetime import datetime
 class QuestionRepository(BaseRepository[Question]):
@@ -22,17 +24,60 @@ class QuestionRepository(BaseRepository[Question]):
         await question.insert()
         return question
 
+    async def create_questions_bulk(self, questions_data: List[Dict]) -> List[Question]:
+        """
+        Insert a whole question bank with a single ordered insert_many.
+        Every question is validated before anything is written, so a bad item
+        never leaves a partial bank behind.
+        """
+        questions: List[Question] = []
+        errors: List[str] = []
+        now = datetime.now()
+        for question_data in sorted(questions_data, key=lambda data: data.get("question_number") or 0):
+            try:
+                questions.append(Question(
+                    id=PydanticObjectId(),
+                    question_number=question_data.get("question_number"),
+                    skillid=question_data.get("skillid"),
+                    subcategory=question_data.get("subcategory"),
+                    type=question_data.get("type"),
+                    question=question_data.get("question"),
+                    options=question_data.get("options", []),
+                    correct_answer=question_data.get("correct_answer"),
+                    created_at=now,
+                    updated_at=None,
+                    recommended_tools=question_data.get("recommended_tools")
+                ))
+            except ValidationError as e:
+                errors.append(f"question {question_data.get('question_number')}: {e.error_count()} invalid fields")
+        if errors:
+            raise ValueError(f"Invalid question bank: {'; '.join(errors)}")
+        if questions:
+            await self.model_class.insert_many(questions, ordered=True)
+        return questions
+
     async def get_question_by_skillid(self,skillId: str) -> Optional[List[Question]]:
         return await self.model_class.find(Question.skillid ==skillId )
     
-    async def get_question_by_id(self, question_id: int) -> Optional[Question]:
-        return await self.model_class.find_one(Question.question_number == question_id)
-    
     async def find_question_by_skillid_and_number(self, skill_id: str, number: int) -> Optional[Question]:
         return await self.model_class.find_one(Question.skillid == skill_id, Question.question_number == number)
     
     async def find_questions_by_skillid(self, skill_id: str) -> Optional[List[Question]]:
         return await self.model_class.find(Question.skillid == skill_id).sort(Question.question_number).to_list()
+
+    async def find_question_view_by_skillid_and_number(self, skill_id: str, number: int) -> Optional[QuestionView]:
+        return await self.model_class.find_one(
+            Question.skillid == skill_id, Question.question_number == number
+        ).project(QuestionView)
+
+    async def find_questions_by_skillid_and_numbers(self, skill_id: str, numbers: List[int]) -> List[Question]:
+        return await self.model_class.find(
+            Question.skillid == skill_id, {"question_number": {"$in": numbers}}
+        ).to_list()
+
+    async def find_bank_index(self, skill_id: str) -> List[QuestionBankIndex]:
+        return await self.model_class.find(Question.skillid == skill_id).project(QuestionBankIndex).to_list()
+
     async def count_questions_by_skillid(self, skill_id: str) -> int:
         count = await self.model_class.find(Question.skillid == skill_id).count()
         return count if count is not None else 0
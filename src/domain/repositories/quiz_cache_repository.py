@@ -0,0 +1,51 @@
+from typing import Any, Dict, Optional
+from datetime import datetime, timedelta, timezone
+
+from domain.entities.quiz_cache_entry import QuizCacheEntry
+from domain.repositories.base_repository import BaseRepository
+
+
+class QuizCacheRepository(BaseRepository[QuizCacheEntry]):
+    def __init__(self):
+        super().__init__(QuizCacheEntry)
+
+    async def get_and_touch(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached quiz and record the hit in the same round trip."""
+        entry = await QuizCacheEntry.get_motor_collection().find_one_and_update(
+            {"_id": key, "expires_at": {"$gt": datetime.now(timezone.utc)}},
+            {"$inc": {"hits": 1}, "$set": {"last_hit_at": datetime.now(timezone.utc)}},
+            projection={"quiz": 1},
+        )
+        return entry["quiz"] if entry else None
+
+    async def put(self, key: str, skill_name: str, model: str, prompt_hash: str, quiz: Dict[str, Any], ttl_seconds: float) -> None:
+        now = datetime.now(timezone.utc)
+        await QuizCacheEntry.get_motor_collection().update_one(
+            {"_id": key},
+            {"$set": {
+                "skill_name": skill_name,
+                "model": model,
+                "prompt_hash": prompt_hash,
+                "quiz": quiz,
+                "hits": 0,
+                "created_at": now,
+                "last_hit_at": now,
+                "expires_at": now + timedelta(seconds=ttl_seconds),
+            }},
+            upsert=True,
+        )
+
+    async def evict_to_size(self, max_entries: int) -> int:
+        """Delete the least recently used entries beyond ``max_entries``."""
+        collection = QuizCacheEntry.get_motor_collection()
+        excess = await collection.estimated_document_count() - max_entries
+        if excess <= 0:
+            return 0
+        oldest = await collection.find({}, {"_id": 1}).sort("last_hit_at", 1).limit(excess).to_list(length=excess)
+        result = await collection.delete_many({"_id": {"$in": [doc["_id"] for doc in oldest]}})
+        return result.deleted_count
+
+    async def invalidate(self, skill_name: Optional[str] = None) -> int:
+        query = {"skill_name": skill_name} if skill_name else {}
+        result = await QuizCacheEntry.get_motor_collection().delete_many(query)
+        return result.deleted_count
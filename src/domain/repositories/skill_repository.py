@@ -1,5 +1,7 @@
-from typing import List, Optional
-from domain.entities.skill import Skill
+from typing import List, Optional, Tuple
+from beanie import PydanticObjectId
+from domain.entities.skill import Skill, SkillBankVersionView
+from domain.entities.question import Question
 from domain.repositories.base_repository import BaseRepository
 
 class SkillRepository(BaseRepository[Skill]):
@@ -7,8 +9,12 @@ class SkillRepository(BaseRepository[Skill]):
         super().__init__(Skill)
     async def find_all_skills(self, limit: int = 10, skip: int = 0) -> List[Skill]:
         return await self.find_all(limit, skip)
+    async def find_skills_after(self, after_id: Optional[PydanticObjectId], limit: int = 10) -> Tuple[List[Skill], bool]:
+        return await self.find_after(after_id, limit)
     async def count_skills(self) -> int:
         return await self.count()
+    async def estimated_count_skills(self) -> int:
+        return await self.estimated_count()
     async def create_skill(self, skill: Skill) -> Skill:
         exiting_skill = await self.find_by_name(skill.name)
         if exiting_skill:
@@ -28,3 +34,32 @@ class SkillRepository(BaseRepository[Skill]):
         return await self.find_by_id(skill_id)
     async def find_by_name(self, name: str) -> Optional[Skill]:
         return await self.model_class.find_one(Skill.name == name)
+    async def update_question_bank_status(self, skill_id: str, status: str) -> None:
+        await self.model_class.find_one(Skill.id == PydanticObjectId(skill_id)).update(
+            {"$set": {"question_bank_status": status}}
+        )
+    async def bump_question_bank_version(self, skill_id: str) -> None:
+        await self.model_class.find_one(Skill.id == PydanticObjectId(skill_id)).update(
+            {"$inc": {"question_bank_version": 1}}
+        )
+    async def find_question_bank_version(self, skill_id: str) -> Optional[int]:
+        view = await self.model_class.find_one(Skill.id == PydanticObjectId(skill_id)).project(SkillBankVersionView)
+        return view.question_bank_version if view else None
+    async def find_skills_without_questions(self, limit: int = 1000) -> List[Skill]:
+        pipeline = [
+            {"$lookup": {
+                # Beanie ignora Question.Settings.collection: usar el nombre real de la colección
+                "from": Question.get_collection_name(),
+                "let": {"skill_id": {"$toString": "$_id"}},
+                "pipeline": [
+                    {"$match": {"$expr": {"$eq": ["$skillid", "$$skill_id"]}}},
+                    {"$limit": 1},
+                    {"$project": {"_id": 1}}
+                ],
+                "as": "first_question"
+            }},
+            {"$match": {"first_question": {"$size": 0}}},
+            {"$project": {"first_question": 0}},
+            {"$limit": limit}
+        ]
+        return await self.model_class.aggregate(pipeline, projection_model=Skill).to_list()
@@ -1,30 +1,199 @@
-from typing import List, Optional
-from domain.entities.user_session import UserSession
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timezone
+from beanie import PydanticObjectId
+from beanie.odm.utils.projection import get_projection
+from pymongo import ReturnDocument
+from pymongo.read_preferences import _ServerMode
+from domain.entities.user_session import UserSession, SessionProgressView
+from domain.entities.assement_feedback import AssementFeedback
+from domain.entities.skill import Skill
 
 from domain.repositories.base_repository import BaseRepository
 
 
 class UserSessionRepository(BaseRepository[UserSession]):
-    def __init__(self):
-        super().__init__(UserSession)
+    def __init__(self, read_preference: Optional[_ServerMode] = None):
+        super().__init__(UserSession, read_preference)
 
     async def create_user_session(self, user_session: UserSession) -> UserSession:
         return await self.create(user_session)
 
     async def get_user_session_by_id(self, session_id: str) -> Optional[UserSession]:
         return await self.find_by_id(session_id)
+    async def get_session_progress(self, session_id: str) -> Optional[SessionProgressView]:
+        """Session fields the question and answer flows check, without the answers array."""
+        return await UserSession.find_one(UserSession.id == PydanticObjectId(session_id)).project(SessionProgressView)
     async def get_session_finished_by_user_id(self, user_id: str,  skip: int, limit: int) -> List[UserSession]:
         return await UserSession.find(
             UserSession.user_id == user_id, 
-            UserSession.is_finished == True
+            UserSession.is_finished == True,
+            UserSession.status == "completed"
         ).skip(skip).limit(limit).to_list()
     async def get_session_finished_by_user_id_count(self, user_id: str) -> int:
-        count = await UserSession.find(
-            UserSession.user_id == user_id, 
-            UserSession.is_finished == True
-        ).count()
+        count = await self.read_collection().count_documents({"user_id": user_id, "is_finished": True, "status": "completed"})
         return count if count is not None else 0
-    
+
+    def history_lookup_stages(self) -> List[Dict[str, Any]]:
+        """Stages adding the feedback id and skill name to each finished session."""
+        return [
+            {"$lookup": {
+                "from": AssementFeedback.get_collection_name(),
+                "let": {"session_id": {"$toString": "$_id"}},
+                "pipeline": [
+                    {"$match": {"$expr": {"$eq": ["$session_id", "$$session_id"]}}},
+                    {"$limit": 1},
+                    {"$project": {"_id": 1}}
+                ],
+                "as": "feedback"
+            }},
+            {"$lookup": {
+                "from": Skill.get_collection_name(),
+                "let": {"skill_id": {"$convert": {"input": "$skill_id", "to": "objectId", "onError": None, "onNull": None}}},
+                "pipeline": [
+                    {"$match": {"$expr": {"$eq": ["$_id", "$$skill_id"]}}},
+                    {"$project": {"_id": 0, "name": 1}}
+                ],
+                "as": "skill"
+            }},
+            {"$project": {
+                "user_id": 1,
+                "finished_at": 1,
+                "feedback_id": {"$arrayElemAt": ["$feedback._id", 0]},
+                "skill_name": {"$arrayElemAt": ["$skill.name", 0]}
+            }}
+        ]
+
+    async def get_finished_sessions_with_feedback(self, user_id: str, skip: int, limit: int) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        One aggregation for the feedback history page: the finished sessions of the
+        page with their feedback id and skill name, plus the total count.
+        Sessions of the page without feedback are left out, as before.
+        """
+        pipeline = [
+            # Las sesiones abandonadas (banco descartado) también están terminadas pero no cuentan
+            {"$match": {"user_id": user_id, "is_finished": True, "status": "completed"}},
+            {"$facet": {
+                "total": [{"$count": "count"}],
+                "page": [
+                    {"$skip": skip},
+                    {"$limit": limit},
+                    *self.history_lookup_stages(),
+                    {"$match": {"feedback_id": {"$exists": True}}}
+                ]
+            }}
+        ]
+        result = await self.read_collection().aggregate(pipeline).to_list(length=1)
+        facets = result[0] if result else {"total": [], "page": []}
+        total_count = facets["total"][0]["count"] if facets["total"] else 0
+        return facets["page"], total_count
+
+    async def get_finished_sessions_with_feedback_after(self, user_id: str, after: Optional[Dict[str, Any]],
+                                                        limit: int) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Keyset page of the feedback history, newest first on ``(finished_at, _id)``.
+        ``after`` is the decoded cursor of the last session of the previous page.
+        Sessions without feedback are returned too (without ``feedback_id``) so the
+        caller can build the next cursor from the last session scanned.
+        """
+        match: Dict[str, Any] = {"user_id": user_id, "is_finished": True, "status": "completed"}
+        if after:
+            if after["finished_at"] is None:
+                # Los nulos van al final en orden descendente
+                match.update({"finished_at": None, "_id": {"$lt": after["id"]}})
+            else:
+                match["$or"] = [
+                    {"finished_at": {"$lt": after["finished_at"]}},
+                    {"finished_at": None},
+                    {"finished_at": after["finished_at"], "_id": {"$lt": after["id"]}}
+                ]
+        pipeline = [
+            {"$match": match},
+            {"$sort": {"finished_at": -1, "_id": -1}},
+            {"$limit": limit + 1},
+            *self.history_lookup_stages()
+        ]
+        sessions = await self.read_collection().aggregate(pipeline).to_list(length=None)
+        return sessions[:limit], len(sessions) > limit
+
+    async def abandon_open_sessions(self, skill_id: str) -> int:
+        """
+        Close the open sessions of a skill whose question bank was discarded. They
+        end as 'abandoned', never 'completed': they are not evaluated and do not
+        appear in the feedback history.
+        """
+        result = await UserSession.find(
+            UserSession.skill_id == skill_id,
+            UserSession.is_finished == False
+        ).update({"$set": {
+            "is_finished": True,
+            "finished_at": datetime.now(timezone.utc),
+            "status": "abandoned"
+        }})
+        return result.modified_count if result else 0
+
+    async def record_answer(self, session_id: str, user_id: str, question_id: int, answer: str) -> Optional[SessionProgressView]:
+        """
+        Record an answer with a single conditional find_one_and_update. The same
+        write completes the session when it was the last answer, so a session
+        never ends up fully answered but unfinished.
+        Returns the updated session progress (without the answers array), or None when the session is missing, finished,
+        owned by another user, full, or the question is out of range or already answered.
+        """
+        if question_id < 1:
+            return None
+        now = datetime.now(timezone.utc)
+        is_complete = {"$gte": ["$actual_number_of_questions", "$total_questions"]}
+        updated = await UserSession.get_motor_collection().find_one_and_update(
+            {
+                "_id": PydanticObjectId(session_id),
+                "user_id": user_id,
+                "is_finished": False,
+                "total_questions": {"$gte": question_id},
+                "answers.id_question": {"$ne": question_id},
+                "$expr": {"$lt": ["$actual_number_of_questions", "$total_questions"]},
+            },
+            # Update con pipeline: la segunda etapa ve el contador ya incrementado
+            [
+                {"$set": {
+                    # $literal: una respuesta que empiece por "$" no es una ruta de campo
+                    "answers": {"$concatArrays": [
+                        {"$ifNull": ["$answers", []]},
+                        [{"id_question": question_id, "answer": {"$literal": answer}}]
+                    ]},
+                    "actual_number_of_questions": {"$add": ["$actual_number_of_questions", 1]},
+                    "updated_at": now,
+                }},
+                {"$set": {
+                    "is_finished": is_complete,
+                    "finished_at": {"$cond": [is_complete, now, "$finished_at"]},
+                    "status": {"$cond": [is_complete, "completed", "$status"]},
+                }},
+            ],
+            projection=get_projection(SessionProgressView),
+            return_document=ReturnDocument.AFTER
+        )
+        if updated is None:
+            return None
+        return SessionProgressView.model_validate(updated)
+
+    async def update_answer(self, session_id: str, user_id: str, question_id: int, answer: str) -> Optional[int]:
+        """
+        Replace an existing answer in place with the positional operator.
+        Returns the number of answered questions when it matched, or None when the
+        session is missing, finished, owned by another user or the question is unanswered.
+        """
+        updated = await UserSession.get_motor_collection().find_one_and_update(
+            {
+                "_id": PydanticObjectId(session_id),
+                "user_id": user_id,
+                "is_finished": False,
+                "answers.id_question": question_id,
+            },
+            {"$set": {"answers.$.answer": answer, "updated_at": datetime.now(timezone.utc)}},
+            projection={"actual_number_of_questions": 1},
+            return_document=ReturnDocument.AFTER
+        )
+        return updated["actual_number_of_questions"] if updated else None
 
     async def update_user_session(self, user_session: UserSession) -> UserSession:
         return await self.update(user_session)
@@ -0,0 +1,72 @@
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Protocol, Sequence
+
+from domain.entities.assement_feedback import AssementResult, QuestionAnalysis, UserAnswer
+
+
+class ScoredQuestion(Protocol):
+    question_number: int
+    question: str
+    subcategory: str
+    correct_answer: str
+
+
+class ScoredAnswer(Protocol):
+    id_question: int
+    answer: str
+
+
+@dataclass
+class AssessmentScore:
+    category_scores: List[AssementResult] = field(default_factory=list)
+    questions_analysis: List[QuestionAnalysis] = field(default_factory=list)
+    good_answers: int = 0
+    bad_answers: int = 0
+
+
+def score_assessment(questions: Sequence[ScoredQuestion], answers: Sequence[ScoredAnswer]) -> AssessmentScore:
+    """
+    Score a session in O(Q + A): answers are indexed by question number once and a
+    single pass over the questions builds the per-subcategory percentages, the
+    per-question analysis and the good/bad totals. Answers refer to questions by
+    ``question_number`` (their position in the session).
+
+    A subcategory's percentage counts a question as correct when its first answer
+    is; the analysis and the good/bad totals include every answer to the question.
+    """
+    answers_by_question: Dict[int, List[ScoredAnswer]] = defaultdict(list)
+    for answer in answers:
+        answers_by_question[answer.id_question].append(answer)
+
+    # Orden de aparición de las subcategorías: {subcategoría: [correctas, total]}
+    categories: Dict[str, List[int]] = {}
+    score = AssessmentScore()
+    for question in questions:
+        question_answers = answers_by_question.get(question.question_number, [])
+        category = categories.setdefault(question.subcategory, [0, 0])
+        category[1] += 1
+        if question_answers and question_answers[0].answer == question.correct_answer:
+            category[0] += 1
+
+        user_answers = []
+        for answer in question_answers:
+            is_correct = answer.answer == question.correct_answer
+            user_answers.append(UserAnswer(answer=answer.answer, is_correct=is_correct))
+            if is_correct:
+                score.good_answers += 1
+            else:
+                score.bad_answers += 1
+        score.questions_analysis.append(QuestionAnalysis(
+            question_number=question.question_number,
+            question=question.question,
+            subcategory=question.subcategory,
+            correct_answer=question.correct_answer,
+            user_answers=user_answers
+        ))
+
+    score.category_scores = [
+        AssementResult(subcategory=subcategory, percentage=(correct / total) * 100 if total > 0 else 0)
+        for subcategory, (correct, total) in categories.items()
+    ]
+    return score
@@ -0,0 +1,36 @@
+import random
+from collections import defaultdict
+from typing import Dict, List, Optional, Protocol, Sequence
+
+
+class BankQuestion(Protocol):
+    question_number: int
+    subcategory: str
+
+
+def stratified_sample(question_bank: Sequence[BankQuestion], size: int,
+                      rng: Optional[random.Random] = None) -> List[int]:
+    """
+    Pick ``size`` question numbers from a pooled bank, spreading them evenly
+    across subcategories: subcategories take turns in a random order and each
+    turn draws one random question from that subcategory until ``size`` is reached.
+    """
+    rng = rng or random
+    by_subcategory: Dict[str, List[int]] = defaultdict(list)
+    for question in question_bank:
+        by_subcategory[question.subcategory].append(question.question_number)
+
+    pools = list(by_subcategory.values())
+    for pool in pools:
+        rng.shuffle(pool)
+    rng.shuffle(pools)
+
+    sample: List[int] = []
+    while pools and len(sample) < size:
+        for pool in list(pools):
+            if len(sample) >= size:
+                break
+            sample.append(pool.pop())
+            if not pool:
+                pools.remove(pool)
+    return sample
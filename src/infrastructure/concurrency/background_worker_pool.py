@@ -0,0 +1,107 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional, Set, Tuple
+
+from infrastructure.config.app_config import config
+
+logger = logging.getLogger(__name__)
+
+Job = Tuple[str, Callable[[], Awaitable[object]]]
+
+
+class BackgroundWorkerPool:
+    """
+    Fixed number of asyncio workers draining a bounded queue of keyed jobs.
+
+    A key that is already queued or running is not queued again, and ``submit``
+    never blocks: when the queue is full the job is rejected and the caller falls
+    back to doing the work on demand.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue_size: int):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.queue: Optional[asyncio.Queue] = None
+        self.workers: List[asyncio.Task] = []
+        self.pending_keys: Set[str] = set()
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self.workers)
+
+    async def start(self):
+        if self.is_running:
+            return
+        self.queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self.workers = [
+            asyncio.create_task(self._worker(), name=f"{self.name}-{i}")
+            for i in range(self.max_workers)
+        ]
+        logger.info(f"Worker pool '{self.name}' started with {self.max_workers} workers")
+
+    async def stop(self):
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
+        self.pending_keys.clear()
+        logger.info(f"Worker pool '{self.name}' stopped")
+
+    def submit(self, key: str, job: Callable[[], Awaitable[object]]) -> bool:
+        if not self.is_running:
+            logger.warning(f"Worker pool '{self.name}' is not running, job {key} rejected")
+            self.rejected += 1
+            return False
+        if key in self.pending_keys:
+            return True
+        try:
+            self.queue.put_nowait((key, job))
+        except asyncio.QueueFull:
+            logger.warning(f"Worker pool '{self.name}' queue is full, job {key} rejected")
+            self.rejected += 1
+            return False
+        self.pending_keys.add(key)
+        return True
+
+    def stats(self) -> dict:
+        return {
+            "name": self.name,
+            "workers": len(self.workers),
+            "queued": self.queue.qsize() if self.queue else 0,
+            "pending": len(self.pending_keys),
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+        }
+
+    async def _worker(self):
+        while True:
+            key, job = await self.queue.get()
+            try:
+                await job()
+                self.completed += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Background job {key} failed in pool '{self.name}': {e}")
+            finally:
+                self.pending_keys.discard(key)
+                self.queue.task_done()
+
+
+question_bank_worker_pool = BackgroundWorkerPool(
+    "question-bank",
+    max_workers=config.question_bank_workers,
+    max_queue_size=config.question_bank_queue_size,
+)
+
+feedback_evaluation_worker_pool = BackgroundWorkerPool(
+    "feedback-evaluation",
+    max_workers=config.feedback_evaluation_workers,
+    max_queue_size=config.feedback_evaluation_queue_size,
+)
@@ -1,4 +1,5 @@
 from pydantic_settings import BaseSettings
+from typing import Optional
 from dotenv import load_dotenv
 
 
@@ -11,10 +12,54 @@ class AppConfig(BaseSettings):
     
     gemini_api_key: str
     gemini_model: str 
+    gemini_timeout_ms: int = 60000
+    gemini_max_connections: int = 20
+    gemini_max_keepalive_connections: int = 10
+    gemini_max_retries: int = 4
+    gemini_retry_base_delay_seconds: float = 1.0
+    gemini_retry_max_delay_seconds: float = 20.0
+    gemini_breaker_failure_threshold: int = 5
+    gemini_breaker_reset_seconds: float = 30.0
+    gemini_concurrency_initial: int = 8
+    gemini_concurrency_min: int = 1
+    gemini_concurrency_max: int = 32
+    gemini_latency_target_seconds: float = 30.0
+    gemini_hedging_enabled: bool = False
+    gemini_hedge_model: Optional[str] = None
+    gemini_hedge_percentile: float = 0.95
+    gemini_hedge_window: int = 200
+    gemini_hedge_min_samples: int = 20
+    gemini_hedge_min_delay_seconds: float = 2.0
+    gemini_hedge_max_ratio: float = 0.1
+    quiz_question_count: int = 15
+    question_bank_size: int = 60
+    quiz_generation_batch_size: int = 30
+    quiz_streaming_enabled: bool = False
+    quiz_min_valid_ratio: float = 0.8
+    gemini_structured_output_enabled: bool = True
+    quiz_cache_enabled: bool = True
+    quiz_cache_ttl_seconds: float = 60 * 60 * 24 * 30
+    quiz_cache_max_entries: int = 5000
+    quiz_parallel_generation_enabled: bool = False
+    quiz_parallel_subcategories: int = 5
+    quiz_parallel_concurrency: int = 5
+    quiz_parallel_piece_retries: int = 2
     
     
     mongodb_url: str
     mongodb_db_name: str
+    mongodb_build_indexes_on_startup: bool = True
+    mongodb_min_pool_size: int = 10
+    mongodb_max_pool_size: int = 100
+    mongodb_max_idle_time_ms: int = 60000
+    mongodb_server_selection_timeout_ms: int = 5000
+    mongodb_connect_timeout_ms: int = 10000
+    mongodb_socket_timeout_ms: int = 20000
+    # zstandard y python-snappy están en requirements.txt; zlib viene con Python
+    mongodb_compressors: str = "zstd,snappy,zlib"
+    # Lecturas de historial: primary, primaryPreferred, secondary, secondaryPreferred o nearest
+    mongodb_history_read_preference: str = "secondaryPreferred"
+    mongodb_history_max_staleness_seconds: Optional[int] = None
     rabbitmq_url: str 
     
    
@@ -25,6 +70,23 @@ class AppConfig(BaseSettings):
     notifications_queue_name: str = "notifications"
     
     
+    generation_lease_ttl_seconds: float = 120
+    generation_wait_timeout_seconds: float = 300
+    generation_poll_interval_seconds: float = 1.0
+    question_bank_cache_max_banks: int = 256
+    skill_cache_enabled: bool = True
+    skill_cache_max_entries: int = 1024
+    skill_cache_ttl_seconds: float = 300
+    question_bank_workers: int = 2
+    question_bank_queue_size: int = 100
+    feedback_evaluation_workers: int = 2
+    feedback_evaluation_queue_size: int = 1000
+    # Publicación de puntos (outbox): reclamo por feedback y reintentos del worker
+    feedback_points_publish_lease_seconds: float = 30
+    feedback_points_publish_retries: int = 3
+    feedback_points_publish_retry_delay_seconds: float = 5
+    
+    
 
     
     
@@ -0,0 +1,101 @@
+import logging
+from typing import Any, Dict, List, Tuple, Type
+
+from beanie import Document
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from domain.entities.assement_feedback import AssementFeedback, FeedbackQuestionsAnalysis
+from domain.entities.generation_lease import GenerationLease
+from domain.entities.question import Question
+from domain.entities.quiz_cache_entry import QuizCacheEntry
+from domain.entities.skill import Skill
+from domain.entities.user_session import UserSession
+
+logger = logging.getLogger(__name__)
+
+# Único sitio donde se declaran los índices de cada colección.
+# init_beanie no los crea: se construyen con scripts/migrate_indexes.py o en segundo plano al arrancar.
+INDEXES: Dict[Type[Document], List[IndexModel]] = {
+    Skill: [
+        # create_skill busca por nombre en cada alta
+        IndexModel([("name", ASCENDING)]),
+    ],
+    UserSession: [
+        # Historial de feedbacks: sesiones terminadas de un usuario, más recientes primero
+        IndexModel([("user_id", ASCENDING), ("is_finished", ASCENDING), ("finished_at", DESCENDING), ("_id", DESCENDING)]),
+        # abandon_open_sessions: sesiones abiertas de un skill
+        IndexModel([("skill_id", ASCENDING), ("is_finished", ASCENDING)]),
+    ],
+    Question: [
+        IndexModel([("skillid", ASCENDING), ("question_number", ASCENDING)]),
+    ],
+    AssementFeedback: [
+        # Un único feedback por sesión
+        IndexModel([("session_id", ASCENDING)], unique=True),
+        IndexModel([("user_id", ASCENDING)]),
+    ],
+    # Se lee siempre por _id (el id del feedback)
+    FeedbackQuestionsAnalysis: [],
+    GenerationLease: [
+        # Mongo borra los leases caducados; la corrección depende del filtro por expires_at
+        IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0),
+    ],
+    QuizCacheEntry: [
+        IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0),
+        IndexModel([("last_hit_at", ASCENDING)]),
+        IndexModel([("skill_name", ASCENDING)]),
+    ],
+}
+
+
+def _signature(keys: Any, options: Dict[str, Any]) -> Tuple:
+    """What makes two indexes equivalent regardless of their name."""
+    return (
+        tuple((field, int(direction)) for field, direction in keys),
+        bool(options.get("unique", False)),
+        options.get("expireAfterSeconds"),
+    )
+
+
+async def find_missing_indexes() -> List[Tuple[Type[Document], IndexModel]]:
+    missing = []
+    for model, indexes in INDEXES.items():
+        existing = await model.get_motor_collection().index_information()
+        existing_signatures = {_signature(info["key"], info) for info in existing.values()}
+        for index in indexes:
+            document = index.document
+            if _signature(document["key"].items(), document) not in existing_signatures:
+                missing.append((model, index))
+    return missing
+
+
+async def verify_indexes() -> List[Tuple[Type[Document], IndexModel]]:
+    """Log a warning for every declared index the database does not have yet."""
+    missing = await find_missing_indexes()
+    for model, index in missing:
+        logger.warning(
+            f"Missing index {index.document['name']} on {model.get_collection_name()}; "
+            f"run scripts/migrate_indexes.py"
+        )
+    return missing
+
+
+async def ensure_indexes() -> Dict[str, Any]:
+    """
+    Build every missing declared index. Builds run on the server without blocking
+    reads or writes (background on servers older than 4.2). A failed build (for
+    example a unique index over duplicated data) is reported and does not stop the rest.
+    """
+    created: List[str] = []
+    failed: Dict[str, str] = {}
+    for model, index in await find_missing_indexes():
+        name = f"{model.get_collection_name()}.{index.document['name']}"
+        try:
+            index.document.setdefault("background", True)
+            await model.get_motor_collection().create_indexes([index])
+            created.append(name)
+            logger.info(f"Index {name} created")
+        except Exception as e:
+            failed[name] = str(e)
+            logger.error(f"Index {name} could not be created: {e}")
+    return {"created": created, "failed": failed}
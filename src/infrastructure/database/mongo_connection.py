@@ -1,37 +1,89 @@
+import asyncio
 import logging
+from typing import Any, Dict
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.read_preferences import Nearest, Primary, PrimaryPreferred, Secondary, SecondaryPreferred, _ServerMode
 from infrastructure.config.app_config import config 
 from beanie import init_beanie
 from domain.entities.question import Question
 from domain.entities.user_session import UserSession
 from domain.entities.skill import Skill
-from domain.entities.assement_feedback import AssementFeedback
+from domain.entities.assement_feedback import AssementFeedback, FeedbackQuestionsAnalysis
+from domain.entities.generation_lease import GenerationLease
+from domain.entities.quiz_cache_entry import QuizCacheEntry
+from infrastructure.database.indexes import ensure_indexes, verify_indexes
 
 
 
 
 logger = logging.getLogger(__name__)
 
+READ_PREFERENCES = {
+    "primary": Primary,
+    "primaryPreferred": PrimaryPreferred,
+    "secondary": Secondary,
+    "secondaryPreferred": SecondaryPreferred,
+    "nearest": Nearest,
+}
+
+
+def client_options() -> Dict[str, Any]:
+    """Pool, timeouts and wire compression for the Motor client."""
+    return {
+        "minPoolSize": config.mongodb_min_pool_size,
+        "maxPoolSize": config.mongodb_max_pool_size,
+        "maxIdleTimeMS": config.mongodb_max_idle_time_ms,
+        "serverSelectionTimeoutMS": config.mongodb_server_selection_timeout_ms,
+        "connectTimeoutMS": config.mongodb_connect_timeout_ms,
+        "socketTimeoutMS": config.mongodb_socket_timeout_ms,
+        "compressors": config.mongodb_compressors,
+    }
+
+
+def history_read_preference() -> _ServerMode:
+    """
+    Read preference for the read-heavy history endpoints. Everything else keeps
+    reading from the primary, so the answer flow always sees its own writes.
+    """
+    mode = READ_PREFERENCES.get(config.mongodb_history_read_preference)
+    if mode is None:
+        raise ValueError(f"Unknown read preference: {config.mongodb_history_read_preference}")
+    if mode is Primary:
+        return Primary()
+    return mode(max_staleness=config.mongodb_history_max_staleness_seconds or -1)
+
+
 class MongoConnection:
     def __init__(self):
         self.client = None
         self.database = None
+        self.index_build = None
         self.logger = logging.getLogger(__name__)
     
     async def connect(self):
         
         try:
-            self.client = AsyncIOMotorClient(config.mongodb_url)
+            self.client = AsyncIOMotorClient(config.mongodb_url, **client_options())
             self.database = self.client[config.mongodb_db_name]
             await init_beanie(database=self.database, document_models=[
                 Skill,
                 UserSession,
                 Question,
                 
-                AssementFeedback
-            ]
+                AssementFeedback,
+                FeedbackQuestionsAnalysis,
+                GenerationLease,
+                QuizCacheEntry
+            ],
+                              # Los índices se declaran en infrastructure/database/indexes.py
+                              skip_indexes=True
                               )
+            missing_indexes = await verify_indexes()
+            if missing_indexes and config.mongodb_build_indexes_on_startup:
+                # Sin bloquear el arranque: las consultas funcionan (más lentas) mientras se construyen
+                self.index_build = asyncio.create_task(ensure_indexes())
             
+            await self.warm_up_pool()
             self.logger.info("MongoDB connection established successfully")
             return True
             
@@ -39,8 +91,17 @@ class MongoConnection:
             self.logger.error(f"Failed to connect to MongoDB: {e}")
             raise Exception(f"Database connection failed: {e}")
     
+    async def warm_up_pool(self):
+        """Open minPoolSize connections now instead of on the first requests."""
+        # Cada ping concurrente ocupa una conexión distinta del pool
+        await asyncio.gather(*[
+            self.client.admin.command("ping") for _ in range(config.mongodb_min_pool_size)
+        ])
+
     async def disconnect(self):
         """Cerrar conexión a MongoDB"""
+        if self.index_build and not self.index_build.done():
+            self.index_build.cancel()
         if self.client:
             self.client.close()
             self.logger.info("MongoDB connection closed")
@@ -0,0 +1,58 @@
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+
+class HedgePolicy:
+    """
+    Decide when a Gemini call is slow enough to fire a second (hedge) request.
+
+    The hedge delay is a percentile of the latencies of recent successful calls
+    of the same type (a plan call answers much faster than a whole quiz, so they
+    keep separate windows). Hedges are capped to ``max_hedge_ratio`` of the
+    primary calls so a slow model never doubles what we pay.
+    """
+
+    def __init__(self, percentile: float, window: int, min_samples: int, min_delay: float, max_hedge_ratio: float):
+        self.percentile = percentile
+        self.window = window
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.max_hedge_ratio = max_hedge_ratio
+        self.latencies: Dict[str, Deque[float]] = {}
+        self.primary_calls = 0
+        self.hedges_fired = 0
+        self.hedges_won = 0
+        self.hedges_skipped_by_budget = 0
+        self.invalid_replies = 0
+
+    def record_latency(self, call_type: str, latency: float):
+        self.latencies.setdefault(call_type, deque(maxlen=self.window)).append(latency)
+
+    def hedge_delay(self, call_type: str) -> Optional[float]:
+        """Seconds to wait before hedging a call of this type, or None while there is not enough history."""
+        latencies = self.latencies.get(call_type, ())
+        if len(latencies) < self.min_samples:
+            return None
+        ordered = sorted(latencies)
+        index = min(len(ordered) - 1, int(self.percentile * len(ordered)))
+        return max(self.min_delay, ordered[index])
+
+    def try_spend_hedge(self) -> bool:
+        if self.hedges_fired + 1 > self.max_hedge_ratio * self.primary_calls:
+            self.hedges_skipped_by_budget += 1
+            return False
+        self.hedges_fired += 1
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "primary_calls": self.primary_calls,
+            "hedges_fired": self.hedges_fired,
+            "hedges_won": self.hedges_won,
+            "hedges_skipped_by_budget": self.hedges_skipped_by_budget,
+            "invalid_replies": self.invalid_replies,
+            "call_types": {
+                call_type: {"hedge_delay_seconds": self.hedge_delay(call_type), "latency_samples": len(latencies)}
+                for call_type, latencies in self.latencies.items()
+            },
+        }
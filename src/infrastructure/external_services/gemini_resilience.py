@@ -0,0 +1,212 @@
+import asyncio
+import logging
+import random
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import httpx
+from google.genai import errors
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE = "retryable"
+NON_RETRYABLE = "non_retryable"
+
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+RETRYABLE_MARKERS = ("overloaded", "unavailable", "resource_exhausted", "deadline", "timeout")
+
+
+class CircuitOpenError(Exception):
+    """Raised without calling Gemini while the circuit breaker is open."""
+
+
+def classify_error(error: Exception) -> str:
+    """Decide whether a failed Gemini call is worth retrying."""
+    if isinstance(error, (httpx.TimeoutException, httpx.TransportError, asyncio.TimeoutError)):
+        return RETRYABLE
+    if isinstance(error, errors.APIError):
+        if error.code in RETRYABLE_STATUS_CODES:
+            return RETRYABLE
+        if isinstance(error, errors.ClientError):
+            return NON_RETRYABLE
+    message = str(error).lower()
+    if "503" in message or any(marker in message for marker in RETRYABLE_MARKERS):
+        return RETRYABLE
+    return NON_RETRYABLE
+
+
+class CircuitBreaker:
+    """
+    Closed -> open after ``failure_threshold`` consecutive retryable failures.
+    While open every call fails fast; after ``reset_timeout`` one probe call is
+    let through (half-open) and its outcome closes or re-opens the circuit. A
+    non-retryable error leaves the state as it is.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.probe_in_flight = False
+        self.times_opened = 0
+
+    def allow_request(self) -> bool:
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+        if self.state == self.HALF_OPEN and not self.probe_in_flight:
+            self.probe_in_flight = True
+            return True
+        return False
+
+    def record_success(self):
+        self.consecutive_failures = 0
+        self.probe_in_flight = False
+        self.state = self.CLOSED
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        self.probe_in_flight = False
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.times_opened += 1
+                logger.warning(f"Gemini circuit breaker opened after {self.consecutive_failures} failures")
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "times_opened": self.times_opened,
+        }
+
+
+class AIMDLimiter:
+    """
+    Adaptive concurrency limit (additive increase, multiplicative decrease).
+    Each fast success grows the limit by ``1 / limit``; a slow call or an
+    overload error multiplies it by ``decrease_factor``.
+    """
+
+    def __init__(self, initial: int, minimum: int, maximum: int, latency_target: float, decrease_factor: float = 0.5):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.latency_target = latency_target
+        self.decrease_factor = decrease_factor
+        self.in_flight = 0
+        self.condition = asyncio.Condition()
+
+    async def acquire(self):
+        async with self.condition:
+            await self.condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+    async def release(self, latency: Optional[float], overloaded: bool):
+        async with self.condition:
+            self.in_flight -= 1
+            if overloaded or (latency is not None and latency > self.latency_target):
+                self.limit = max(self.minimum, self.limit * self.decrease_factor)
+            elif latency is not None:
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            self.condition.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "latency_target_seconds": self.latency_target,
+        }
+
+
+class GeminiResilience:
+    """Retry with jittered backoff, circuit breaker and adaptive concurrency for Gemini calls."""
+
+    def __init__(self, max_retries: int, base_delay: float, max_delay: float, breaker: CircuitBreaker, limiter: AIMDLimiter):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.breaker = breaker
+        self.limiter = limiter
+        self.calls = 0
+        self.successes = 0
+        self.failures = 0
+        self.retries = 0
+        self.rejected = 0
+        self.latency_ewma: Optional[float] = None
+
+    @asynccontextmanager
+    async def guard(self):
+        """Breaker check and concurrency slot for one call, without retries (used for streams)."""
+        if not self.breaker.allow_request():
+            self.rejected += 1
+            raise CircuitOpenError("Gemini circuit breaker is open")
+        # Admitida estando half-open: esta llamada es la única sonda
+        is_probe = self.breaker.state == CircuitBreaker.HALF_OPEN
+        try:
+            await self.limiter.acquire()
+        except BaseException:
+            if is_probe:
+                self.breaker.probe_in_flight = False
+            raise
+        self.calls += 1
+        start = time.monotonic()
+        latency: Optional[float] = None
+        overloaded = False
+        try:
+            yield
+            latency = time.monotonic() - start
+            self.successes += 1
+            self.latency_ewma = latency if self.latency_ewma is None else 0.8 * self.latency_ewma + 0.2 * latency
+            self.breaker.record_success()
+        except Exception as e:
+            overloaded = classify_error(e) == RETRYABLE
+            self.failures += 1
+            if overloaded:
+                self.breaker.record_failure()
+            # Un error del cliente no dice nada de la salud del modelo: el breaker queda igual
+            # (si era la sonda, el finally la libera y la siguiente llamada vuelve a sondear)
+            raise
+        finally:
+            # También al cancelar: liberar el hueco y no dejar colgada la sonda half-open.
+            # Solo la sonda libera el flag; otra llamada que termine no debe dejar pasar una segunda
+            if is_probe:
+                self.breaker.probe_in_flight = False
+            await self.limiter.release(latency, overloaded)
+
+    async def call(self, fn: Callable[[], Awaitable[Any]]) -> Any:
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self.guard():
+                    return await fn()
+            except CircuitOpenError:
+                raise
+            except Exception as e:
+                if classify_error(e) != RETRYABLE or attempt >= self.max_retries:
+                    raise
+                # Full jitter: espera aleatoria entre 0 y el backoff exponencial
+                wait_time = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+                self.retries += 1
+                logger.warning(f"Gemini overloaded ({e}). Retry {attempt + 1}/{self.max_retries} in {wait_time:.2f}s")
+                await asyncio.sleep(wait_time)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "successes": self.successes,
+            "failures": self.failures,
+            "retries": self.retries,
+            "rejected_by_breaker": self.rejected,
+            "latency_ewma_seconds": self.latency_ewma,
+            "circuit_breaker": self.breaker.stats(),
+            "concurrency": self.limiter.stats(),
+        }
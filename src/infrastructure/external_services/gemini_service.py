@@ -1,73 +1,249 @@
 from google import genai
+from google.genai import types
+import httpx
 import os 
 import logging
-from typing import Optional,Dict,Any,List
+from typing import Optional,Dict,Any,List,AsyncIterator,Callable
 import asyncio
 from datetime import datetime
 from infrastructure.config.app_config import config
+from infrastructure.external_services.quiz_stream_parser import QuizStreamParser
+from infrastructure.external_services.gemini_resilience import GeminiResilience, CircuitBreaker, AIMDLimiter, CircuitOpenError
+from infrastructure.external_services.gemini_hedging import HedgePolicy
+from infrastructure.external_services.quiz_schema import GeneratedQuiz, QuizReplyParser
+from infrastructure.external_services.quiz_cache import QuizCache
+from domain.repositories.quiz_cache_repository import QuizCacheRepository
+import time
 import json
 
 import random
 logger = logging.getLogger(__name__)
 
+QUIZ_JSON_FORMAT = """{
+  
+  "questions": [
+    {
+      "id":number,
+      "subcategory": "Subcategory name",
+      "type": "multiple",
+      "question": "Text",
+      "options": ["A", "B", "C", "D"],
+      "correct_answer": "Correct option letter or text",
+      "recommended_tools": ["Tool1", "Tool2"]
+    }
+  ]
+}
+
+Only return a valid JSON. Do not include any explanation or text outside the JSON.
+"""
+
 class GeminiService:
+    """
+    Long-lived Gemini client. One instance per worker is created at import time
+    and connected from ``main.lifespan``; every request reuses its pooled async
+    HTTP connections instead of building a new client.
+    """
     def __init__(self):
         self.api_key=config.gemini_api_key
         if not self.api_key:
             raise ValueError("GEMINI_API_KEY environment variable is not set")
-        self.client=genai.Client(api_key=self.api_key)
         self.model_name=config.gemini_model
         if not self.model_name:
             raise ValueError("GEMINI_MODEL environment variable is not set")
+        self.client=genai.Client(
+            api_key=self.api_key,
+            http_options=types.HttpOptions(
+                timeout=config.gemini_timeout_ms,
+                async_client_args={
+                    "limits": httpx.Limits(
+                        max_connections=config.gemini_max_connections,
+                        max_keepalive_connections=config.gemini_max_keepalive_connections,
+                    )
+                },
+            ),
+        )
         
         self.is_connected = False
+        # Número de llamadas de generación enviadas al modelo (para métricas/benchmarks)
+        self.generation_calls = 0
+        self.resilience = GeminiResilience(
+            max_retries=config.gemini_max_retries,
+            base_delay=config.gemini_retry_base_delay_seconds,
+            max_delay=config.gemini_retry_max_delay_seconds,
+            breaker=CircuitBreaker(
+                failure_threshold=config.gemini_breaker_failure_threshold,
+                reset_timeout=config.gemini_breaker_reset_seconds,
+            ),
+            limiter=AIMDLimiter(
+                initial=config.gemini_concurrency_initial,
+                minimum=config.gemini_concurrency_min,
+                maximum=config.gemini_concurrency_max,
+                latency_target=config.gemini_latency_target_seconds,
+            ),
+        )
+        self.hedging = HedgePolicy(
+            percentile=config.gemini_hedge_percentile,
+            window=config.gemini_hedge_window,
+            min_samples=config.gemini_hedge_min_samples,
+            min_delay=config.gemini_hedge_min_delay_seconds,
+            max_hedge_ratio=config.gemini_hedge_max_ratio,
+        )
+        self.quiz_parser = QuizReplyParser(min_valid_ratio=config.quiz_min_valid_ratio)
+        self.quiz_cache = QuizCache(
+            QuizCacheRepository(),
+            enabled=config.quiz_cache_enabled,
+            ttl_seconds=config.quiz_cache_ttl_seconds,
+            max_entries=config.quiz_cache_max_entries,
+        )
     
     async def connect(self):
+        if self.is_connected:
+            return
         try:
-            await self.health_check()
+            if not await self.health_check():
+                logger.warning(f"Gemini model '{self.model_name}' did not answer the health check")
             self.is_connected = True
             logger.info("Gemini Service conectado exitosamente")
         except Exception as e:
             logger.error(f"Error conectando a Gemini Service: {e}")
             raise
 
+    async def disconnect(self):
+        """Cerrar el pool de conexiones HTTP del cliente asíncrono"""
+        try:
+            # aclose solo existe en versiones recientes del SDK
+            aclose = getattr(self.client.aio, "aclose", None)
+            if aclose:
+                await aclose()
+        except Exception as e:
+            logger.error(f"Error cerrando Gemini Service: {e}")
+        self.is_connected = False
+        logger.info("Gemini Service desconectado")
+
     async def health_check(self)->bool:
+        """Verificar que el modelo existe y la API key es válida, sin generar contenido"""
         try:
-            response=await asyncio.to_thread(
-                self.client.models.generate_content,
-                model=self.model_name,
-                contents="Test connection",
-            )
-            return response.text is not None
+            model = await self.client.aio.models.get(model=self.model_name)
+            return model is not None
         except Exception as e:
             logger.info(f"Health check failed: {e}")
             return False
+
+    async def _generate(self, contents: str, generation_config: Optional[types.GenerateContentConfig] = None,
+                        call_type: str = "content", parse: Optional[Callable[[Any], Any]] = None):
+        """
+        One generation of ``call_type`` (its latencies drive the hedge delay). With
+        ``parse`` the parsed reply is returned instead of the response, None when the
+        reply is unusable; a hedged call only lets a reply that parses win.
+        """
+        if config.gemini_hedging_enabled:
+            return await self._generate_hedged(contents, generation_config, call_type, parse)
+        response = await self._generate_once(self.model_name, contents, generation_config, call_type)
+        return self._parse_reply(parse, response) if parse else response
+
+    def _parse_reply(self, parse: Callable[[Any], Any], response) -> Any:
+        try:
+            return parse(response)
+        except Exception as e:
+            logger.warning(f"Unusable Gemini reply: {e}")
+            return None
+
+    async def _generate_once(self, model: str, contents: str, generation_config: Optional[types.GenerateContentConfig] = None,
+                             call_type: str = "content"):
+        async def call():
+            self.generation_calls += 1
+            start = time.monotonic()
+            response = await self.client.aio.models.generate_content(
+                model=model,
+                contents=contents,
+                config=generation_config,
+            )
+            self.hedging.record_latency(call_type, time.monotonic() - start)
+            return response
+        # Reintentos con backoff, circuit breaker y límite de concurrencia adaptativo
+        return await self.resilience.call(call)
+
+    async def _generate_hedged(self, contents: str, generation_config: Optional[types.GenerateContentConfig] = None,
+                               call_type: str = "content", parse: Optional[Callable[[Any], Any]] = None):
+        """
+        Fire a second identical request (or one to ``gemini_hedge_model``) when the
+        first has not answered within the latency percentile of its call type. The
+        first valid reply (with text, and that ``parse`` accepts) wins and the other
+        request is cancelled; an invalid reply waits for the other request.
+        """
+        self.hedging.primary_calls += 1
+        primary = asyncio.create_task(self._generate_once(self.model_name, contents, generation_config, call_type))
+        pending = {primary}
+        try:
+            delay = self.hedging.hedge_delay(call_type)
+            if delay is not None:
+                done, pending = await asyncio.wait(pending, timeout=delay)
+                if not done and self.hedging.try_spend_hedge():
+                    hedge_model = config.gemini_hedge_model or self.model_name
+                    logger.info(f"Gemini {call_type} call slower than {delay:.2f}s, hedging with model {hedge_model}")
+                    pending.add(asyncio.create_task(
+                        self._generate_once(hedge_model, contents, generation_config, call_type)
+                    ))
+                pending = pending | done
+
+            last_error: Optional[BaseException] = None
+            last_response = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        last_error = task.exception()
+                        continue
+                    response = task.result()
+                    result = response
+                    if response and response.text and parse:
+                        result = self._parse_reply(parse, response)
+                    if response and response.text and result is not None:
+                        if task is not primary:
+                            self.hedging.hedges_won += 1
+                        return result
+                    # Respuesta inválida: si la otra petición sigue en curso, esperarla
+                    self.hedging.invalid_replies += 1
+                    last_response = response
+            if last_response is None and last_error is not None:
+                raise last_error
+            return None if parse else last_response
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "model": self.model_name,
+            "generation_calls": self.generation_calls,
+            **self.resilience.stats(),
+            "hedging": {"enabled": config.gemini_hedging_enabled, **self.hedging.stats()},
+            "quiz_parsing": self.quiz_parser.stats(),
+            "quiz_cache": self.quiz_cache.stats(),
+        }
     
     async def generate_content(self, prompt: str, max_tokens: int = 100) -> Optional[str]:
         if not self.is_connected:
             await self.connect()
         try:
-            response = await asyncio.to_thread(
-                self.client.models.generate_content,
-                model=self.model_name,
-                contents=prompt,
-                max_output_tokens=max_tokens
+            return await self._generate(
+                prompt,
+                types.GenerateContentConfig(max_output_tokens=max_tokens),
+                parse=lambda response: response.text,
             )
-            return response.text
         except Exception as e:
             logger.error(f"Error generating content: {e}")
             return None
         
-    async def generate_quiz(self, skill: str):
-        if not self.is_connected:
-            await self.connect()
-        try:
-            
-            response = await asyncio.to_thread(
-                self.client.models.generate_content,
-                model=self.model_name,
-                contents=f"""
-Generate 15 questions to assess general knowledge of the skill: {skill}.
+    def build_quiz_prompt(self, skill: str, question_count: Optional[int] = None, exclude_questions: Optional[List[str]] = None) -> str:
+        question_count = question_count or config.quiz_question_count
+        exclusions = ""
+        if exclude_questions:
+            exclusions = "Do not repeat or rephrase any of these existing questions:\n" + "\n".join(
+                f"- {text}" for text in exclude_questions
+            ) + "\n\n"
+        return f"""
+Generate {question_count} questions to assess general knowledge of the skill: {skill}.
 
 Each question must include a "subcategory" related to the core topics within {skill}. For example, if the skill is "UX/UI Design", subcategories may include:
 - Understanding UX Principles
@@ -81,78 +257,277 @@ Each question must include a "subcategory" related to the core topics within {sk
 
 All questions must be multiple choice. Do not use other types such as true/false, open, or analysis.
 
-Return a JSON object in the following structure:
+{exclusions}Return a JSON object in the following structure:
 
-""" + """{
-  
-  "questions": [
-    {
-      "id":number,
-      "subcategory": "Subcategory name",
-      "type": "multiple",
-      "question": "Text",
-      "options": ["A", "B", "C", "D"],
-      "correct_answer": "Correct option letter or text",
-      "recommended_tools": ["Tool1", "Tool2"]
-    }
-  ]
-}
+""" + QUIZ_JSON_FORMAT
+
+    def build_plan_prompt(self, skill: str, count: int) -> str:
+        return f"""
+List exactly {count} distinct core subcategories that together assess general knowledge of the skill: {skill}.
+
+Return a JSON object in the following structure:
+{{"subcategories": ["Subcategory name"]}}
 
 Only return a valid JSON. Do not include any explanation or text outside the JSON.
 """
+
+    def build_subcategory_prompt(self, skill: str, subcategory: str, count: int) -> str:
+        return f"""
+Generate {count} questions to assess knowledge of the subcategory "{subcategory}" within the skill: {skill}.
+
+Every question must use "{subcategory}" as its "subcategory".
+
+All questions must be multiple choice. Do not use other types such as true/false, open, or analysis.
+
+Return a JSON object in the following structure:
+
+""" + QUIZ_JSON_FORMAT
+
+    def quiz_prompt_template(self, mode: str) -> str:
+        """Prompt text with placeholders; its hash is part of the quiz cache key."""
+        template = f"{mode}|structured={config.gemini_structured_output_enabled}|" + self.build_quiz_prompt("{skill}")
+        if mode == "parallel":
+            template += self.build_plan_prompt("{skill}", config.quiz_parallel_subcategories)
+            template += self.build_subcategory_prompt("{skill}", "{subcategory}", 0)
+        return template
+
+    def quiz_generation_config(self) -> Optional[types.GenerateContentConfig]:
+        """Ask for JSON constrained to the ``GeneratedQuiz`` schema instead of free text."""
+        if not config.gemini_structured_output_enabled:
+            return None
+        return types.GenerateContentConfig(
+            response_mime_type="application/json",
+            response_schema=GeneratedQuiz,
+        )
+
+    def parse_json_reply(self, text: str) -> Any:
+        # Limpiar el texto JSON
+        json_text = text.strip()
+        if json_text.startswith('```json'):
+            json_text = json_text[7:-3]  
+        elif json_text.startswith('```'):
+            json_text = json_text[3:-3]  
+        return json.loads(json_text)
+
+    async def generate_quiz_stream(self, skill: str, question_count: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a quiz generation and yield each question object as soon as it is
+        complete, without waiting for the rest of the reply.
+        """
+        if not self.is_connected:
+            await self.connect()
+        parser = QuizStreamParser()
+        # Sin reintentos: las preguntas ya emitidas se han guardado
+        async with self.resilience.guard():
+            self.generation_calls += 1
+            stream = await self.client.aio.models.generate_content_stream(
+                model=self.model_name,
+                contents=self.build_quiz_prompt(skill, question_count),
+                config=self.quiz_generation_config(),
             )
-            
-            
-            if response and response.text:
-                try:
-                    # Limpiar el texto JSON
-                    json_text = response.text.strip()
-                    
-                   
-                    if json_text.startswith('```json'):
-                        json_text = json_text[7:-3]  
-                    elif json_text.startswith('```'):
-                        json_text = json_text[3:-3]  
-                    
-                
-                    quiz_data = json.loads(json_text)
-                    logger.info(f"Quiz generado exitosamente para skill: {skill}")
-                    return quiz_data
-                    
-                except json.JSONDecodeError as e:
-                    logger.error(f"Error parsing JSON response: {e}")
-                    logger.error(f"Response text: {response.text}")
-                    return None
-            
-            logger.warning(f"No se pudo generar quiz para skill: {skill}")
+            async for chunk in stream:
+                if not chunk.text:
+                    continue
+                for question in parser.feed(chunk.text):
+                    yield question
+        parser.close()
+        logger.info(
+            f"Quiz stream for skill {skill} finished: {parser.parsed_objects} questions, "
+            f"{parser.invalid_objects} malformed, {parser.truncated_objects} truncated"
+        )
+
+    async def generate_quiz(self, skill: str):
+        return await self.quiz_cache.get_or_generate(
+            skill, self.model_name, self.quiz_prompt_template("single"),
+            lambda: self._generate_quiz(skill)
+        )
+
+    async def _generate_quiz(self, skill: str):
+        if not self.is_connected:
+            await self.connect()
+        try:
+            return await self._request_quiz(skill)
+        except CircuitOpenError as e:
+            logger.warning(f"Skipping quiz generation for skill {skill}: {e}")
             return None
-            
         except Exception as e:
             logger.error(f"Error generating quiz for skill {skill}: {e}")
             return None
+
+    async def _request_quiz(self, skill: str, question_count: Optional[int] = None,
+                            exclude_questions: Optional[List[str]] = None) -> Optional[Dict]:
+        """One quiz generation. Raises on API errors, returns None on an unusable reply."""
+        question_count = question_count or config.quiz_question_count
+        # Los errores transitorios (503, sobrecarga) ya se reintentan en la capa de resiliencia
+        quiz_data = await self._generate(
+            self.build_quiz_prompt(skill, question_count, exclude_questions), self.quiz_generation_config(),
+            call_type="quiz", parse=lambda response: self.quiz_parser.parse(response.text if response else None, question_count)
+        )
+        if quiz_data is None:
+            logger.warning(f"No se pudo generar quiz para skill: {skill}")
+            return None
+        logger.info(f"Quiz generado exitosamente para skill: {skill}")
+        return quiz_data
+
     async def generate_quiz_with_retry(self, skill: str, max_retries: int = 3) -> Optional[Dict]:
-        """Generar quiz con reintentos automáticos"""
+        return await self.quiz_cache.get_or_generate(
+            skill, self.model_name, self.quiz_prompt_template("single"),
+            lambda: self._generate_quiz_with_retry(skill, max_retries)
+        )
+
+    async def _generate_quiz_with_retry(self, skill: str, max_retries: int = 3, question_count: Optional[int] = None,
+                                        exclude_questions: Optional[List[str]] = None) -> Optional[Dict]:
+        """
+        Generar quiz con reintentos automáticos. Los errores de red y sobrecarga se
+        reintentan con backoff dentro de cada llamada; aquí solo se vuelve a generar
+        cuando el modelo respondió con un quiz inválido.
+        """
+        if not self.is_connected:
+            await self.connect()
         for attempt in range(max_retries + 1):
             try:
-                return await self.generate_quiz(skill)
-                
+                quiz = await self._request_quiz(skill, question_count, exclude_questions)
+            except CircuitOpenError as e:
+                logger.warning(f"Skipping quiz generation for skill {skill}: {e}")
+                return None
             except Exception as e:
-                error_message = str(e).lower()
-                
-                # Verificar si es error 503 o sobrecarga
-                if "503" in error_message or "overloaded" in error_message or "unavailable" in error_message:
-                    if attempt < max_retries:
-                        # Exponential backoff: 2^attempt + random jitter
-                        wait_time = (2 ** attempt) + random.uniform(0, 1)
-                        logger.warning(f"Gemini overloaded. Retry {attempt + 1}/{max_retries} in {wait_time:.2f}s")
-                        await asyncio.sleep(wait_time)
-                        continue
-                    else:
-                        logger.error(f"Gemini still overloaded after {max_retries} retries")
-                        return None
-                else:
-                    # Error diferente, no reintentar
-                    logger.error(f"Non-retryable error: {e}")
-                    raise e
+                logger.error(f"Error generating quiz for skill {skill}: {e}")
+                return None
+            if quiz:
+                return quiz
+            if attempt < max_retries:
+                self.quiz_parser.regenerated += 1
+                logger.warning(f"Invalid quiz for skill {skill}. Regenerating {attempt + 1}/{max_retries}")
         
-        return None
\ No newline at end of file
+        return None
+
+    async def generate_question_bank(self, skill: str, bank_size: Optional[int] = None) -> Optional[Dict]:
+        """
+        Fill a skill's pooled question bank (``question_bank_size`` questions) in as
+        few calls as possible: big batches of ``quiz_generation_batch_size``, or one
+        fan-out when parallel generation is enabled. Sessions sample from it.
+        """
+        bank_size = bank_size or config.question_bank_size
+        mode = "parallel" if config.quiz_parallel_generation_enabled else "batched"
+        return await self.quiz_cache.get_or_generate(
+            skill, self.model_name,
+            f"bank={bank_size}|batch={config.quiz_generation_batch_size}|" + self.quiz_prompt_template(mode),
+            lambda: self._generate_question_bank(skill, bank_size)
+        )
+
+    async def _generate_question_bank(self, skill: str, bank_size: int) -> Optional[Dict]:
+        if config.quiz_parallel_generation_enabled:
+            return await self._generate_quiz_parallel(skill, bank_size)
+
+        questions: List[Dict[str, Any]] = []
+        seen = set()
+        while len(questions) < bank_size:
+            batch_size = min(config.quiz_generation_batch_size, bank_size - len(questions))
+            quiz = await self._generate_quiz_with_retry(
+                skill, max_retries=2, question_count=batch_size,
+                exclude_questions=[question["question"] for question in questions]
+            )
+            if not quiz:
+                break
+            new_questions = []
+            for question in quiz.get("questions", []):
+                fingerprint = " ".join(str(question.get("question", "")).split()).casefold()
+                if fingerprint and fingerprint not in seen:
+                    seen.add(fingerprint)
+                    new_questions.append(question)
+            if not new_questions:
+                break
+            questions.extend(new_questions[:bank_size - len(questions)])
+
+        # Un banco parcial sirve mientras alcance para al menos una sesión
+        if len(questions) < config.quiz_question_count:
+            logger.error(f"Question bank for skill {skill} too small: {len(questions)} questions")
+            return None
+        logger.info(f"Banco de preguntas generado para skill {skill}: {len(questions)} preguntas")
+        return {"questions": questions}
+
+    async def plan_quiz_subcategories(self, skill: str, count: int) -> List[str]:
+        """Short call that only picks the subcategories the quiz will cover."""
+        subcategories = await self._generate(
+            self.build_plan_prompt(skill, count), call_type="plan",
+            parse=lambda response: self.parse_plan_reply(response.text, count)
+        )
+        return subcategories or []
+
+    def parse_plan_reply(self, text: str, count: int) -> Optional[List[str]]:
+        plan = self.parse_json_reply(text)
+        subcategories = [name.strip() for name in plan.get("subcategories", []) if isinstance(name, str) and name.strip()]
+        # Sin duplicados y conservando el orden del modelo; un plan vacío no vale
+        return list(dict.fromkeys(subcategories))[:count] or None
+
+    async def generate_subcategory_questions(self, skill: str, subcategory: str, count: int) -> List[Dict[str, Any]]:
+        quiz_data = await self._generate(
+            self.build_subcategory_prompt(skill, subcategory, count), self.quiz_generation_config(),
+            call_type="subcategory", parse=lambda response: self.quiz_parser.parse(response.text if response else None, count)
+        )
+        questions = quiz_data["questions"] if quiz_data else []
+        if len(questions) < count:
+            raise ValueError(f"Expected {count} questions for '{subcategory}', got {len(questions)}")
+        for question in questions:
+            question["subcategory"] = subcategory
+        return questions[:count]
+
+    async def generate_quiz_parallel(self, skill: str, question_count: Optional[int] = None) -> Optional[Dict]:
+        question_count = question_count or config.quiz_question_count
+        return await self.quiz_cache.get_or_generate(
+            skill, self.model_name, f"{question_count}|" + self.quiz_prompt_template("parallel"),
+            lambda: self._generate_quiz_parallel(skill, question_count)
+        )
+
+    async def _generate_quiz_parallel(self, skill: str, question_count: Optional[int] = None) -> Optional[Dict]:
+        """
+        Plan-then-fan-out generation: one short call picks the subcategories, then
+        each subcategory's questions are generated concurrently (bounded by
+        ``quiz_parallel_concurrency``). Only the pieces that fail are retried, and
+        the result keeps the plan order so numbering is stable.
+        """
+        if not self.is_connected:
+            await self.connect()
+        question_count = question_count or config.quiz_question_count
+        try:
+            subcategories = await self.plan_quiz_subcategories(skill, config.quiz_parallel_subcategories)
+        except Exception as e:
+            logger.error(f"Error planning quiz for skill {skill}: {e}")
+            return None
+        if not subcategories:
+            logger.warning(f"Empty subcategory plan for skill: {skill}")
+            return None
+
+        # Reparto equitativo: las primeras subcategorías reciben la pregunta sobrante
+        base, extra = divmod(question_count, len(subcategories))
+        counts = [base + (1 if i < extra else 0) for i in range(len(subcategories))]
+        pieces: Dict[int, List[Dict[str, Any]]] = {}
+        semaphore = asyncio.Semaphore(config.quiz_parallel_concurrency)
+
+        async def generate_piece(index: int):
+            async with semaphore:
+                pieces[index] = await self.generate_subcategory_questions(skill, subcategories[index], counts[index])
+
+        pending = [i for i, count in enumerate(counts) if count > 0]
+        for attempt in range(config.quiz_parallel_piece_retries + 1):
+            results = await asyncio.gather(*[generate_piece(i) for i in pending], return_exceptions=True)
+            failed = [index for index, result in zip(pending, results) if isinstance(result, Exception)]
+            for index, result in zip(pending, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"Quiz piece '{subcategories[index]}' failed (attempt {attempt + 1}): {result}")
+            pending = failed
+            # Tras el último intento no hay nada que esperar
+            if not pending or attempt == config.quiz_parallel_piece_retries or self.resilience.breaker.state == CircuitBreaker.OPEN:
+                break
+            await asyncio.sleep((2 ** attempt) + random.uniform(0, 1))
+
+        if pending:
+            logger.error(f"Quiz for skill {skill} incomplete: {len(pending)} subcategories failed after retries")
+            return None
+
+        questions = [question for index in sorted(pieces) for question in pieces[index]]
+        logger.info(f"Quiz generado en paralelo para skill {skill}: {len(subcategories)} subcategorías")
+        return {"questions": questions}
+
+
+gemini_service = GeminiService()
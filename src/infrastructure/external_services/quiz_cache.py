@@ -0,0 +1,78 @@
+import hashlib
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from domain.repositories.quiz_cache_repository import QuizCacheRepository
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_skill_name(name: str) -> str:
+    """'  Python ' and 'python' share a cache entry."""
+    return " ".join(name.split()).casefold()
+
+
+class QuizCache:
+    """
+    Content-addressed cache of parsed quiz generations. The key is the normalized
+    skill name, the model name and a hash of the prompt template, so changing the
+    prompt or the model never serves stale quizzes.
+    """
+
+    def __init__(self, repository: QuizCacheRepository, enabled: bool, ttl_seconds: float, max_entries: int):
+        self.repository = repository
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def prompt_hash(self, prompt_template: str) -> str:
+        return hashlib.sha256(prompt_template.encode("utf-8")).hexdigest()[:16]
+
+    def key(self, skill_name: str, model: str, prompt_hash: str) -> str:
+        raw = f"{normalize_skill_name(skill_name)}|{model}|{prompt_hash}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    async def get_or_generate(self, skill_name: str, model: str, prompt_template: str,
+                              generate: Callable[[], Awaitable[Optional[Dict[str, Any]]]]) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return await generate()
+        prompt_hash = self.prompt_hash(prompt_template)
+        key = self.key(skill_name, model, prompt_hash)
+        try:
+            quiz = await self.repository.get_and_touch(key)
+        except Exception as e:
+            # La caché nunca debe impedir generar el quiz
+            self.errors += 1
+            logger.error(f"Quiz cache lookup failed: {e}")
+            quiz = None
+        if quiz:
+            self.hits += 1
+            logger.info(f"Quiz cache hit for skill: {skill_name}")
+            return quiz
+
+        self.misses += 1
+        quiz = await generate()
+        if quiz:
+            try:
+                await self.repository.put(key, normalize_skill_name(skill_name), model, prompt_hash, quiz, self.ttl_seconds)
+                await self.repository.evict_to_size(self.max_entries)
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"Quiz cache store failed: {e}")
+        return quiz
+
+    async def invalidate(self, skill_name: Optional[str] = None) -> int:
+        return await self.repository.invalidate(normalize_skill_name(skill_name) if skill_name else None)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_rate": self.hits / lookups if lookups else None,
+        }
@@ -0,0 +1,124 @@
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+
+from infrastructure.external_services.quiz_stream_parser import QuizStreamParser
+
+logger = logging.getLogger(__name__)
+
+
+class GeneratedQuestion(BaseModel):
+    """One question as Gemini must return it; mirrors the fields stored on ``Question``."""
+    subcategory: str = Field(..., min_length=1)
+    type: str = Field(..., min_length=1)
+    question: str = Field(..., min_length=1)
+    options: List[str] = Field(..., min_length=2)
+    correct_answer: str = Field(..., min_length=1)
+    recommended_tools: Optional[List[str]] = None
+
+
+class GeneratedQuiz(BaseModel):
+    questions: List[GeneratedQuestion]
+
+
+# Compilados una sola vez por proceso
+quiz_adapter = TypeAdapter(GeneratedQuiz)
+question_adapter = TypeAdapter(GeneratedQuestion)
+
+
+class QuizReplyParser:
+    """
+    Validate a quiz reply and, when it is only nearly valid, repair it instead of
+    paying for a new generation: text around the JSON is dropped, a truncated
+    reply keeps its complete questions, and invalid questions are discarded as
+    long as at least ``min_valid_ratio`` of the expected questions survive.
+    A well-formed reply with fewer questions than that is rejected too, so the
+    caller regenerates it.
+    """
+
+    def __init__(self, min_valid_ratio: float):
+        self.min_valid_ratio = min_valid_ratio
+        self.valid = 0
+        self.repaired = 0
+        self.unrecoverable = 0
+        self.too_few = 0
+        self.regenerated = 0
+
+    def parse(self, text: Optional[str], expected_questions: int) -> Optional[Dict[str, Any]]:
+        if not text:
+            self.unrecoverable += 1
+            return None
+        json_text = self._strip_fences(text)
+        try:
+            quiz = quiz_adapter.validate_json(json_text)
+        except ValidationError:
+            quiz = None
+        if quiz is not None:
+            # Válido según el esquema pero posiblemente corto: mismo mínimo que una reparación
+            if not self._enough_questions(len(quiz.questions), expected_questions):
+                self.too_few += 1
+                return None
+            self.valid += 1
+            return quiz.model_dump()
+
+        questions = self._repair(json_text, expected_questions)
+        if questions is None:
+            self.unrecoverable += 1
+            return None
+        self.repaired += 1
+        return {"questions": questions}
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "valid": self.valid,
+            "repaired": self.repaired,
+            "unrecoverable": self.unrecoverable,
+            "too_few": self.too_few,
+            "regenerated": self.regenerated,
+        }
+
+    def _repair(self, json_text: str, expected_questions: int) -> Optional[List[Dict[str, Any]]]:
+        candidates = self._candidate_questions(json_text)
+        questions = []
+        for candidate in candidates:
+            try:
+                questions.append(question_adapter.validate_python(candidate).model_dump())
+            except ValidationError as e:
+                logger.warning(f"Dropping invalid generated question: {e.error_count()} invalid fields")
+        if not self._enough_questions(len(questions), expected_questions):
+            return None
+        logger.info(f"Quiz reply repaired: kept {len(questions)}/{len(candidates)} questions")
+        return questions
+
+    def _enough_questions(self, count: int, expected_questions: int) -> bool:
+        if count < max(1, int(expected_questions * self.min_valid_ratio)):
+            logger.error(f"Quiz reply rejected: {count}/{expected_questions} valid questions")
+            return False
+        return True
+
+    def _candidate_questions(self, json_text: str) -> List[Any]:
+        start = json_text.find("{")
+        if start == -1:
+            return []
+        try:
+            # raw_decode ignora el texto que venga después del objeto JSON
+            data, _ = json.JSONDecoder().raw_decode(json_text[start:])
+            if isinstance(data, dict) and isinstance(data.get("questions"), list):
+                return data["questions"]
+        except json.JSONDecodeError:
+            pass
+        # JSON truncado o roto: rescatar los objetos de pregunta completos
+        stream_parser = QuizStreamParser()
+        candidates = stream_parser.feed(json_text)
+        stream_parser.close()
+        return candidates
+
+    def _strip_fences(self, text: str) -> str:
+        json_text = text.strip()
+        if json_text.startswith("```"):
+            json_text = json_text.split("\n", 1)[1] if "\n" in json_text else json_text[3:]
+        if json_text.endswith("```"):
+            json_text = json_text[:-3]
+        return json_text.strip()
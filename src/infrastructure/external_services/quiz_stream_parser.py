@@ -0,0 +1,94 @@
+import json
+import logging
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+class QuizStreamParser:
+    """
+    Incremental parser for a streamed ``{"questions": [ {...}, {...} ]}`` reply.
+
+    ``feed`` receives the text chunks as they arrive and returns every question
+    object that has been completely received so far. Code fences and any text
+    around the JSON are ignored. An object still open when ``close`` is called
+    (truncated reply) is discarded and counted in ``truncated_objects``.
+    """
+
+    def __init__(self):
+        self.in_array = False
+        self.finished = False
+        self.in_string = False
+        self.escape = False
+        self.item_depth = 0
+        self.item: List[str] = []
+        self.parsed_objects = 0
+        self.invalid_objects = 0
+        self.truncated_objects = 0
+
+    def feed(self, text: str) -> List[Dict]:
+        completed: List[Dict] = []
+        for char in text:
+            if self.finished:
+                break
+            if self.item_depth > 0:
+                self.item.append(char)
+                if self._consume_string_char(char):
+                    continue
+                if char == "{":
+                    self.item_depth += 1
+                elif char == "}":
+                    self.item_depth -= 1
+                    if self.item_depth == 0:
+                        question = self._parse_item()
+                        if question is not None:
+                            completed.append(question)
+                continue
+
+            if self._consume_string_char(char):
+                continue
+            if char == "[" and not self.in_array:
+                self.in_array = True
+            elif char == "{" and self.in_array:
+                self.item_depth = 1
+                self.item = [char]
+            elif char == "]" and self.in_array:
+                self.finished = True
+        return completed
+
+    def close(self):
+        if self.item_depth > 0:
+            self.truncated_objects += 1
+            logger.warning(f"Discarding truncated question object ({len(self.item)} chars)")
+        self.item = []
+        self.item_depth = 0
+
+    def _consume_string_char(self, char: str) -> bool:
+        """Track JSON strings so braces inside question text are not counted."""
+        if self.in_string:
+            if self.escape:
+                self.escape = False
+            elif char == "\\":
+                self.escape = True
+            elif char == '"':
+                self.in_string = False
+            return True
+        if char == '"':
+            self.in_string = True
+            return True
+        return False
+
+    def _parse_item(self):
+        raw = "".join(self.item)
+        self.item = []
+        try:
+            question = json.loads(raw)
+        except json.JSONDecodeError as e:
+            self.invalid_objects += 1
+            logger.error(f"Skipping malformed streamed question: {e}")
+            return None
+        if not isinstance(question, dict):
+            self.invalid_objects += 1
+            return None
+        self.parsed_objects += 1
+        return question
@@ -0,0 +1,64 @@
+from typing import Dict, List, Optional
+
+from domain.entities.question import Question, QuestionView
+from domain.repositories.question_repository import QuestionRepository
+from domain.repositories.skill_repository import SkillRepository
+from infrastructure.repositories.question_bank_cache import QuestionBank, QuestionBankCache, question_bank_cache
+
+
+class CachedQuestionRepository(QuestionRepository):
+    """
+    QuestionRepository whose skill-scoped lookups are served from the worker's
+    question bank cache. A bank still being generated may be cached incomplete:
+    a number it does not contain reloads the bank from Mongo once. Every lookup
+    reads the skill's bank version (a projected read by _id) so a bank discarded
+    and regenerated by another worker is never served from this cache.
+    """
+
+    def __init__(self, bank_cache: QuestionBankCache = question_bank_cache,
+                 skill_repository: Optional[SkillRepository] = None):
+        super().__init__()
+        self.bank_cache = bank_cache
+        # Sin caché de skills: la versión tiene que ser la de Mongo
+        self.skill_repository = skill_repository or SkillRepository()
+
+    async def load_bank(self, skill_id: str, version: Optional[int]) -> QuestionBank:
+        # La versión se lee antes que las preguntas: un banco descartado después queda con la versión vieja
+        bank = QuestionBank(await super().find_questions_by_skillid(skill_id), version)
+        if bank.by_number:
+            self.bank_cache.put(skill_id, bank)
+        return bank
+
+    async def get_bank(self, skill_id: str, required: List[int]) -> QuestionBank:
+        version = await self.skill_repository.find_question_bank_version(skill_id)
+        bank = self.bank_cache.get(skill_id, version)
+        if bank is None or any(bank.get(number) is None for number in required):
+            bank = await self.load_bank(skill_id, version)
+        return bank
+
+    async def find_question_by_skillid_and_number(self, skill_id: str, number: int) -> Optional[Question]:
+        return (await self.get_bank(skill_id, [number])).get(number)
+
+    async def find_question_view_by_skillid_and_number(self, skill_id: str, number: int) -> Optional[QuestionView]:
+        question = await self.find_question_by_skillid_and_number(skill_id, number)
+        return QuestionView.model_validate(question.model_dump(include=set(QuestionView.model_fields))) if question else None
+
+    async def find_questions_by_skillid_and_numbers(self, skill_id: str, numbers: List[int]) -> List[Question]:
+        bank = await self.get_bank(skill_id, numbers)
+        return [bank.get(number) for number in numbers if bank.get(number) is not None]
+
+    async def create_question(self, question_data: Dict) -> Question:
+        question = await super().create_question(question_data)
+        self.bank_cache.invalidate(question_data.get("skillid"))
+        return question
+
+    async def create_questions_bulk(self, questions_data: List[Dict]) -> List[Question]:
+        questions = await super().create_questions_bulk(questions_data)
+        for skill_id in {question.skillid for question in questions}:
+            self.bank_cache.invalidate(skill_id)
+        return questions
+
+    async def delete_many_by_skillid(self, skill_id: str) -> int:
+        deleted = await super().delete_many_by_skillid(skill_id)
+        self.bank_cache.invalidate(skill_id)
+        return deleted
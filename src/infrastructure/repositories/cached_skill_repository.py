@@ -0,0 +1,47 @@
+from typing import Optional
+
+from domain.entities.skill import Skill
+from domain.repositories.skill_repository import SkillRepository
+from infrastructure.repositories.skill_cache import SkillCache, skill_cache
+
+
+class CachedSkillRepository(SkillRepository):
+    """Read-through cache for ``find_by_id``; every write through this repository invalidates the skill."""
+
+    def __init__(self, cache: SkillCache = skill_cache):
+        super().__init__()
+        self.cache = cache
+
+    async def find_by_id(self, entity_id: str) -> Optional[Skill]:
+        if not self.cache.enabled:
+            return await super().find_by_id(entity_id)
+        skill_id = str(entity_id)
+        skill = self.cache.get(skill_id)
+        if skill is None:
+            skill = await super().find_by_id(entity_id)
+            if skill:
+                self.cache.put(skill_id, skill)
+        return skill
+
+    async def update(self, entity: Skill) -> Skill:
+        skill = await super().update(entity)
+        self.cache.invalidate(str(entity.id))
+        return skill
+
+    async def delete_by_id(self, entity_id: str) -> bool:
+        deleted = await super().delete_by_id(entity_id)
+        self.cache.invalidate(str(entity_id))
+        return deleted
+
+    async def delete(self, entity: Skill) -> bool:
+        deleted = await super().delete(entity)
+        self.cache.invalidate(str(entity.id))
+        return deleted
+
+    async def update_question_bank_status(self, skill_id: str, status: str) -> None:
+        await super().update_question_bank_status(skill_id, status)
+        self.cache.invalidate(str(skill_id))
+
+    async def bump_question_bank_version(self, skill_id: str) -> None:
+        await super().bump_question_bank_version(skill_id)
+        self.cache.invalidate(str(skill_id))
@@ -0,0 +1,68 @@
+from typing import Any, Dict, List, Optional
+
+from cachetools import LRUCache
+
+from domain.entities.question import Question
+from infrastructure.config.app_config import config
+
+
+class QuestionBank:
+    """A skill's generated questions indexed by question number. Treated as read-only."""
+
+    def __init__(self, questions: List[Question], version: Optional[int] = None):
+        self.by_number: Dict[int, Question] = {question.question_number: question for question in questions}
+        self.version = version
+
+    def get(self, number: int) -> Optional[Question]:
+        return self.by_number.get(number)
+
+
+class QuestionBankCache:
+    """
+    Per-worker LRU of whole question banks keyed by skill id. Banks never change
+    once generated, so entries have no TTL: they are dropped explicitly when a
+    skill's questions are deleted or written again, and evicted by size. A bank
+    discarded by another worker is caught by its version (``Skill.question_bank_version``).
+    """
+
+    def __init__(self, max_banks: int):
+        self.banks: LRUCache = LRUCache(maxsize=max_banks)
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.stale = 0
+
+    def get(self, skill_id: str, version: Optional[int]) -> Optional[QuestionBank]:
+        """Cached bank only if it was loaded at the skill's current bank version."""
+        bank = self.banks.get(skill_id)
+        if bank is not None and bank.version != version:
+            self.banks.pop(skill_id, None)
+            self.stale += 1
+            bank = None
+        if bank is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return bank
+
+    def put(self, skill_id: str, bank: QuestionBank):
+        self.banks[skill_id] = bank
+
+    def invalidate(self, skill_id: str):
+        if self.banks.pop(skill_id, None) is not None:
+            self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "banks": len(self.banks),
+            "max_banks": self.banks.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "stale": self.stale,
+            "hit_rate": self.hits / lookups if lookups else None,
+        }
+
+
+question_bank_cache = QuestionBankCache(max_banks=config.question_bank_cache_max_banks)
@@ -0,0 +1,57 @@
+from typing import Any, Dict, Optional
+
+from cachetools import TTLCache
+
+from domain.entities.skill import Skill
+from infrastructure.config.app_config import config
+
+
+class SkillCache:
+    """
+    Per-worker bounded TTL cache of Skill documents keyed by id. Writes made in
+    this worker invalidate their entry; the TTL bounds how long another worker's
+    edit can stay unseen.
+    """
+
+    def __init__(self, enabled: bool, max_entries: int, ttl_seconds: float):
+        self.enabled = enabled
+        self.skills: TTLCache = TTLCache(maxsize=max_entries, ttl=ttl_seconds)
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, skill_id: str) -> Optional[Skill]:
+        skill = self.skills.get(skill_id)
+        if skill is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        # Copia: quien la reciba puede modificarla antes de guardarla
+        return skill.model_copy(deep=True)
+
+    def put(self, skill_id: str, skill: Skill):
+        self.skills[skill_id] = skill.model_copy(deep=True)
+
+    def invalidate(self, skill_id: str):
+        if self.skills.pop(skill_id, None) is not None:
+            self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self.skills),
+            "max_entries": self.skills.maxsize,
+            "ttl_seconds": self.skills.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_rate": self.hits / lookups if lookups else None,
+        }
+
+
+skill_cache = SkillCache(
+    enabled=config.skill_cache_enabled,
+    max_entries=config.skill_cache_max_entries,
+    ttl_seconds=config.skill_cache_ttl_seconds
+)
@@ -2,6 +2,10 @@ from fastapi import FastAPI
 from contextlib import asynccontextmanager
 
 from infrastructure.database.mongo_connection import mongo_connection
+from infrastructure.external_services.gemini_service import gemini_service
+from infrastructure.concurrency.background_worker_pool import feedback_evaluation_worker_pool, question_bank_worker_pool
+from infrastructure.repositories.question_bank_cache import question_bank_cache
+from infrastructure.repositories.skill_cache import skill_cache
 
 from domain.entities.skill import Skill
 from presentation.api.skill_controller import skill_router
@@ -14,8 +18,14 @@ load_dotenv()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await mongo_connection.connect()
+    await gemini_service.connect()
+    await question_bank_worker_pool.start()
+    await feedback_evaluation_worker_pool.start()
     yield
     
+    await feedback_evaluation_worker_pool.stop()
+    await question_bank_worker_pool.stop()
+    await gemini_service.disconnect()
     await mongo_connection.disconnect()
 app = FastAPI(
     title="Skill Assentment Service",
@@ -42,6 +52,19 @@ async def health_check():
         "message": "Servicio funcionando correctamente"
     }
 
+@app.get("/health/gemini")
+async def gemini_health():
+    """Estado de la capa de resiliencia de Gemini (circuit breaker, concurrencia, reintentos)"""
+    return gemini_service.stats()
+
+@app.get("/health/caches")
+async def caches_health():
+    """Tamaño y tasa de aciertos de las cachés en memoria de este worker"""
+    return {
+        "question_banks": question_bank_cache.stats(),
+        "skills": skill_cache.stats(),
+    }
+
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,17 +1,20 @@
 from fastapi import APIRouter, HTTPException,status
+from typing import Literal, Optional
+from domain.repositories.cursor_pagination import InvalidCursorError
 
 
-from domain.repositories.question_repository import QuestionRepository
+from infrastructure.repositories.cached_question_repository import CachedQuestionRepository
 from domain.repositories.user_session_repository import UserSessionRepository
 from domain.repositories.assement_feedback_repository import AssementFeedBackRepository
-from domain.repositories.skill_repository import SkillRepository
-from infrastructure.external_services.gemini_service import GeminiService
+from infrastructure.repositories.cached_skill_repository import CachedSkillRepository
+from domain.repositories.generation_lease_repository import GenerationLeaseRepository
+from infrastructure.external_services.gemini_service import gemini_service
 from application.use_cases.create_assement_use_case import CreateAssessmentUseCase
 from application.use_cases.answer_question_use_case import AnswerQuestionUseCase
 from application.dto.answer_question_dto import AnswerQuestionDTO,AnswerQuestionBaseDto
-from domain.repositories.skill_repository import SkillRepository
 from ..schemas.start_assement_model import StartAssessmentModel
 from infrastructure.messaging.rabbitmq_producer import rabbitmq_producer
+from infrastructure.database.mongo_connection import history_read_preference
 
 from ..schemas.answer_question_model import AnswerQuestionModel
 
@@ -22,15 +25,26 @@ from application.use_cases.get_question_use_case import GetQuestionUseCase
 from application.use_cases.evaluate_skill_assement_use_case import EvaluateSkillAssessment
 from application.use_cases.get_feedbacks_by_user import GetFeedbacksByUser
 from application.use_cases.get_feedback_by_id_use_case import GetFeedBackByIdUseCase
+from application.use_cases.schedule_feedback_evaluation_use_case import ScheduleFeedbackEvaluationUseCase
+from infrastructure.concurrency.background_worker_pool import feedback_evaluation_worker_pool
 assement_router = APIRouter(prefix="/assement",tags=["questions"])
+
+def build_evaluate_skill_assessment() -> EvaluateSkillAssessment:
+    return EvaluateSkillAssessment(
+        user_session_repository=UserSessionRepository(),
+        question_repository=CachedQuestionRepository(),
+        feedback_repository=AssementFeedBackRepository(),
+        rabbitmq_producer=rabbitmq_producer
+    )
+
 @assement_router.post("/{skill_id}", status_code=status.HTTP_201_CREATED)
 async def create_question(skill_id: str,request: StartAssessmentModel):
     try:
-        question_repository = QuestionRepository()
-        skill_repository = SkillRepository()
-        gemini_service = GeminiService()
+        question_repository = CachedQuestionRepository()
+        skill_repository = CachedSkillRepository()
         user_session_repository = UserSessionRepository()
-        create_assessment_use_case = CreateAssessmentUseCase(question_repository, gemini_service,skill_repository,user_session_repository)
+        generation_lease_repository = GenerationLeaseRepository()
+        create_assessment_use_case = CreateAssessmentUseCase(question_repository, gemini_service,skill_repository,user_session_repository,generation_lease_repository)
 
         generated_assement = await create_assessment_use_case.execute(skill_id,request.id_user)
 
@@ -58,7 +72,7 @@ async def get_session(session_id: str):
 async def get_questions_by_id(id:int,id_user: str,id_session: str):
     try:
         
-       get_all_skills_use_case = GetQuestionUseCase(QuestionRepository(), UserSessionRepository())
+       get_all_skills_use_case = GetQuestionUseCase(CachedQuestionRepository(), UserSessionRepository())
 
 
        questions = await get_all_skills_use_case.execute(AnswerQuestionBaseDto(
@@ -78,7 +92,12 @@ async def get_questions_by_id(id:int,id_user: str,id_session: str):
 @assement_router.post("/questions/{id_question}", status_code=status.HTTP_201_CREATED)
 async def answer_question(id_question: int, request: AnswerQuestionModel):
     try:
-        answer_question_use_case = AnswerQuestionUseCase(QuestionRepository(), UserSessionRepository())
+        schedule_feedback_evaluation = ScheduleFeedbackEvaluationUseCase(
+            build_evaluate_skill_assessment(), feedback_evaluation_worker_pool
+        )
+        answer_question_use_case = AnswerQuestionUseCase(
+            CachedQuestionRepository(), UserSessionRepository(), schedule_feedback_evaluation
+        )
         result = await answer_question_use_case.execute(AnswerQuestionDTO(
             id_question=id_question,
             id_session=request.id_session,
@@ -94,27 +113,28 @@ async def answer_question(id_question: int, request: AnswerQuestionModel):
 @assement_router.put("/questions/{id_question}", status_code=status.HTTP_200_OK)
 async def update_answer(id_question: int, request: AnswerQuestionModel):
     try:
-        answer_question_use_case = UpdateAnswerUseCase(QuestionRepository(), UserSessionRepository())
+        answer_question_use_case = UpdateAnswerUseCase(CachedQuestionRepository(), UserSessionRepository())
         result = await answer_question_use_case.execute(AnswerQuestionDTO(
             id_question=id_question,
             id_session=request.id_session,
             id_user=request.id_user,
             answer=request.answer
         ))
+        if not result["matched"]:
+            status_codes = {"not_found": 404, "forbidden": 403, "conflict": 409}
+            raise HTTPException(status_code=status_codes[result["status"]], detail=result["message"])
 
         return result
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 @assement_router.get("/feedback/{session_id}")
 async def get_feedback(session_id: str):
     try:
-        generate_feedback_use_case = EvaluateSkillAssessment(
-            user_session_repository=UserSessionRepository(),
-            question_repository=QuestionRepository(),
-            feedback_repository=AssementFeedBackRepository(),
-            rabbitmq_producer=rabbitmq_producer
-        )
+        # Lectura del feedback ya calculado en segundo plano, o evaluación al momento si aún no está
+        generate_feedback_use_case = build_evaluate_skill_assessment()
         
         session = await generate_feedback_use_case.execute(session_id)
 
@@ -126,29 +146,39 @@ async def get_feedback(session_id: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 @assement_router.get("/feedbacks/{user_id}")
-async def get_feedbacks_by_user(user_id: str, skip: int = 0, limit: int = 10):
+async def get_feedbacks_by_user(user_id: str, skip: int = 0, limit: int = 10,
+                                pagination: Literal["offset", "cursor"] = "offset",
+                                cursor: Optional[str] = None, include_total: bool = False):
     try:
+        # Lecturas de historial: pueden servirse desde secundarios
+        read_preference = history_read_preference()
         get_feedbacks_use_case = GetFeedbacksByUser(
-            user_session_repository=UserSessionRepository(),
-            feedback_repository=AssementFeedBackRepository(),
-            skill_repository=SkillRepository()
+            user_session_repository=UserSessionRepository(read_preference),
+            feedback_repository=AssementFeedBackRepository(read_preference),
+            skill_repository=CachedSkillRepository()
         )
+        if pagination == "cursor" or cursor:
+            return await get_feedbacks_use_case.execute_cursor(user_id, cursor, limit, include_total)
+
         feedbacks = await get_feedbacks_use_case.execute(user_id, skip, limit)
 
         return feedbacks
 
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
                           
 @assement_router.get("/feedback/assement/{feedback_id}")
-async def get_feedback_by_id(feedback_id: str):
+async def get_feedback_by_id(feedback_id: str, include_analysis: bool = False):
     try:
-        feedback_repository = AssementFeedBackRepository()
-        skill_repository = SkillRepository()
-        user_session_repository = UserSessionRepository()
+        read_preference = history_read_preference()
+        feedback_repository = AssementFeedBackRepository(read_preference)
+        skill_repository = CachedSkillRepository()
+        user_session_repository = UserSessionRepository(read_preference)
         get_feedback_by_id_use_case = GetFeedBackByIdUseCase(feedback_repository, skill_repository, user_session_repository)
 
-        feedback = await get_feedback_by_id_use_case.execute(feedback_id)
+        feedback = await get_feedback_by_id_use_case.execute(feedback_id, include_analysis)
         
         
         
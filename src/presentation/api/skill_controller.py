@@ -1,5 +1,5 @@
 from fastapi import APIRouter,Depends, HTTPException,status
-from typing import List
+from typing import List, Literal, Optional, Union
 from domain.entities.skill import Skill
 from application.use_cases.create_skill_use_case import CreateSkillUseCase
 from application.use_cases.get_all_skills_use_case import GetAllSkillsUseCase
@@ -9,20 +9,35 @@ from application.use_cases.update_skill_use_case import UpdateSkillUseCase
 from ..schemas.create_skill_model import CreateSkillModel
 from ..schemas.update_skill_model import UpdateSkillModel
 from domain.repositories.skill_repository import SkillRepository
-from ..schemas.get_all_skill_response_model import GetAllSkillResponseModel
-from domain.repositories.question_repository import QuestionRepository
+from infrastructure.repositories.cached_skill_repository import CachedSkillRepository
+from ..schemas.get_all_skill_response_model import GetAllSkillResponseModel, GetSkillsPageResponseModel
+from domain.repositories.cursor_pagination import InvalidCursorError
+from infrastructure.repositories.cached_question_repository import CachedQuestionRepository
+from domain.repositories.generation_lease_repository import GenerationLeaseRepository
+from domain.repositories.user_session_repository import UserSessionRepository
+from application.use_cases.generate_question_bank_use_case import GenerateQuestionBankUseCase
+from application.use_cases.schedule_question_bank_generation_use_case import ScheduleQuestionBankGenerationUseCase
+from application.use_cases.invalidate_quiz_cache_use_case import InvalidateQuizCacheUseCase
+from infrastructure.external_services.gemini_service import gemini_service
+from infrastructure.concurrency.background_worker_pool import question_bank_worker_pool
 
 import json
 skill_router = APIRouter(prefix="/skills",tags=["Skills"])
 
+def build_schedule_question_bank_use_case(skill_repository: SkillRepository) -> ScheduleQuestionBankGenerationUseCase:
+    generate_question_bank_use_case = GenerateQuestionBankUseCase(
+        CachedQuestionRepository(), gemini_service, skill_repository, GenerationLeaseRepository(), UserSessionRepository()
+    )
+    return ScheduleQuestionBankGenerationUseCase(generate_question_bank_use_case, skill_repository, question_bank_worker_pool)
+
 @skill_router.post("/",response_model=Skill,status_code=status.HTTP_201_CREATED)
 async def create_skill(skill: CreateSkillModel):
 
     
     
     try:
-        skill_repository = SkillRepository()
-        create_skill_use_case = CreateSkillUseCase(skill_repository)
+        skill_repository = CachedSkillRepository()
+        create_skill_use_case = CreateSkillUseCase(skill_repository, build_schedule_question_bank_use_case(skill_repository))
         
         created_skill = await create_skill_use_case.execute(skill=Skill(**skill.model_dump()))
 
@@ -32,11 +47,38 @@ async def create_skill(skill: CreateSkillModel):
         
         raise HTTPException(status_code=500, detail=str(e))
 
-@skill_router.get("/skills/", response_model=GetAllSkillResponseModel)
-async def get_all_skills(skip: int = 0, limit: int = 10):
+@skill_router.post("/question-banks/backfill", status_code=status.HTTP_202_ACCEPTED)
+async def backfill_question_banks(limit: int = 1000):
+    try:
+        skill_repository = CachedSkillRepository()
+        schedule_question_bank_use_case = build_schedule_question_bank_use_case(skill_repository)
+
+        result = await schedule_question_bank_use_case.execute(limit=limit)
+
+        return {
+            **result,
+            "worker_pool": question_bank_worker_pool.stats()
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@skill_router.delete("/quiz-cache", status_code=status.HTTP_200_OK)
+async def invalidate_quiz_cache(skill_name: Optional[str] = None):
+    try:
+        invalidate_quiz_cache_use_case = InvalidateQuizCacheUseCase(gemini_service)
+
+        return await invalidate_quiz_cache_use_case.execute(skill_name=skill_name)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@skill_router.get("/skills/", response_model=Union[GetAllSkillResponseModel, GetSkillsPageResponseModel])
+async def get_all_skills(skip: int = 0, limit: int = 10, pagination: Literal["offset", "cursor"] = "offset",
+                         cursor: Optional[str] = None, include_total: bool = False):
     try:
-        skill_repository = SkillRepository()
+        skill_repository = CachedSkillRepository()
         get_all_skills_use_case = GetAllSkillsUseCase(skill_repository)
+        if pagination == "cursor" or cursor:
+            return await get_all_skills_use_case.execute_cursor(cursor=cursor, limit=limit, include_total=include_total)
         
         result = await get_all_skills_use_case.execute(skip=skip, limit=limit)
         
@@ -49,12 +91,14 @@ async def get_all_skills(skip: int = 0, limit: int = 10):
             "limit": result.limit,
             "skills": result.skills
         }
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 @skill_router.get("/{skill_id}", response_model=Skill)
 async def get_skill_by_id(skill_id: str):
     try:
-        skill_repository = SkillRepository()
+        skill_repository = CachedSkillRepository()
         get_skill_use_case = GetSkillUseCase(skill_repository)
         skill = await get_skill_use_case.execute(skill_id=skill_id)
         
@@ -68,8 +112,8 @@ async def get_skill_by_id(skill_id: str):
 @skill_router.delete("/{skill_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_skill(skill_id: str):
     try:
-        skill_repository = SkillRepository()
-        question_repository = QuestionRepository()
+        skill_repository = CachedSkillRepository()
+        question_repository = CachedQuestionRepository()
         delete_skill_use_case = DeleteSkillUseCase(skill_repository, question_repository)
         
         await delete_skill_use_case.execute(skill_id=skill_id)
@@ -82,7 +126,7 @@ async def delete_skill(skill_id: str):
 @skill_router.patch("/", response_model=Skill)
 async def update_skill( skill: Skill):
     try:
-        skill_repository = SkillRepository()
+        skill_repository = CachedSkillRepository()
         update_skill_use_case = UpdateSkillUseCase(skill_repository)
         
 
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List
+from typing import List, Optional
 from domain.entities.skill import Skill
 class GetAllSkillResponseModel(BaseModel):
     total_skills: int
@@ -10,4 +10,10 @@ class GetAllSkillResponseModel(BaseModel):
     limit: int
     skills: list[Skill]
 
-    
\ No newline at end of file
+
+class GetSkillsPageResponseModel(BaseModel):
+    skills: list[Skill]
+    limit: int
+    has_next_page: bool
+    next_cursor: Optional[str] = None
+    estimated_total_skills: Optional[int] = None